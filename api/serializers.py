@@ -2,6 +2,7 @@ from rest_framework import serializers
 from users.models import User
 from jobs.models import Job
 from applications.models import Application
+from applications.upgrades import is_pending
 import re
 from django.core.exceptions import ValidationError
 from django.core.validators import validate_email
@@ -21,21 +22,28 @@ class UserSerializer(serializers.ModelSerializer):
 class JobSerializer(serializers.ModelSerializer):
     salary_display = serializers.CharField(source="get_salary_display", read_only=True)
     posted_label = serializers.CharField(source="get_posted_label", read_only=True)
+    # "rescoring" while applicants are rescored after a requirements change
+    scoring_status = serializers.CharField(read_only=True)
 
     class Meta:
         model = Job
         fields = [
             "id", "title", "slug", "description",
-            "required_skills", "jd_keywords",
+            "required_skills", "jd_keywords", "keyword_scorer",
             "min_experience", "max_experience",
+            "skill_weight", "experience_weight", "keyword_weight", "similarity_weight",
             "salary_type", "min_salary", "max_salary",
-            "salary_display", "posted_label",
+            "salary_display", "posted_label", "scoring_status",
             "location", "work_mode", "employment_type",
             "required_education", "vacancies", "deadline",
             "is_deleted",
             "created_by", "created_at",
         ]
-        read_only_fields = ["id", "slug", "created_by", "created_at", "salary_display", "posted_label"]
+        read_only_fields = [
+            "id", "slug", "created_by", "created_at", "salary_display", "posted_label", "scoring_status",
+            # changed through the scoring weights endpoint
+            "skill_weight", "experience_weight", "keyword_weight", "similarity_weight",
+        ]
 
 
 # ----------------------------------------
@@ -43,11 +51,110 @@ class JobSerializer(serializers.ModelSerializer):
 # ----------------------------------------
 class ApplicationSerializer(serializers.ModelSerializer):
     job = JobSerializer(read_only=True)
+    # true while the row waits for an upgrade to the current parser /
+    # taxonomy version: its parsed fields and scores are provisional
+    pending_upgrade = serializers.SerializerMethodField()
 
     class Meta:
         model = Application
         fields = "__all__"
 
+    def get_pending_upgrade(self, obj):
+        return is_pending(obj, self.context.get("pending_versions"))
+
+
+# ----------------------------------------
+# RANKED CANDIDATE SERIALIZER
+# ----------------------------------------
+class RankedApplicationSerializer(serializers.ModelSerializer):
+    # share of the job's other applicants scoring lower (0.0 - 1.0)
+    percentile = serializers.FloatField(read_only=True)
+
+    class Meta:
+        model = Application
+        fields = [
+            "id", "full_name", "email", "status",
+            "match_score", "percentile",
+            "skill_score", "experience_score", "keyword_score", "similarity_score",
+            "matched_skills", "missing_skills", "fit_category",
+            "applied_at",
+        ]
+
+
+# ----------------------------------------
+# SCORING WEIGHTS (WHAT-IF)
+# ----------------------------------------
+class ScoringWeightsSerializer(serializers.Serializer):
+    # percent of the match score per component
+    skill_weight = serializers.IntegerField(min_value=0, max_value=100)
+    experience_weight = serializers.IntegerField(min_value=0, max_value=100)
+    keyword_weight = serializers.IntegerField(min_value=0, max_value=100)
+    similarity_weight = serializers.IntegerField(min_value=0, max_value=100, required=False, default=0)
+
+    def validate(self, attrs):
+        if sum(attrs[name] for name in Job.WEIGHT_FIELDS) != 100:
+            raise serializers.ValidationError("Scoring weights must add up to 100.")
+        return attrs
+
+
+class WhatIfCandidateSerializer(serializers.Serializer):
+    application_id = serializers.IntegerField(source="application.id")
+    full_name = serializers.CharField(source="application.full_name")
+    email = serializers.EmailField(source="application.email")
+    status = serializers.CharField(source="application.status")
+    match_score = serializers.FloatField()
+    rank = serializers.IntegerField()
+    current_score = serializers.FloatField()
+    current_rank = serializers.IntegerField()
+    fit_category = serializers.CharField()
+
+
+# ----------------------------------------
+# MATCHING CANDIDATE SERIALIZER
+# ----------------------------------------
+class MatchingCandidateSerializer(serializers.Serializer):
+    # an application to another job, scored against the requested job
+    application_id = serializers.IntegerField(source="application.id")
+    full_name = serializers.CharField(source="application.full_name")
+    email = serializers.EmailField(source="application.email")
+    applied_job_id = serializers.IntegerField(source="application.job_id")
+    applied_job_title = serializers.CharField(source="application.job.title")
+    match_score = serializers.FloatField()
+    skill_score = serializers.FloatField()
+    experience_score = serializers.FloatField()
+    keyword_score = serializers.FloatField()
+    similarity_score = serializers.FloatField()
+    matched_skills = serializers.ListField(child=serializers.CharField())
+    missing_skills = serializers.ListField(child=serializers.CharField())
+    fit_category = serializers.CharField()
+
+
+# ----------------------------------------
+# JOB RECOMMENDATION SERIALIZERS
+# ----------------------------------------
+class ResumeUploadSerializer(serializers.Serializer):
+    resume = serializers.FileField(required=True)
+    limit = serializers.IntegerField(required=False, min_value=1, max_value=50, default=10)
+
+    def validate_resume(self, value):
+        if not value.name.lower().endswith(".pdf"):
+            raise serializers.ValidationError("Only PDF resumes are supported.")
+        if value.size > 5 * 1024 * 1024:
+            raise serializers.ValidationError("Resume must be smaller than 5 MB.")
+        return value
+
+
+class RecommendedJobSerializer(serializers.Serializer):
+    job = JobSerializer(read_only=True)
+    match_score = serializers.FloatField(source="final_score")
+    skill_score = serializers.FloatField()
+    experience_score = serializers.FloatField()
+    keyword_score = serializers.FloatField()
+    similarity_score = serializers.FloatField()
+    matched_skills = serializers.ListField(child=serializers.CharField())
+    missing_skills = serializers.ListField(child=serializers.CharField())
+    fit_category = serializers.CharField()
+
 
 # ----------------------------------------
 # PUBLIC APPLICATION SERIALIZER
@@ -101,4 +208,18 @@ class PublicApplicationSerializer(serializers.ModelSerializer):
                 "Enter a valid phone number."
             )
 
-        return cleaned
\ No newline at end of file
+        return cleaned
+
+
+# ----------------------------------------
+# MULTI-JOB APPLICATION SERIALIZER
+# ----------------------------------------
+class MultiApplicationSerializer(PublicApplicationSerializer):
+    jobs = serializers.ListField(child=serializers.SlugField(), min_length=1, max_length=10)
+
+    class Meta(PublicApplicationSerializer.Meta):
+        fields = PublicApplicationSerializer.Meta.fields + ["jobs"]
+
+    def validate_jobs(self, value):
+        # order kept, repeats dropped
+        return list(dict.fromkeys(value))
@@ -124,3 +124,17 @@ class CriticalSecurityRBACTests(TestCase):
         
         self.owned_application.refresh_from_db()
         self.assertEqual(self.owned_application.status, "screening")
+
+    def test_job_update_bumps_content_version(self):
+        self._auth_as(self.recruiter)
+
+        response = self.client.patch(
+            reverse("api-recruiter-job-update", kwargs={"id": self.recruiter_job.id}),
+            {"jd_keywords": ["graphql"]},
+            format="json",
+        )
+        self.recruiter_job.refresh_from_db()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.recruiter_job.content_version, 2)
+        self.assertEqual(self.recruiter_job.jd_keywords, ["graphql"])
@@ -9,9 +9,11 @@ from .views import (
     # Admin Jobs
     AdminJobListAPI, AdminJobDetailAPI,
     # Apply
-    ApplyJobAPI,
+    ApplyJobAPI, MultiApplyJobAPI, RecommendJobsAPI,
     # Recruiter Applications
     RecruiterApplicationListAPI, RecruiterApplicationDetailAPI, RecruiterUpdateStatusAPI,
+    RecruiterRankedCandidatesAPI, RecruiterMatchingCandidatesAPI,
+    RecruiterWhatIfWeightsAPI, RecruiterScoringWeightsAPI,
     # Admin Applications
     AdminApplicationListAPI, AdminApplicationDetailAPI,
 )
@@ -29,11 +31,17 @@ urlpatterns = [
     path("recruiter/jobs/create/", RecruiterJobCreateAPI.as_view(), name="api-recruiter-job-create"),
     path("recruiter/jobs/<int:id>/update/", RecruiterJobUpdateAPI.as_view(), name="api-recruiter-job-update"),
     path("recruiter/jobs/<int:id>/delete/", RecruiterJobDeleteAPI.as_view(), name="api-recruiter-job-delete"),
+    path("recruiter/jobs/<int:id>/ranked/", RecruiterRankedCandidatesAPI.as_view(), name="api-recruiter-job-ranked"),
+    path("recruiter/jobs/<int:id>/matches/", RecruiterMatchingCandidatesAPI.as_view(), name="api-recruiter-job-matches"),
+    path("recruiter/jobs/<int:id>/what-if/", RecruiterWhatIfWeightsAPI.as_view(), name="api-recruiter-job-what-if"),
+    path("recruiter/jobs/<int:id>/weights/", RecruiterScoringWeightsAPI.as_view(), name="api-recruiter-job-weights"),
 
     path("admin/jobs/", AdminJobListAPI.as_view(), name="api-admin-jobs"),
     path("admin/jobs/<int:id>/", AdminJobDetailAPI.as_view(), name="api-admin-job-detail"),
 
     path("apply/<slug:slug>/", ApplyJobAPI.as_view(), name="api-apply"),
+    path("apply-multiple/", MultiApplyJobAPI.as_view(), name="api-apply-multiple"),
+    path("recommend-jobs/", RecommendJobsAPI.as_view(), name="api-recommend-jobs"),
 
     path("recruiter/applications/", RecruiterApplicationListAPI.as_view(), name="api-recruiter-applications"),
     path("recruiter/applications/<int:id>/", RecruiterApplicationDetailAPI.as_view(), name="api-recruiter-application-detail"),
@@ -12,22 +12,41 @@ from rest_framework.generics import (
 )
 from rest_framework.authtoken.models import Token
 from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.utils.urls import replace_query_param
 from django.contrib.auth import authenticate
 
 
 from users.models import User
 from jobs.models import Job
-from applications.models import Application
+from applications.models import Application, ApplicationText
 
 from .serializers import (
     UserSerializer, JobSerializer,
-    ApplicationSerializer, PublicApplicationSerializer
+    ApplicationSerializer, PublicApplicationSerializer,
+    RankedApplicationSerializer, MatchingCandidateSerializer,
+    ResumeUploadSerializer, RecommendedJobSerializer,
+    MultiApplicationSerializer, ScoringWeightsSerializer, WhatIfCandidateSerializer,
 )
 
 from .permissions import IsRecruiter, IsAdmin
-from applications.parsing import parse_resume
+from applications.parsing import PDFExtractionTimeout, parse_resume
 from applications.utils import compute_match_score, generate_summary, evaluate_candidate, fit_category
 from applications.supabase_client import upload_resume
+from applications.ingest import ResumeBuffer
+from applications.upgrades import (
+    count_pending,
+    pending_filter,
+    pending_versions,
+    queue_stale_applications,
+    upgrade_applications,
+)
+from applications.ranking import InvalidCursor, parse_limit, ranked_applications
+from applications.skill_index import find_matching_candidates
+from applications.weights import rerank
+from applications.recommendations import recommend_jobs
+from applications.multi_apply import already_applied, create_applications
+from applications.views.recruiter import application_queryset_for
+from jobs.views.recruiter import job_queryset_for
 
 
 logger = logging.getLogger(__name__)
@@ -185,6 +204,15 @@ class RecruiterApplicationListAPI(ListAPIView):
             job__is_deleted=False
         ).order_by("-applied_at")
 
+    def get_serializer_context(self):
+        return {**super().get_serializer_context(), "pending_versions": pending_versions()}
+
+    def list(self, request, *args, **kwargs):
+        # unpaginated, so stale rows are only queued here and come back
+        # with pending_upgrade set; the detail endpoint upgrades on read
+        queue_stale_applications(self.get_queryset())
+        return super().list(request, *args, **kwargs)
+
 
 class RecruiterApplicationDetailAPI(RetrieveAPIView):
     serializer_class = ApplicationSerializer
@@ -196,6 +224,114 @@ class RecruiterApplicationDetailAPI(RetrieveAPIView):
             job__created_by=self.request.user
         )
 
+    def get_serializer_context(self):
+        return {**super().get_serializer_context(), "pending_versions": pending_versions()}
+
+    def get_object(self):
+        application = super().get_object()
+        upgrade_applications([application])
+        return application
+
+
+class RecruiterRankedCandidatesAPI(APIView):
+    """Top candidates of one job by match score: ?limit=20&cursor=..."""
+    permission_classes = [IsRecruiter]
+
+    def get(self, request, id):
+        job = get_object_or_404(Job, id=id, created_by=request.user, is_deleted=False)
+        queryset = Application.objects.filter(job__created_by=request.user, job__is_deleted=False)
+
+        try:
+            rows, cursor = ranked_applications(
+                queryset, job,
+                limit=parse_limit(request.query_params.get("limit")),
+                after=request.query_params.get("cursor"),
+                exclude=pending_filter(),
+            )
+        except InvalidCursor:
+            return Response({"error": "Invalid cursor"}, status=400)
+
+        # scores are not rewritten mid-page; stale rows are upgraded in the
+        # background and ranked once they are current
+        queue_stale_applications(queryset.filter(job=job))
+        pending = count_pending(queryset.filter(job=job))
+
+        next_url = None
+        if cursor:
+            next_url = replace_query_param(request.build_absolute_uri(), "cursor", cursor)
+
+        return Response({
+            "job": job.id,
+            "scoring_status": job.scoring_status,
+            # applications left out until upgraded; the ranking is provisional while > 0
+            "pending_upgrades": pending,
+            "next": next_url,
+            "results": RankedApplicationSerializer(rows, many=True).data,
+        })
+
+
+class RecruiterMatchingCandidatesAPI(APIView):
+    """Best applicants to the recruiter's other jobs for this job: ?limit=20"""
+    permission_classes = [IsRecruiter]
+
+    def get(self, request, id):
+        job = get_object_or_404(job_queryset_for(request.user), id=id)
+        matches = find_matching_candidates(
+            job, application_queryset_for(request.user), limit=parse_limit(request.query_params.get("limit"))
+        )
+        return Response({
+            "job": job.id,
+            "results": MatchingCandidateSerializer(matches, many=True).data,
+        })
+
+
+class RecruiterWhatIfWeightsAPI(APIView):
+    """The job's ranking under other weights, without saving them: ?limit=20"""
+    permission_classes = [IsRecruiter]
+
+    def post(self, request, id):
+        job = get_object_or_404(Job, id=id, created_by=request.user, is_deleted=False)
+        serializer = ScoringWeightsSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=400)
+
+        rows = rerank(job, serializer.validated_data, limit=parse_limit(request.query_params.get("limit")))
+        return Response({
+            "job": job.id,
+            "scoring_status": job.scoring_status,
+            "weights": serializer.validated_data,
+            "results": WhatIfCandidateSerializer(rows, many=True).data,
+        })
+
+
+class RecruiterScoringWeightsAPI(APIView):
+    """GET the job's scoring weights; PUT saves them and rescores its applicants."""
+    permission_classes = [IsRecruiter]
+
+    def _response(self, job):
+        return Response({
+            "job": job.id,
+            "scoring_status": job.scoring_status,
+            **{name: getattr(job, name) for name in Job.WEIGHT_FIELDS},
+        })
+
+    def get(self, request, id):
+        job = get_object_or_404(Job, id=id, created_by=request.user, is_deleted=False)
+        return self._response(job)
+
+    def put(self, request, id):
+        job = get_object_or_404(Job, id=id, created_by=request.user, is_deleted=False)
+        serializer = ScoringWeightsSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=400)
+
+        for name, value in serializer.validated_data.items():
+            setattr(job, name, value)
+        # an actual change queues the match_score update (Job.save -> reweight_job)
+        job.save(update_fields=list(Job.WEIGHT_FIELDS))
+        job.refresh_from_db(fields=["scored_version"])
+        return self._response(job)
+
 
 class RecruiterUpdateStatusAPI(APIView):
     permission_classes = [IsRecruiter]
@@ -260,26 +396,26 @@ class ApplyJobAPI(APIView):
 
         resume_file = serializer.validated_data.pop("resume")
 
-
-        try:
-            resume_file.seek(0)
-            parsed = parse_resume(resume_file, job) or {}
-        except Exception as e:
-            logger.warning(f"Resume parsing failed: {e}")
-            parsed = {}
-
-        try:
-            resume_file.seek(0)
-            resume_url = upload_resume(resume_file, job.slug)
-        except Exception as e:
-            logger.error(f"Supabase upload failed for job={slug}: {e}")
-            return Response(
-                {"error": "Failed to upload resume. Please try again."},
-                status=500,
-            )
+        # one read of the upload, shared by parser, hasher and uploader
+        with ResumeBuffer(resume_file) as resume_buffer:
+            try:
+                parsed = parse_resume(resume_buffer, job) or {}
+            except PDFExtractionTimeout as e:
+                return Response({"error": str(e)}, status=400)
+            except Exception as e:
+                logger.warning(f"Resume parsing failed: {e}")
+                parsed = {}
+
+            try:
+                resume_url = upload_resume(resume_buffer, job.slug)
+            except Exception as e:
+                logger.error(f"Supabase upload failed for job={slug}: {e}")
+                return Response(
+                    {"error": "Failed to upload resume. Please try again."},
+                    status=500,
+                )
 
         scoring = compute_match_score(parsed, job)
-        print("SCORING:", scoring)
 
         try:
             application = Application(
@@ -299,11 +435,15 @@ class ApplyJobAPI(APIView):
                 skill_score=scoring["skill_score"],
                 experience_score=scoring["experience_score"],
                 keyword_score=scoring["keyword_score"],
+                similarity_score=scoring["similarity_score"],
                 matched_skills=scoring.get("matched_skills", []),
                 missing_skills=scoring.get("missing_skills", []),
                 summary=generate_summary(parsed, scoring["final_score"]),
                 evaluation=evaluate_candidate(scoring["final_score"]),
                 fit_category=fit_category(scoring["final_score"]),
+                # a failed parse stays unstamped and is retried on upgrade
+                parser_version=parsed.get("parser_version", 0),
+                taxonomy_version=parsed.get("taxonomy_version", 0),
             )
             application.save()
         except IntegrityError:
@@ -312,5 +452,97 @@ class ApplyJobAPI(APIView):
                 status=400,
             )
 
+        # kept for later rescoring; losing it only costs a re-download
+        try:
+            ApplicationText.store(application, parsed.get("raw_text"))
+        except Exception as e:
+            logger.warning(f"Storing resume text failed for application={application.id}: {e}")
+
         return Response({"message": "Application submitted successfully"})
 
+
+# ============================================================
+# MULTI-JOB APPLY API (PUBLIC)
+# ============================================================
+class MultiApplyJobAPI(APIView):
+    """One resume, several job slugs: parsed and uploaded once."""
+    permission_classes = [AllowAny]
+
+    def post(self, request):
+        serializer = MultiApplicationSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=400)
+
+        data = serializer.validated_data
+        slugs = data["jobs"]
+        found = Job.objects.in_bulk(slugs, field_name="slug")
+        jobs = [found[slug] for slug in slugs if slug in found and not found[slug].is_deleted]
+        not_found = [slug for slug in slugs if slug not in found or found[slug].is_deleted]
+        if not jobs:
+            return Response({"error": "None of these jobs are open.", "not_found": not_found}, status=400)
+
+        # nothing left to apply to: do not parse or upload
+        if len(already_applied(jobs, data["email"])) == len(jobs):
+            return Response(
+                {"error": "You have already applied for these jobs.", "already_applied": [job.slug for job in jobs]},
+                status=400,
+            )
+
+        with ResumeBuffer(data["resume"]) as resume_buffer:
+            try:
+                parsed = parse_resume(resume_buffer) or {}
+            except PDFExtractionTimeout as e:
+                return Response({"error": str(e)}, status=400)
+            except Exception as e:
+                logger.warning(f"Resume parsing failed: {e}")
+                parsed = {}
+
+            try:
+                resume_url = upload_resume(resume_buffer, jobs[0].slug)
+            except Exception as e:
+                logger.error(f"Supabase upload failed for jobs={slugs}: {e}")
+                return Response(
+                    {"error": "Failed to upload resume. Please try again."},
+                    status=500,
+                )
+
+        created, duplicates = create_applications(jobs, data, parsed, resume_url)
+
+        return Response(
+            {
+                "applied": [{"job": app.job.slug, "application_id": app.id} for app in created],
+                "already_applied": [job.slug for job in duplicates],
+                "not_found": not_found,
+            },
+            status=201 if created else 400,
+        )
+
+
+# ============================================================
+# RECOMMEND JOBS API (PUBLIC)
+# ============================================================
+class RecommendJobsAPI(APIView):
+    """Score one uploaded resume against the open jobs it shares skills with."""
+    permission_classes = [AllowAny]
+
+    def post(self, request):
+        serializer = ResumeUploadSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=400)
+
+        # parsed once; keywords are matched per job from the same text
+        with ResumeBuffer(serializer.validated_data["resume"]) as resume_buffer:
+            try:
+                parsed = parse_resume(resume_buffer)
+            except PDFExtractionTimeout as e:
+                return Response({"error": str(e)}, status=400)
+            except Exception as e:
+                logger.warning(f"Resume parsing failed: {e}")
+                return Response({"error": "Could not read the resume."}, status=400)
+
+        results = recommend_jobs(parsed, limit=serializer.validated_data["limit"])
+        return Response({
+            "skills": parsed.get("skills", []),
+            "experience_years": parsed.get("experience_years"),
+            "results": RecommendedJobSerializer(results, many=True).data,
+        })
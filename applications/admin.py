@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Application
+from .models import Application, Skill, SkillSynonym
 
 # Register your models here.
 
@@ -9,3 +9,16 @@ class ApplicationAdmin(admin.ModelAdmin):
     list_filter = ("status", "applied_at", "job")
     search_fields = ("full_name", "email", "phone")
     ordering = ("-applied_at",)
+
+
+class SkillSynonymInline(admin.TabularInline):
+    model = SkillSynonym
+    extra = 1
+
+
+@admin.register(Skill)
+class SkillAdmin(admin.ModelAdmin):
+    list_display = ("name", "category")
+    list_filter = ("category",)
+    search_fields = ("name", "synonyms__term")
+    inlines = [SkillSynonymInline]
@@ -0,0 +1,51 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+
+logger = logging.getLogger(__name__)
+
+# =====================================================================
+# BACKGROUND TASKS (ONE THREAD PER PROCESS)
+# =====================================================================
+# Work that should not hold up a request (application upgrades, rescoring
+# a job after its requirements change) is handed to a single worker
+# thread once the request's transaction commits. One thread keeps the
+# tasks of a process in submission order and off each other's rows.
+#
+# BACKGROUND_TASK_MODE: "thread" (default) or "eager", which runs each
+# task inline right away (tests; the test database is not shared with
+# other threads).
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="background")
+        return _executor
+
+
+def _run(fn, args):
+    close_old_connections()
+    try:
+        fn(*args)
+    except Exception:
+        logger.exception(f"Background task {fn.__name__} failed")
+    finally:
+        # the worker thread owns its connection; do not leave it open
+        connection.close()
+
+
+def submit(fn, *args):
+    """Run fn(*args) on the background thread after the current transaction commits."""
+    if getattr(settings, "BACKGROUND_TASK_MODE", "thread") == "eager":
+        fn(*args)
+        return
+
+    transaction.on_commit(lambda: _get_executor().submit(_run, fn, args))
@@ -0,0 +1,489 @@
+import logging
+import re
+from itertools import chain, compress
+
+import numpy as np
+from django.db.models import Case, F, Value, When
+
+from applications.keyword_stats import KEYWORD_STATS
+from applications.normalization import normalize
+from applications.profiles import job_profile
+from applications.similarity import batch_similarity_scores
+from applications.utils import evaluate_candidate, fit_category
+
+logger = logging.getLogger(__name__)
+
+# =====================================================================
+# BULK SCORING (ONE JOB, MANY APPLICANTS)
+# =====================================================================
+# compute_match_score scores one application at a time with Python sets.
+# When a job's requirements change, every applicant of that job has to be
+# rescored; BulkScorer does that for all of them in one NumPy pass:
+#
+#   - every distinct normalized skill gets an integer id and each
+#     applicant's skills become one row of a packed bitset matrix;
+#   - matched skills = popcount(row & required mask), the same for JD
+#     keywords;
+#   - the experience rule is applied with array masks.
+#
+# The numbers are exactly what compute_match_score returns: the same float
+# operations in the same order, and the final round(x, 2) is Python's
+# (np.round rounds some halves differently). matched_skills holds the same
+# members, in the order of the job's required skills. The job side comes
+# from the cached JobProfile, as for compute_match_score.
+#
+# For a job with keyword_scorer "tfidf" the keyword score needs the
+# keywords found, not only their number: it is computed once per distinct
+# hit pattern with the same KeywordWeights as the scalar path.
+#
+# Text similarity (applications.similarity) needs the resume text, which
+# the scorer does not read: callers pass it in, computed for a batch of
+# stored texts with one matrix product.
+
+_SCORE_IN_SUMMARY = re.compile(r"Overall match score is [^%]*%\.$")
+
+
+class Vocabulary(dict):
+    """Raw term -> bit position of its normalized form, filled on first use.
+
+    normalize() is called once per distinct raw string, not once per
+    applicant; position 0 is reserved for terms that normalize to nothing.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.ids = {"": 0}
+
+    def __missing__(self, raw):
+        term = normalize([raw])
+        position = self[raw] = self.add(term[0]) if term else 0
+        return position
+
+    def add(self, term):
+        return self.ids.setdefault(term, len(self.ids))
+
+    def width(self):
+        return len(self.ids)
+
+
+def _as_terms(value):
+    # parsed_skills is normally a list; a comma / newline separated string
+    # is split the way normalize() does it
+    if isinstance(value, list):
+        return value
+    return normalize(value)
+
+
+def pack_rows(rows, vocab):
+    """Packed bitset matrix, one row per applicant and one bit per term."""
+    rows = [_as_terms(r) for r in rows]
+    lengths = np.fromiter(map(len, rows), dtype=np.int64, count=len(rows))
+    positions = np.fromiter(map(vocab.__getitem__, chain.from_iterable(rows)), dtype=np.int64, count=int(lengths.sum()))
+
+    dense = np.zeros((len(rows), vocab.width()), dtype=bool)
+    dense[np.repeat(np.arange(len(rows)), lengths), positions] = True
+    dense[:, 0] = False
+    return np.packbits(dense, axis=1)
+
+
+def term_mask(terms, vocab, width):
+    dense = np.zeros(width * 8, dtype=bool)
+    dense[[vocab.ids[t] for t in terms]] = True
+    return np.packbits(dense)
+
+
+def term_columns(bits, terms, vocab):
+    # boolean (applicants x terms) view of selected bits
+    return np.unpackbits(bits, axis=1)[:, [vocab.ids[t] for t in terms]].astype(bool)
+
+
+def experience_array(experience):
+    # float() as compute_experience_score does it; "known" is False where
+    # float() fails, which scores 0
+    try:
+        values = np.array(experience, dtype=np.float64)
+        known = np.fromiter((e is not None for e in experience), dtype=bool, count=len(experience))
+        return values, known
+    except (TypeError, ValueError):
+        pass
+
+    values, known = [], []
+    for e in experience:
+        try:
+            values.append(float(e))
+            known.append(True)
+        except (TypeError, ValueError):
+            values.append(np.nan)
+            known.append(False)
+    return np.array(values, dtype=np.float64), np.array(known, dtype=bool)
+
+
+def popcount(bits, mask):
+    return np.bitwise_count(bits & mask).sum(axis=1, dtype=np.int64)
+
+
+def rounded(values):
+    """Python's round(x, 2) for every value, as a list.
+
+    rint(x * 100) / 100 gives the same double unless x * 100 lands next to
+    a half, where the product's own rounding can tip it; those few values
+    go through round() itself.
+    """
+    scaled = values * 100
+    result = np.rint(scaled) / 100
+    near_half = np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) < 1e-6
+    for i in np.flatnonzero(near_half):
+        result[i] = round(float(values[i]), 2)
+    return result.tolist()
+
+
+def split_hits(columns, terms):
+    """(matched, missing) term lists per row, built once per distinct pattern.
+
+    Rows with the same pattern share the list objects; they are only
+    serialized, never mutated.
+    """
+    patterns, inverse = np.unique(np.packbits(columns, axis=1), axis=0, return_inverse=True)
+    matched, missing = [], []
+    for pattern in np.unpackbits(patterns, axis=1, count=len(terms)).astype(bool).tolist():
+        matched.append(list(compress(terms, pattern)))
+        missing.append([t for t, hit in zip(terms, pattern) if not hit])
+
+    inverse = inverse.ravel().tolist()
+    return list(map(matched.__getitem__, inverse)), list(map(missing.__getitem__, inverse))
+
+
+def summary_with_score(summary, score):
+    # generate_summary ends with the score; the candidate name in front of
+    # it is not stored, so only the score is replaced
+    if not summary:
+        return summary
+    return _SCORE_IN_SUMMARY.sub(f"Overall match score is {score}%.", summary)
+
+
+def final_scores(skill_score, experience_score, keyword_score, similarity_score, weights):
+    """The weighted match score per row, as compute_match_score rounds it.
+
+    ``weights``: (skill, experience, keyword, similarity) fractions,
+    JobProfile.score_weights.
+    """
+    skill_weight, experience_weight, keyword_weight, similarity_weight = weights
+    final = (
+        (skill_score * skill_weight) +
+        (experience_score * experience_weight) +
+        (keyword_score * keyword_weight) +
+        (similarity_score * similarity_weight)
+    )
+    final = np.maximum(0, np.minimum(100, final))
+
+    # max(0, min(100, x)) returns the int bound when it clips, which
+    # shows in the summary text ("0%" rather than "0.0%")
+    result = rounded(final)
+    for i in np.flatnonzero((final <= 0) | (final >= 100)).tolist():
+        result[i] = int(final[i])
+    return result
+
+
+class BulkScorer:
+
+    def __init__(self, job):
+        self.job = job
+        # the same normalized sets compute_match_score scores against
+        self.profile = job_profile(job)
+        self.required = list(self.profile.required_skills)
+        self.jd_keywords = list(self.profile.jd_keywords)
+        self.weights = None
+        if self.profile.keyword_scorer == "tfidf":
+            self.weights = self.profile.keyword_weights(KEYWORD_STATS.current())
+
+    # -----------------------------------------------------------------
+    # COMPONENT SCORES
+    # -----------------------------------------------------------------
+    def skill_scores(self, skills):
+        if not self.required:
+            return (
+                np.full(len(skills), 100.0),
+                [list(set(normalize(s))) for s in skills],
+                [[] for _ in skills],
+            )
+
+        vocab = Vocabulary()
+        for term in self.required:
+            vocab.add(term)
+        bits = pack_rows(skills, vocab)
+
+        matched_count = popcount(bits, term_mask(self.required, vocab, bits.shape[1]))
+        scores = (matched_count / len(self.required)) * 100
+
+        matched, missing = split_hits(term_columns(bits, self.required, vocab), self.required)
+        return scores, matched, missing
+
+    def experience_scores(self, experience):
+        job_min, job_max = self.profile.min_experience, self.profile.max_experience
+        exp, known = experience_array(experience)
+
+        if job_min is None and job_max is None:
+            return np.where(known, 100.0, 0.0)
+
+        scores = np.full(len(exp), 100.0)
+        below = np.zeros(len(exp), dtype=bool)
+        if job_min:
+            below = known & (exp <= job_min)
+            scores[below] = (exp[below] / job_min) * 100
+        if job_max:
+            above = known & ~below & (exp > job_max)
+            scores[above] = np.maximum(0, 100 - ((exp[above] - job_max) * 5))
+
+        scores[~known] = 0.0
+        return scores
+
+    def keyword_scores(self, keywords=None, keyword_counts=None):
+        """From found keywords per row, or from match counts already known."""
+        size = len(keywords) if keywords is not None else len(keyword_counts)
+        if not self.jd_keywords:
+            return np.full(size, 100.0)
+
+        if self.weights is not None:
+            if keywords is None:
+                raise ValueError("TF-IDF keyword scores need the keywords found, not their count")
+            return self.weighted_keyword_scores(keywords)
+
+        if keyword_counts is None:
+            vocab = Vocabulary()
+            for term in self.jd_keywords:
+                vocab.add(term)
+            bits = pack_rows(keywords, vocab)
+            keyword_counts = popcount(bits, term_mask(self.jd_keywords, vocab, bits.shape[1]))
+
+        return (np.asarray(keyword_counts, dtype=np.int64) / len(self.jd_keywords)) * 100
+
+    def weighted_keyword_scores(self, keywords):
+        terms = list(self.weights.terms)
+        vocab = Vocabulary()
+        for term in terms:
+            vocab.add(term)
+        columns = term_columns(pack_rows(keywords, vocab), terms, vocab)
+
+        patterns, inverse = np.unique(np.packbits(columns, axis=1), axis=0, return_inverse=True)
+        values = [
+            self.weights.score_pattern(hits)
+            for hits in np.unpackbits(patterns, axis=1, count=len(terms)).astype(bool).tolist()
+        ]
+        return np.array(values, dtype=np.float64)[inverse.ravel()]
+
+    def stored_keyword_counts(self, keyword_scores):
+        # keyword_score = matched / len(jd) * 100 rounded to 2 places, so the
+        # count comes back exactly while the JD keywords are unchanged
+        if not self.jd_keywords:
+            return np.zeros(len(keyword_scores), dtype=np.int64)
+        scores = np.asarray(keyword_scores, dtype=np.float64)
+        return np.rint(scores * len(self.jd_keywords) / 100).astype(np.int64)
+
+    # -----------------------------------------------------------------
+    # FINAL SCORE
+    # -----------------------------------------------------------------
+    def score(self, skills, experience, keywords=None, keyword_counts=None, keyword_score=None,
+              similarity_score=None):
+        """Score parallel per-applicant lists; returns the compute_match_score fields as lists.
+
+        The keyword component comes from ``keywords`` (found per row),
+        ``keyword_counts`` or ready-made ``keyword_score`` values.
+        ``similarity_score`` holds the text similarity per row (see
+        applications.similarity); without it every row scores 0 there.
+        """
+        skill_score, matched, missing = self.skill_scores(skills)
+        experience_score = self.experience_scores(experience)
+        if keyword_score is None:
+            keyword_score = self.keyword_scores(keywords, keyword_counts)
+        else:
+            keyword_score = np.asarray(keyword_score, dtype=np.float64)
+        if similarity_score is None:
+            similarity_score = np.zeros(len(skills))
+        else:
+            similarity_score = np.asarray(similarity_score, dtype=np.float64)
+
+        return {
+            "final_score": final_scores(
+                skill_score, experience_score, keyword_score, similarity_score, self.profile.score_weights
+            ),
+            "matched_skills": matched,
+            "missing_skills": missing,
+            "skill_score": rounded(skill_score),
+            "experience_score": rounded(experience_score),
+            "keyword_score": rounded(keyword_score),
+            # already rounded to 2 places
+            "similarity_score": similarity_score.tolist(),
+        }
+
+
+# =====================================================================
+# RESCORING A JOB'S APPLICANTS
+# =====================================================================
+SCORE_FIELDS = [
+    "match_score",
+    "skill_score",
+    "experience_score",
+    "keyword_score",
+    "similarity_score",
+    "matched_skills",
+    "missing_skills",
+    "summary",
+    "evaluation",
+    "fit_category",
+]
+
+
+def rescore_job(job, keywords="stored", batch_size=1000):
+    """Rescore every application of ``job`` from its stored parse.
+
+    ``keywords="stored"`` keeps each applicant's JD keyword matches (right
+    while job.jd_keywords is unchanged; a TF-IDF keyword score is kept as
+    is) and text similarity; ``"text"`` computes both again from the stored
+    resume text. Rows without a stored text keep their keyword and
+    similarity scores as they are (100 if the job has no JD keywords).
+    Marks the job's current requirements as scored and returns the number
+    of applications written.
+    """
+    from applications.models import Application
+    from applications.parsing import extract_keywords
+
+    rows = list(
+        Application.objects.filter(job=job)
+        .order_by("id")
+        .values_list("id", "parsed_skills", "parsed_experience", "keyword_score", "similarity_score", "summary")
+    )
+    if not rows:
+        mark_scored(job)
+        return 0
+
+    ids, skills, experience, keyword_scores, similarity_scores, summaries = map(list, zip(*rows))
+    scorer = BulkScorer(job)
+
+    if scorer.weights is not None or (keywords == "text" and scorer.jd_keywords):
+        # TF-IDF: kept as scored, the weights of that moment included;
+        # rematching: rows with a text are overwritten below, and a count
+        # rebuilt for the others against new keywords would be made up
+        keyword_score = np.asarray(keyword_scores, dtype=np.float64)
+    else:
+        keyword_score = scorer.keyword_scores(keyword_counts=scorer.stored_keyword_counts(keyword_scores))
+    similarity_score = np.asarray(similarity_scores, dtype=np.float64)
+
+    if keywords == "text":
+        position = {app_id: i for i, app_id in enumerate(ids)}
+        for app_ids, documents in stored_documents(job, batch_size):
+            rows_with_text = [position[app_id] for app_id in app_ids]
+            if scorer.jd_keywords:
+                found = [extract_keywords(doc, job.jd_keywords, job) for doc in documents]
+                keyword_score[rows_with_text] = scorer.keyword_scores(keywords=found)
+            similarity_score[rows_with_text] = batch_similarity_scores(documents, scorer.profile)
+
+    scores = scorer.score(skills, experience, keyword_score=keyword_score, similarity_score=similarity_score)
+
+    updates = []
+    for i, app_id in enumerate(ids):
+        score = scores["final_score"][i]
+        updates.append(Application(
+            id=app_id,
+            match_score=score,
+            skill_score=scores["skill_score"][i],
+            experience_score=scores["experience_score"][i],
+            keyword_score=scores["keyword_score"][i],
+            similarity_score=scores["similarity_score"][i],
+            matched_skills=scores["matched_skills"][i],
+            missing_skills=scores["missing_skills"][i],
+            summary=summary_with_score(summaries[i], score),
+            evaluation=evaluate_candidate(score),
+            fit_category=fit_category(score),
+        ))
+
+    Application.objects.bulk_update(updates, SCORE_FIELDS, batch_size=batch_size)
+    mark_scored(job)
+    return len(updates)
+
+
+def stored_documents(job, batch_size=1000):
+    """Yield ``(application ids, ResumeDocuments)`` of ``job``'s stored texts, one batch at a time."""
+    from applications.document import ResumeDocument
+    from applications.models import ApplicationText
+
+    stored = ApplicationText.objects.filter(application__job=job).values_list("application_id", "compressed_text")
+    app_ids, documents = [], []
+    for app_id, blob in stored.iterator(chunk_size=batch_size):
+        app_ids.append(app_id)
+        documents.append(ResumeDocument(ApplicationText.decompress(bytes(blob))))
+        if len(app_ids) == batch_size:
+            yield app_ids, documents
+            app_ids, documents = [], []
+    if app_ids:
+        yield app_ids, documents
+
+
+def mark_scored(job):
+    # only moves forward: a rescore for newer requirements may finish first;
+    # needs_rematch stays set while a newer edit is still to be scored
+    type(job).objects.filter(pk=job.pk, scored_version__lt=job.scoring_version).update(
+        scored_version=job.scoring_version,
+        needs_rematch=Case(
+            When(scoring_version=job.scoring_version, then=Value(False)), default=F("needs_rematch")
+        ),
+    )
+
+
+# ---------------------------------------------------------------------
+# AFTER A JOB EDIT
+# ---------------------------------------------------------------------
+# Job.save() sends scoring_fields_changed when required_skills,
+# jd_keywords, the experience bounds, keyword_scorer, description or the
+# scoring weights changed; the job then reports scoring_status "rescoring"
+# until this task has rewritten its applicants. A change of weights alone
+# only recomputes match_score from the stored component scores. Edits to
+# anything else queue nothing.
+#
+# Whether keywords and similarity are matched against the resume texts
+# again is read from job.needs_rematch, not fixed when the task is queued:
+# tasks from several processes can run out of order, and the first one to
+# run scores the latest version for all of them.
+
+def rematch_mode(job):
+    return "text" if job.needs_rematch else "stored"
+
+
+def _rescore_job_task(job_id):
+    from jobs.models import Job
+
+    # the latest saved requirements, even if the job was edited again since
+    job = Job.objects.filter(pk=job_id).first()
+    if job is None or job.scored_version >= job.scoring_version:
+        return
+
+    written = rescore_job(job, keywords=rematch_mode(job))
+    logger.info(f"Job rescored | job={job_id} applications={written} scoring_version={job.scoring_version}")
+
+
+def _reweight_job_task(job_id, weights_version):
+    from applications.weights import reweight_job
+    from jobs.models import Job
+
+    job = Job.objects.filter(pk=job_id).first()
+    if job is None or job.scored_version >= job.scoring_version:
+        return
+    if job.scoring_version != weights_version:
+        # edited again since; that edit's task rescores with these weights too
+        return
+
+    if job.scored_version == weights_version - 1:
+        # the stored component scores are current: only the total changes
+        written = reweight_job(job)
+    else:
+        written = rescore_job(job, keywords=rematch_mode(job))
+    logger.info(f"Job reweighted | job={job_id} applications={written} scoring_version={job.scoring_version}")
+
+
+def schedule_job_rescore(job, fields):
+    from applications import background
+
+    if set(fields) <= set(job.WEIGHT_FIELDS):
+        background.submit(_reweight_job_task, job.pk, job.scoring_version)
+        return
+
+    background.submit(_rescore_job_task, job.pk)
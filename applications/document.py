@@ -0,0 +1,52 @@
+import re
+from functools import cached_property, lru_cache
+
+# =====================================================================
+# RESUME DOCUMENT
+# =====================================================================
+# One resume's text plus the views the extractors need, each derived
+# lazily and at most once:
+#
+#   lines   - the text split on "\n" (name, section segmenter)
+#   tokens  - the set of \w+ runs (skill / keyword membership checks)
+#   similarity_vector - hashed n-gram vector (applications.similarity)
+#
+# Every extractor accepts either a plain string or a ResumeDocument, so
+# the document is only a cache: results are identical either way.
+
+_WORD_RUN = re.compile(r"\w+")
+
+
+class ResumeDocument:
+
+    def __init__(self, text):
+        self.text = text or ""
+
+    def __repr__(self):
+        return f"<ResumeDocument {len(self.text)} chars>"
+
+    @classmethod
+    def wrap(cls, text):
+        return text if isinstance(text, cls) else cls(text)
+
+    @cached_property
+    def lines(self):
+        return self.text.split("\n")
+
+    @cached_property
+    def tokens(self):
+        # a whole \w+ run is exactly what re.search(rf"\b{word}\b") finds
+        return frozenset(_WORD_RUN.findall(self.text))
+
+    @cached_property
+    def similarity_vector(self):
+        from applications.similarity import text_vector
+
+        return text_vector(self.text)
+
+
+@lru_cache(maxsize=32)
+def resume_document(text):
+    # parse_resume builds the document for the base fields and then again
+    # for the JD keywords; the same raw_text string gets the same document
+    return ResumeDocument(text)
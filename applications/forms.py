@@ -1,5 +1,7 @@
 from django import forms
 from applications.models import Application
+from applications.multi_apply import MAX_JOBS_PER_APPLY
+from jobs.models import Job
 from django.core.validators import FileExtensionValidator
 from django.core.exceptions import ValidationError
 import re
@@ -71,3 +73,22 @@ class ApplicationForm(forms.ModelForm):
             raise ValidationError("Resume size cannot exceed 5MB.")
 
         return resume
+
+
+class MultiApplicationForm(ApplicationForm):
+    jobs = forms.ModelMultipleChoiceField(
+        queryset=Job.objects.filter(is_deleted=False).order_by("-created_at"),
+        to_field_name="slug",
+        widget=forms.CheckboxSelectMultiple,
+    )
+
+    class Meta(ApplicationForm.Meta):
+        fields = ApplicationForm.Meta.fields + ["jobs"]
+
+    def clean_jobs(self):
+        jobs = self.cleaned_data.get("jobs")
+
+        if jobs is not None and len(jobs) > MAX_JOBS_PER_APPLY:
+            raise ValidationError(f"You can apply to at most {MAX_JOBS_PER_APPLY} jobs at once.")
+
+        return jobs
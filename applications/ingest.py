@@ -0,0 +1,78 @@
+import hashlib
+import io
+import mmap
+
+# =====================================================================
+# RESUME INGESTION BUFFER
+# =====================================================================
+# An uploaded resume is read into memory exactly once. The parser, the
+# content hasher and the storage uploader all work off that one buffer:
+#
+#   - in-memory uploads: the upload's own bytes, wrapped in BytesIO views
+#     (BytesIO shares an immutable bytes object instead of copying it)
+#   - uploads Django spooled to disk: a read-only mmap of the temp file,
+#     and the uploader streams the file from disk
+
+
+class ResumeBuffer:
+
+    def __init__(self, uploaded_file):
+        self.name = getattr(uploaded_file, "name", "") or ""
+        self.path = None
+        self._file = None
+
+        if isinstance(uploaded_file, (bytes, bytearray)):
+            # already in memory, e.g. a resume downloaded from storage
+            self.data = bytes(uploaded_file)
+        elif hasattr(uploaded_file, "temporary_file_path"):
+            self.path = uploaded_file.temporary_file_path()
+            self._file = open(self.path, "rb")
+            size = self._file.seek(0, io.SEEK_END)
+            self.data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        else:
+            source = getattr(uploaded_file, "file", uploaded_file)
+            if isinstance(source, io.BytesIO):
+                # no copy when the BytesIO buffer is exactly sized
+                self.data = source.getvalue()
+            else:
+                uploaded_file.seek(0)
+                self.data = uploaded_file.read()
+
+        self._digest = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return len(self.data)
+
+    @classmethod
+    def wrap(cls, file_input):
+        return file_input if isinstance(file_input, cls) else cls(file_input)
+
+    def stream(self):
+        # a fresh read position over the shared bytes, never a copy
+        if isinstance(self.data, mmap.mmap):
+            self.data.seek(0)
+            return self.data
+        return io.BytesIO(self.data)
+
+    def digest(self):
+        if self._digest is None:
+            self._digest = hashlib.sha256(self.data).hexdigest()
+        return self._digest
+
+    def upload_body(self):
+        # storage3 accepts bytes or an unbuffered file it can stream
+        if self.path:
+            return open(self.path, "rb", buffering=0)
+        return self.data
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        if self._file:
+            self._file.close()
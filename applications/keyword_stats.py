@@ -0,0 +1,211 @@
+import logging
+import math
+import threading
+from collections import Counter, defaultdict
+from itertools import compress
+
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils.functional import cached_property
+
+from applications import background
+from applications.matchers import TermMatcher
+from applications.models import ApplicationText, KeywordCorpus, KeywordTerm
+from applications.normalization import normalize
+
+logger = logging.getLogger(__name__)
+
+# =====================================================================
+# TF-IDF KEYWORD SCORING (CORPUS STATISTICS)
+# =====================================================================
+# The default keyword score is the share of JD keywords found. With
+# job.keyword_scorer = "tfidf", each keyword is weighted by how rare it is
+# in the stored resumes, using the BM25 idf:
+#
+#     idf(t) = ln(1 + (N - df(t) + 0.5) / (df(t) + 0.5))
+#     score  = 100 * sum(idf of the keywords found) / sum(idf of all JD keywords)
+#
+# so a keyword nearly every resume mentions counts for less than a rare
+# one. A keyword found counts once however often it occurs; with binary
+# term frequency, BM25's length normalization cancels out once the score
+# is scaled to 0 - 100. A job without keywords still scores 100.
+#
+# Statistics: every keyword a job uses is a KeywordTerm row with its
+# document count. Storing a resume text adds 1 to the terms it contains
+# (in the background, one UPDATE per distinct increment); a new term is
+# counted over the texts already stored, also in the background. Each
+# process keeps a snapshot (term -> position, idf array) and reloads it
+# when terms were added or the corpus grew by more than
+# KEYWORD_STATS_REFRESH_RATIO (default 1%). Checking costs one primary-key
+# lookup; scoring one resume is then O(job keywords).
+
+
+class CorpusStats:
+    """Document frequencies as an idf array, one position per term."""
+
+    def __init__(self, documents, terms_version, terms, document_counts):
+        self.documents = documents
+        self.terms_version = terms_version
+        self.positions = {term: i for i, term in enumerate(terms)}
+        # a count updated after the corpus row was read can exceed it
+        df = np.minimum(np.asarray(document_counts, dtype=np.float64), documents)
+        self.idf = np.log1p((documents - df + 0.5) / (df + 0.5))
+        self.unseen_idf = math.log1p((documents + 0.5) / 0.5)
+
+    def __len__(self):
+        return len(self.positions)
+
+    def idf_of(self, term):
+        position = self.positions.get(term)
+        return self.unseen_idf if position is None else float(self.idf[position])
+
+    @cached_property
+    def matcher(self):
+        # every tracked term, for counting a new text
+        return TermMatcher({term: {term} for term in self.positions})
+
+
+class KeywordWeights:
+    """One job's keywords and their idf under one CorpusStats snapshot."""
+
+    def __init__(self, jd_keywords, stats):
+        self.terms = tuple(sorted(jd_keywords))
+        self.weights = tuple(stats.idf_of(term) for term in self.terms)
+        self.total = sum(self.weights)
+
+    def score(self, found):
+        """``found``: set of normalized keywords present in the resume."""
+        if not self.terms:
+            return 100
+        return self.score_pattern([term in found for term in self.terms])
+
+    def score_pattern(self, hits):
+        # hits[i]: whether self.terms[i] was found; summed in term order so
+        # the bulk scorer gets the same float as the scalar path
+        matched = sum(compress(self.weights, hits))
+        return (matched / self.total) * 100
+
+
+class KeywordStatsCache:
+
+    def __init__(self):
+        self._stats = None
+        self._lock = threading.Lock()
+        self.stats = {"loads": 0}
+
+    def _fresh(self, stats, documents, terms_version):
+        if stats is None or stats.terms_version != terms_version:
+            return False
+        ratio = getattr(settings, "KEYWORD_STATS_REFRESH_RATIO", 0.01)
+        return abs(documents - stats.documents) <= stats.documents * ratio
+
+    def current(self):
+        """Return the CorpusStats snapshot, reloading it if stale."""
+        documents, terms_version = KeywordCorpus.current()
+        stats = self._stats
+        if self._fresh(stats, documents, terms_version):
+            return stats
+
+        with self._lock:
+            if not self._fresh(self._stats, documents, terms_version):
+                rows = list(KeywordTerm.objects.order_by("id").values_list("term", "document_count"))
+                terms = [term for term, _ in rows]
+                counts = [count for _, count in rows]
+                self._stats = CorpusStats(documents, terms_version, terms, counts)
+                self.stats["loads"] += 1
+                logger.info(f"Keyword stats loaded | documents={documents} terms={len(terms)}")
+            return self._stats
+
+    def clear(self):
+        with self._lock:
+            self._stats = None
+            self.stats = {"loads": 0}
+
+
+KEYWORD_STATS = KeywordStatsCache()
+
+
+# ---------------------------------------------------------------------
+# MAINTENANCE
+# ---------------------------------------------------------------------
+def record_documents(texts):
+    """Add newly stored resume texts to the corpus statistics."""
+    texts = [text for text in texts if text]
+    if not texts:
+        return
+
+    matcher = KEYWORD_STATS.current().matcher
+    found = Counter()
+    for text in texts:
+        found.update(matcher.find(text))
+
+    by_increment = defaultdict(list)
+    for term, count in found.items():
+        by_increment[count].append(term)
+
+    with transaction.atomic():
+        for count, terms in by_increment.items():
+            KeywordTerm.objects.filter(term__in=terms).update(document_count=F("document_count") + count)
+        KeywordCorpus.add_documents(len(texts))
+
+
+def schedule_record_documents(texts):
+    background.submit(record_documents, texts)
+
+
+def register_keywords(keywords):
+    """Track the normalized ``keywords``; new ones are counted in the background."""
+    terms = {term for term in normalize(keywords) if len(term) <= 255}
+    if not terms:
+        return
+
+    known = set(KeywordTerm.objects.filter(term__in=terms).values_list("term", flat=True))
+    if terms <= known:
+        return
+
+    KeywordTerm.objects.bulk_create([KeywordTerm(term=term) for term in terms - known], ignore_conflicts=True)
+    KeywordCorpus.bump_terms()
+    background.submit(backfill_terms)
+
+
+def backfill_terms(chunk_size=500):
+    """Count the terms not yet backfilled over every stored text."""
+    pending = dict(KeywordTerm.objects.filter(backfilled=False).values_list("term", "id"))
+    if not pending:
+        return 0
+
+    matcher = TermMatcher({term: {term} for term in pending})
+    found = Counter()
+    texts = ApplicationText.objects.values_list("compressed_text", flat=True)
+    for blob in texts.iterator(chunk_size=chunk_size):
+        found.update(matcher.find(ApplicationText.decompress(bytes(blob))))
+
+    by_count = defaultdict(list)
+    for term, term_id in pending.items():
+        by_count[found[term]].append(term_id)
+
+    with transaction.atomic():
+        for count, ids in by_count.items():
+            KeywordTerm.objects.filter(id__in=ids).update(document_count=count, backfilled=True)
+        KeywordCorpus.bump_terms()
+
+    logger.info(f"Keyword terms backfilled | terms={len(pending)}")
+    return len(pending)
+
+
+def rebuild_keyword_stats():
+    """Recount everything: every job's keywords over every stored text."""
+    from jobs.models import Job
+
+    terms = set()
+    for keywords in Job.objects.values_list("jd_keywords", flat=True):
+        terms.update(term for term in normalize(keywords) if len(term) <= 255)
+
+    with transaction.atomic():
+        KeywordTerm.objects.bulk_create([KeywordTerm(term=term) for term in terms], ignore_conflicts=True)
+        KeywordTerm.objects.update(backfilled=False)
+        KeywordCorpus.objects.update_or_create(pk=1, defaults={"documents": ApplicationText.objects.count()})
+
+    return backfill_terms()
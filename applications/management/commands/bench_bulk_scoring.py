@@ -0,0 +1,109 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from applications.bulk_scoring import BulkScorer, rescore_job
+from applications.models import Application
+from applications.parsing import SKILL_DB
+from applications.utils import compute_match_score
+from jobs.models import Job
+
+
+class _Rollback(Exception):
+    pass
+
+
+def synthetic_applicants(count, seed):
+    """Parallel (skills, experience, keywords) lists shaped like stored applications."""
+    rng = random.Random(seed)
+    vocabulary = list(SKILL_DB)
+    skills = [rng.sample(vocabulary, rng.randint(0, 15)) for _ in range(count)]
+    experience = [None if rng.random() < 0.05 else round(rng.uniform(0, 15), 1) for _ in range(count)]
+    keywords = [rng.sample(vocabulary, rng.randint(0, 6)) for _ in range(count)]
+    return skills, experience, keywords
+
+
+def bench_job(seed):
+    rng = random.Random(seed)
+    vocabulary = list(SKILL_DB)
+    return Job(
+        id=-1,
+        title="Bulk scoring benchmark",
+        required_skills=rng.sample(vocabulary, 8),
+        jd_keywords=rng.sample(vocabulary, 6),
+        min_experience=2,
+        max_experience=6,
+    )
+
+
+class Command(BaseCommand):
+    help = "Compare per-application compute_match_score with the NumPy bulk scorer for one job"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--applicants", type=int, default=100_000)
+        parser.add_argument("--seed", type=int, default=7)
+        parser.add_argument("--write", action="store_true",
+                            help="Also time rescore_job against the database (rows are rolled back)")
+
+    def handle(self, *args, **options):
+        count = options["applicants"]
+        job = bench_job(options["seed"])
+        skills, experience, keywords = synthetic_applicants(count, options["seed"])
+
+        start = time.perf_counter()
+        scalar = [
+            compute_match_score({"skills": s, "experience_years": e, "keywords": k}, job)
+            for s, e, k in zip(skills, experience, keywords)
+        ]
+        scalar_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        bulk = BulkScorer(job).score(skills, experience, keywords=keywords)
+        bulk_time = time.perf_counter() - start
+
+        mismatches = sum(
+            1 for i, result in enumerate(scalar)
+            if result["final_score"] != bulk["final_score"][i]
+            or set(result["matched_skills"]) != set(bulk["matched_skills"][i])
+        )
+        if mismatches:
+            self.stdout.write(self.style.ERROR(f"{mismatches} of {count} scores differ from compute_match_score"))
+            return
+
+        self.stdout.write(f"{'compute_match_score':<20} {scalar_time * 1000:9.1f} ms  ({count / scalar_time:,.0f} applicants/s)")
+        self.stdout.write(f"{'BulkScorer':<20} {bulk_time * 1000:9.1f} ms  ({count / bulk_time:,.0f} applicants/s)")
+        self.stdout.write(self.style.SUCCESS(
+            f"{count:,} applicants, identical scores, {scalar_time / bulk_time:.1f}x faster"
+        ))
+
+        if options["write"]:
+            self.bench_write(job, skills, experience, bulk)
+
+    def bench_write(self, job, skills, experience, bulk):
+        # a throwaway job and its applicants, rolled back afterwards
+        try:
+            with transaction.atomic():
+                job.id = None
+                job.slug = "bulk-scoring-benchmark"
+                job.save()
+                Application.objects.bulk_create(
+                    [
+                        Application(
+                            job=job, full_name="Bench", email=f"bench{i}@example.com", phone="0",
+                            parsed_skills=skills[i], parsed_experience=experience[i],
+                            keyword_score=bulk["keyword_score"][i],
+                        )
+                        for i in range(len(skills))
+                    ],
+                    batch_size=2000,
+                )
+
+                start = time.perf_counter()
+                written = rescore_job(job)
+                elapsed = time.perf_counter() - start
+                self.stdout.write(f"rescore_job: {written:,} rows read, scored and written in {elapsed:.2f}s")
+                raise _Rollback()
+        except _Rollback:
+            pass
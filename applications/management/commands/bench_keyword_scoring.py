@@ -0,0 +1,77 @@
+import random
+import time
+
+import numpy as np
+from django.core.management.base import BaseCommand
+
+from applications.keyword_stats import CorpusStats, KeywordWeights
+from applications.parsing import SKILL_DB
+from applications.utils import keyword_score_for, weighted_keyword_score_for
+
+
+def synthetic_corpus(documents, seed):
+    """Term list and document counts with a long tail, like real resumes."""
+    rng = random.Random(seed)
+    terms = sorted(SKILL_DB)
+    rng.shuffle(terms)
+    # Zipf-like: the i-th most common term is in ~1 / (i + 1) of resumes
+    counts = [min(documents, int(documents * 0.8 / (i + 1)) + rng.randint(0, 3)) for i in range(len(terms))]
+    return terms, counts
+
+
+def synthetic_keywords(terms, counts, documents, applicants, seed):
+    # each applicant mentions each term with its corpus frequency
+    rng = random.Random(seed)
+    rates = [count / documents for count in counts]
+    return [[t for t, rate in zip(terms, rates) if rng.random() < rate] for _ in range(applicants)]
+
+
+def ranks(scores):
+    order = np.argsort(-np.asarray(scores), kind="stable")
+    result = np.empty(len(order))
+    result[order] = np.arange(len(order))
+    return result
+
+
+class Command(BaseCommand):
+    help = "Compare the keyword-fraction score with the TF-IDF (BM25 idf) keyword score for one job"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--applicants", type=int, default=20_000)
+        parser.add_argument("--documents", type=int, default=100_000, help="Size of the synthetic corpus")
+        parser.add_argument("--keywords", type=int, default=8, help="JD keywords of the job")
+        parser.add_argument("--top", type=int, default=20)
+        parser.add_argument("--seed", type=int, default=7)
+
+    def handle(self, *args, **options):
+        documents, count = options["documents"], options["applicants"]
+        terms, counts = synthetic_corpus(documents, options["seed"])
+        keywords = synthetic_keywords(terms, counts, documents, count, options["seed"])
+        # a mix of common and rare JD keywords
+        jd = set(random.Random(options["seed"]).sample(terms[:200], options["keywords"]))
+
+        start = time.perf_counter()
+        stats = CorpusStats(documents, 0, terms, counts)
+        weights = KeywordWeights(jd, stats)
+        setup_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        fraction = [keyword_score_for(k, jd) for k in keywords]
+        fraction_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        tfidf = [weighted_keyword_score_for(k, weights) for k in keywords]
+        tfidf_time = time.perf_counter() - start
+
+        spearman = float(np.corrcoef(ranks(fraction), ranks(tfidf))[0, 1])
+        top = options["top"]
+        overlap = len(set(ranks(fraction).argsort()[:top]) & set(ranks(tfidf).argsort()[:top]))
+
+        self.stdout.write(f"{'corpus snapshot':<20} {setup_time * 1000:9.1f} ms  ({len(terms):,} terms)")
+        self.stdout.write(f"{'keyword_score_for':<20} {fraction_time * 1000:9.1f} ms  ({count / fraction_time:,.0f} applicants/s)")
+        self.stdout.write(f"{'tfidf':<20} {tfidf_time * 1000:9.1f} ms  ({count / tfidf_time:,.0f} applicants/s)")
+        for term, weight in sorted(zip(weights.terms, weights.weights), key=lambda p: p[1]):
+            self.stdout.write(f"  {term:<24} idf {weight:6.3f}")
+        self.stdout.write(self.style.SUCCESS(
+            f"{count:,} applicants: rank correlation {spearman:.3f}, top {top} overlap {overlap}/{top}"
+        ))
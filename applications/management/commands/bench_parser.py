@@ -0,0 +1,312 @@
+import io
+import json
+import platform
+import random
+import statistics
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from applications.document import ResumeDocument
+from applications.parsing import (
+    PARSER_VERSION,
+    SKILL_DB,
+    extract_email,
+    extract_experience,
+    extract_keywords,
+    extract_name,
+    extract_pdf,
+    extract_phone,
+    extract_skills,
+    segment_sections,
+)
+from applications.utils import compute_match_score
+from jobs.models import Job
+
+# =====================================================================
+# SYNTHETIC RESUME CORPUS
+# =====================================================================
+# Resumes are rendered with xhtml2pdf from a seeded RNG, so the same
+# --seed / --count always produces the same documents. Layouts and sizes
+# vary to cover what the parser meets in practice: single column,
+# two-column tables, dense small-font pages, and 1 to ~6 pages of text.
+
+FIRST_NAMES = ["Aarav", "Neha", "Priya", "Rohan", "Isha", "Kabir", "Ananya", "Vikram", "Sara", "Arjun"]
+LAST_NAMES = ["Sharma", "Gupta", "Mehta", "Iyer", "Patel", "Reddy", "Khan", "Das", "Nair", "Joshi"]
+COMPANIES = ["Infosys", "Zoho", "Razorpay", "Freshworks", "Swiggy", "TCS", "Postman", "Atlassian"]
+DEGREES = ["B.Tech Computer Science", "B.E. Information Technology", "MCA", "B.Sc Mathematics"]
+CERTIFICATES = ["AWS Certified Developer", "Salesforce Platform Developer I", "CKAD", "Scrum Master"]
+VERBS = ["Built", "Designed", "Maintained", "Optimised", "Migrated", "Automated", "Led"]
+NOUNS = ["payment APIs", "reporting pipeline", "search service", "admin dashboard", "CI/CD workflows",
+         "customer portal", "notification system", "data exports"]
+
+LAYOUTS = ["classic", "table", "dense"]
+SIZES = {"short": 2, "medium": 6, "long": 16}
+
+BENCH_JD_KEYWORDS = ["api", "backend", "scalable", "testing", "deployment", "microservices"]
+
+# never saved; the negative id only keys its compiled keyword matcher
+BENCH_JOB = Job(
+    id=-1,
+    required_skills=["python", "django", "postgresql", "docker", "git"],
+    jd_keywords=BENCH_JD_KEYWORDS,
+    min_experience=2,
+    max_experience=6,
+)
+
+STYLES = {
+    "classic": "body { font-size: 11pt; } h2 { font-size: 13pt; margin-top: 10pt; }",
+    "table": "body { font-size: 10pt; } td { vertical-align: top; padding: 4pt; }",
+    "dense": "body { font-size: 7pt; } h2 { font-size: 8pt; margin: 2pt 0; } p { margin: 0; }",
+}
+
+
+def _bullets(rng, count):
+    return [f"{rng.choice(VERBS)} {rng.choice(NOUNS)} using {rng.choice(list(SKILL_DB))}" for _ in range(count)]
+
+
+def _resume_sections(rng, entries):
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    skills = rng.sample(list(SKILL_DB), rng.randint(5, 20))
+    years = rng.randint(0, 12)
+
+    experience = []
+    for _ in range(entries):
+        experience.append(f"<p><b>{rng.choice(COMPANIES)}</b> - Software Engineer</p>")
+        experience.extend(f"<p>- {line}</p>" for line in _bullets(rng, rng.randint(3, 6)))
+
+    projects = []
+    for i in range(max(1, entries // 2)):
+        projects.append(f"<p><b>Project {i + 1}</b></p>")
+        projects.extend(f"<p>- {line}</p>" for line in _bullets(rng, 3))
+
+    header = (
+        f"<h1>{name}</h1>"
+        f"<p>{name.lower().replace(' ', '.')}@example.com | +91 98{rng.randint(10000000, 99999999)}</p>"
+        f"<h2>Summary</h2><p>Backend developer with {years} years of experience building scalable "
+        f"{', '.join(rng.sample(BENCH_JD_KEYWORDS, 3))} systems.</p>"
+    )
+    return {
+        "header": header,
+        "skills": f"<h2>Skills</h2><p>{', '.join(skills)}</p>",
+        "experience": "<h2>Experience</h2>" + "".join(experience),
+        "projects": "<h2>Projects</h2>" + "".join(projects),
+        "education": f"<h2>Education</h2><p>{rng.choice(DEGREES)}, {rng.randint(2008, 2023)}</p>",
+        "certifications": f"<h2>Certifications</h2><p>{', '.join(rng.sample(CERTIFICATES, 2))}</p>",
+    }
+
+
+def render_resume_html(rng, layout, entries):
+    s = _resume_sections(rng, entries)
+
+    if layout == "table":
+        body = (
+            s["header"]
+            + "<table><tr>"
+            + f"<td width='35%'>{s['skills']}{s['education']}{s['certifications']}</td>"
+            + f"<td width='65%'>{s['experience']}{s['projects']}</td>"
+            + "</tr></table>"
+        )
+    else:
+        body = "".join(s[k] for k in ["header", "skills", "experience", "projects", "education", "certifications"])
+
+    return f"<html><head><style>{STYLES[layout]}</style></head><body>{body}</body></html>"
+
+
+def generate_corpus(directory, count, seed):
+    from xhtml2pdf import pisa
+
+    directory.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(seed)
+    manifest = []
+
+    for i in range(count):
+        layout = LAYOUTS[i % len(LAYOUTS)]
+        size = list(SIZES)[(i // len(LAYOUTS)) % len(SIZES)]
+        path = directory / f"resume-{i:04d}-{layout}-{size}.pdf"
+
+        with open(path, "wb") as f:
+            result = pisa.CreatePDF(render_resume_html(rng, layout, SIZES[size]), dest=f)
+        if result.err:
+            raise CommandError(f"xhtml2pdf failed to render {path.name}")
+
+        manifest.append({"file": path.name, "layout": layout, "size": size, "bytes": path.stat().st_size})
+
+    (directory / "manifest.json").write_text(json.dumps({"seed": seed, "count": count, "files": manifest}, indent=2))
+    return manifest
+
+
+def load_corpus(directory, count, seed, regenerate=False):
+    manifest_path = directory / "manifest.json"
+    if not regenerate and manifest_path.exists():
+        manifest = json.loads(manifest_path.read_text())
+        if manifest["seed"] == seed and manifest["count"] == count and all(
+            (directory / entry["file"]).exists() for entry in manifest["files"]
+        ):
+            return manifest["files"]
+    return generate_corpus(directory, count, seed)
+
+
+# =====================================================================
+# STAGES
+# =====================================================================
+# Mirrors parse_resume_base + parse_resume + compute_match_score, run
+# uncached so every resume pays for every stage.
+
+def run_stages(data, clock=time.perf_counter):
+    timings = {}
+
+    def timed(stage, fn, *args):
+        start = clock()
+        value = fn(*args)
+        timings[stage] = clock() - start
+        return value
+
+    text, _ = timed("extract_pdf", extract_pdf, io.BytesIO(data))
+    doc = ResumeDocument(text)
+    timed("sections", segment_sections, doc)
+    timed("name", extract_name, doc)
+    timed("email", extract_email, doc)
+    timed("phone", extract_phone, doc)
+    skills = timed("skills", extract_skills, doc)
+    experience = timed("experience", extract_experience, doc)
+    keywords = timed("keywords", extract_keywords, doc, BENCH_JOB.jd_keywords, BENCH_JOB)
+    parsed = {"skills": skills, "experience_years": experience, "keywords": keywords}
+    timed("score", compute_match_score, parsed, BENCH_JOB)
+    return timings
+
+
+def summarise(samples):
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, max(0, round(0.95 * len(ordered)) - 1))]
+    return {
+        "total_s": round(sum(samples), 6),
+        "mean_ms": round(statistics.fmean(samples) * 1000, 4),
+        "p95_ms": round(p95 * 1000, 4),
+    }
+
+
+def benchmark(files, rounds):
+    per_stage = {}
+    totals = []
+
+    for _ in range(rounds):
+        for data in files:
+            timings = run_stages(data)
+            for stage, seconds in timings.items():
+                per_stage.setdefault(stage, []).append(seconds)
+            totals.append(sum(timings.values()))
+
+    # separate pass: tracemalloc slows allocation-heavy code down
+    tracemalloc.start()
+    for data in files:
+        run_stages(data)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        "stages": {stage: summarise(samples) for stage, samples in per_stage.items()},
+        "total": summarise(totals),
+        "resumes_per_sec": round(len(totals) / sum(totals), 2),
+        "peak_memory_kb": round(peak / 1024, 1),
+    }
+
+
+def _change(old, new):
+    if not old:
+        return 0.0
+    return (new - old) / old * 100
+
+
+class Command(BaseCommand):
+    help = "Benchmark each parse_resume stage over a reproducible synthetic resume corpus"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--count", type=int, default=30, help="Number of synthetic resumes")
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--rounds", type=int, default=3)
+        parser.add_argument("--corpus-dir", default=str(Path(tempfile.gettempdir()) / "smart-ats-bench-corpus"))
+        parser.add_argument("--regenerate", action="store_true", help="Re-render the corpus even if it exists")
+        parser.add_argument("--output", default="bench_parser.json", help="Where to write the results")
+        parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CANDIDATE"),
+                            help="Diff two result files instead of running the benchmark")
+        parser.add_argument("--threshold", type=float, default=10.0,
+                            help="Percent slowdown reported as a regression in --compare")
+
+    def handle(self, *args, **options):
+        if options["compare"]:
+            return self.compare(*options["compare"], threshold=options["threshold"])
+
+        directory = Path(options["corpus_dir"]) / f"seed{options['seed']}-n{options['count']}"
+        manifest = load_corpus(directory, options["count"], options["seed"], options["regenerate"])
+        files = [(directory / entry["file"]).read_bytes() for entry in manifest]
+
+        self.stdout.write(f"{len(files)} resumes from {directory}, {options['rounds']} rounds")
+
+        results = {
+            "meta": {
+                "seed": options["seed"],
+                "count": options["count"],
+                "rounds": options["rounds"],
+                "corpus_bytes": sum(map(len, files)),
+                "parser_version": PARSER_VERSION,
+                "pdf_backend": getattr(settings, "PDF_TEXT_BACKEND", "pypdf2"),
+                "python": platform.python_version(),
+            },
+            **benchmark(files, options["rounds"]),
+        }
+
+        for stage, summary in results["stages"].items():
+            self.stdout.write(f"{stage:<12} {summary['mean_ms']:>10.3f} ms mean {summary['p95_ms']:>10.3f} ms p95")
+        self.stdout.write(
+            f"{results['resumes_per_sec']} resumes/sec, peak {results['peak_memory_kb']} KB traced"
+        )
+
+        Path(options["output"]).write_text(json.dumps(results, indent=2))
+        self.stdout.write(self.style.SUCCESS(f"Results written to {options['output']}"))
+
+    def compare(self, baseline_path, candidate_path, threshold):
+        try:
+            baseline = json.loads(Path(baseline_path).read_text())
+            candidate = json.loads(Path(candidate_path).read_text())
+        except (OSError, ValueError) as e:
+            raise CommandError(f"Could not read results: {e}")
+
+        if baseline["meta"]["seed"] != candidate["meta"]["seed"] or baseline["meta"]["count"] != candidate["meta"]["count"]:
+            self.stdout.write(self.style.WARNING("Results come from different corpora"))
+
+        regressions = 0
+        self.stdout.write(f"{'stage':<12} {'baseline ms':>12} {'candidate ms':>13} {'change':>9}")
+
+        rows = [(stage, baseline["stages"][stage]["mean_ms"], candidate["stages"][stage]["mean_ms"])
+                for stage in baseline["stages"] if stage in candidate["stages"]]
+        rows.append(("total", baseline["total"]["mean_ms"], candidate["total"]["mean_ms"]))
+
+        for stage, old, new in rows:
+            change = _change(old, new)
+            line = f"{stage:<12} {old:>12.3f} {new:>13.3f} {change:>+8.1f}%"
+            if change > threshold:
+                regressions += 1
+                line = self.style.ERROR(line + "  REGRESSION")
+            self.stdout.write(line)
+
+        for label, key, higher_is_better in [
+            ("resumes/sec", "resumes_per_sec", True),
+            ("peak KB", "peak_memory_kb", False),
+        ]:
+            change = _change(baseline[key], candidate[key])
+            worse = -change if higher_is_better else change
+            line = f"{label:<12} {baseline[key]:>12} {candidate[key]:>13} {change:>+8.1f}%"
+            if worse > threshold:
+                regressions += 1
+                line = self.style.ERROR(line + "  REGRESSION")
+            self.stdout.write(line)
+
+        if regressions:
+            self.stdout.write(self.style.ERROR(f"{regressions} regression(s) above {threshold}%"))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"No regressions above {threshold}%"))
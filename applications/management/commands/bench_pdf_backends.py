@@ -0,0 +1,108 @@
+import io
+import json
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from applications.parsing import extract_skills, read_pdf
+from applications.pdf_backends import DEFAULT_BACKEND, available_backends, get_backend
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def bench_backend(name, corpus, rounds):
+    backend = get_backend(name)
+
+    # timing pass, without tracemalloc slowing allocations down
+    latencies = []
+    texts = {}
+    for _ in range(rounds):
+        for path, data in corpus.items():
+            start = time.perf_counter()
+            text, _ = read_pdf(io.BytesIO(data), backend)
+            latencies.append(time.perf_counter() - start)
+            texts[path] = text
+
+    # memory pass: peak Python allocations while extracting one document
+    peak = 0
+    for data in corpus.values():
+        tracemalloc.start()
+        read_pdf(io.BytesIO(data), backend)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    skills = {path: set(extract_skills(text)) for path, text in texts.items()}
+    total = sum(latencies)
+
+    return {
+        "backend": name,
+        "documents": len(corpus),
+        "rounds": rounds,
+        "docs_per_sec": round(len(latencies) / total, 2) if total else 0.0,
+        "mb_per_sec": round(sum(map(len, corpus.values())) * rounds / total / 1e6, 2) if total else 0.0,
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "peak_kb": round(peak / 1024, 1),
+        "empty_documents": sum(1 for text in texts.values() if not text),
+        "skills_found": sum(len(found) for found in skills.values()),
+        "_skills": skills,
+    }
+
+
+class Command(BaseCommand):
+    help = "Run every installed PDF text backend over a corpus and compare speed, memory and skills found"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--corpus", default=str(Path(settings.BASE_DIR) / "media" / "resumes"),
+                            help="Directory searched recursively for PDFs")
+        parser.add_argument("--rounds", type=int, default=3)
+        parser.add_argument("--backend", action="append", dest="backends",
+                            help="Only run this backend (repeatable)")
+        parser.add_argument("--json", dest="json_path", help="Also write the results to this file")
+
+    def handle(self, *args, **options):
+        corpus = {str(path): path.read_bytes() for path in sorted(Path(options["corpus"]).rglob("*.pdf"))}
+        if not corpus:
+            raise CommandError(f"No PDFs found under {options['corpus']}")
+
+        installed = available_backends()
+        names = options["backends"] or installed
+        for name in names:
+            if name not in installed:
+                raise CommandError(f"Backend {name!r} is not installed (available: {', '.join(installed)})")
+
+        self.stdout.write(f"{len(corpus)} PDFs, {options['rounds']} rounds, backends: {', '.join(names)}\n")
+
+        results = [bench_backend(name, corpus, options["rounds"]) for name in names]
+
+        # accuracy relative to the default backend, per document
+        baseline = next((r["_skills"] for r in results if r["backend"] == DEFAULT_BACKEND), None)
+        for result in results:
+            found = result.pop("_skills")
+            if baseline is not None:
+                result["skills_missing_vs_default"] = sum(len(baseline[p] - found[p]) for p in corpus)
+                result["skills_extra_vs_default"] = sum(len(found[p] - baseline[p]) for p in corpus)
+
+        header = f"{'backend':<10} {'docs/s':>8} {'MB/s':>7} {'p50 ms':>8} {'p95 ms':>8} {'peak KB':>9} {'skills':>7} {'-/+ vs default':>15}"
+        self.stdout.write(header)
+        self.stdout.write("-" * len(header))
+        for r in results:
+            delta = f"-{r.get('skills_missing_vs_default', 0)}/+{r.get('skills_extra_vs_default', 0)}"
+            self.stdout.write(
+                f"{r['backend']:<10} {r['docs_per_sec']:>8} {r['mb_per_sec']:>7} {r['p50_ms']:>8} "
+                f"{r['p95_ms']:>8} {r['peak_kb']:>9} {r['skills_found']:>7} {delta:>15}"
+            )
+
+        if options["json_path"]:
+            Path(options["json_path"]).write_text(json.dumps(results, indent=2))
+            self.stdout.write(self.style.SUCCESS(f"Results written to {options['json_path']}"))
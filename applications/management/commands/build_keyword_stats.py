@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from applications.keyword_stats import KEYWORD_STATS, rebuild_keyword_stats
+from applications.models import KeywordCorpus
+
+
+class Command(BaseCommand):
+    help = "Recount keyword document frequencies over every stored resume text"
+
+    def handle(self, *args, **options):
+        terms = rebuild_keyword_stats()
+        KEYWORD_STATS.clear()
+        documents, _ = KeywordCorpus.current()
+        self.stdout.write(self.style.SUCCESS(f"Counted {terms} keywords over {documents} stored resumes"))
@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from applications.models import Skill, SkillSynonym, SkillTaxonomyVersion
+from applications.parsing import SKILL_DB
+from applications.recommendations import reindex_open_jobs
+
+
+class Command(BaseCommand):
+    help = "Seed the Skill / SkillSynonym tables from the built-in SKILL_DB"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--replace", action="store_true",
+                            help="Delete the current taxonomy first instead of only adding missing entries")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            if options["replace"]:
+                SkillSynonym.objects.all().delete()
+                Skill.objects.all().delete()
+
+            existing = set(Skill.objects.values_list("name", flat=True))
+            new_skills = Skill.objects.bulk_create(
+                [Skill(name=name) for name in SKILL_DB if name not in existing]
+            )
+
+            skill_ids = dict(Skill.objects.values_list("name", "id"))
+            existing_terms = set(SkillSynonym.objects.values_list("skill__name", "term"))
+            new_synonyms = SkillSynonym.objects.bulk_create([
+                SkillSynonym(skill_id=skill_ids[name], term=term)
+                for name, synonyms in SKILL_DB.items()
+                for term in synonyms
+                if (name, term) not in existing_terms
+            ])
+
+            # bulk_create sends no signals: one bump for the whole import
+            SkillTaxonomyVersion.bump()
+
+        reindex_open_jobs()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {len(new_skills)} skills and {len(new_synonyms)} synonyms "
+            f"(taxonomy version {SkillTaxonomyVersion.current()})"
+        ))
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from applications.models import Application
+from applications.skill_index import index_application_skills
+
+
+class Command(BaseCommand):
+    help = "Rebuild the skill -> application index from every application's parsed skills"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        ids = list(Application.objects.order_by("id").values_list("id", flat=True))
+
+        written = 0
+        for start in range(0, len(ids), batch_size):
+            batch = Application.objects.filter(id__in=ids[start:start + batch_size]).only("id", "parsed_skills")
+            with transaction.atomic():
+                written += index_application_skills(list(batch), replace=True)
+
+        self.stdout.write(self.style.SUCCESS(f"Indexed {written} skills of {len(ids)} applications"))
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from applications.models import JobSkill
+from applications.recommendations import reindex_open_jobs
+
+
+class Command(BaseCommand):
+    help = "Rebuild the skill -> job index used for job recommendations"
+
+    def handle(self, *args, **options):
+        reindex_open_jobs()
+        self.stdout.write(self.style.SUCCESS(f"Indexed {JobSkill.objects.count()} skills of open jobs"))
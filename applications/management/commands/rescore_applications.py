@@ -0,0 +1,225 @@
+import json
+import multiprocessing
+import os
+import time
+from contextlib import contextmanager
+from datetime import datetime, time as dt_time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.db.models import Q
+from django.utils import timezone
+
+from applications.bulk_scoring import rescore_job
+from applications.keyword_stats import KEYWORD_STATS
+from applications.models import Application, ApplicationText
+from applications.parsing import SKILL_TAXONOMY
+from applications.rescoring import fetch_resume, rescore_resume, rescore_text, save_rescored
+from jobs.models import Job
+
+# =====================================================================
+# WORKERS
+# =====================================================================
+# Workers only decompress / download, parse and score; they never touch
+# the database. The parent compiles the skill matcher once and hands it,
+# with its taxonomy version, to each worker, together with one keyword
+# corpus snapshot when a job uses the TF-IDF scorer, then writes the
+# results with bulk_update.
+
+_worker_state = {}
+
+
+def _init_worker(taxonomy, corpus_stats, cache_dir):
+    # a nested extraction pool is not allowed inside a pool worker
+    settings.PDF_EXTRACTION_MODE = "inline"
+    _worker_state.update(taxonomy=taxonomy, corpus_stats=corpus_stats, cache_dir=cache_dir)
+
+
+def _rescore_task(task):
+    # -> (application id, field values or None, newly extracted text, error)
+    app_id, resume_url, job, compressed_text = task
+    taxonomy, corpus_stats = _worker_state["taxonomy"], _worker_state["corpus_stats"]
+    try:
+        if compressed_text is not None:
+            text = ApplicationText.decompress(compressed_text)
+            return app_id, rescore_text(text, job, taxonomy, corpus_stats), None, None
+
+        data = fetch_resume(resume_url, _worker_state["cache_dir"])
+        fields, text = rescore_resume(data, job, taxonomy, corpus_stats)
+        return app_id, fields, text, None
+    except Exception as e:
+        return app_id, None, None, str(e)
+
+
+def _parse_since(value):
+    try:
+        day = datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        raise CommandError("--since must look like YYYY-MM-DD")
+    return timezone.make_aware(datetime.combine(day, dt_time.min))
+
+
+class Command(BaseCommand):
+    help = "Reparse and rescore stored applications in parallel, resumable from a checkpoint"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--job", help="Only applications for this job id or slug")
+        parser.add_argument("--since", help="Only applications submitted on or after YYYY-MM-DD")
+        parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                            help="Worker processes (0 runs everything in this process)")
+        parser.add_argument("--batch-size", type=int, default=200, help="Rows per bulk_update")
+        parser.add_argument("--cache-dir", help="Local mirror of the resume bucket, filled on demand")
+        parser.add_argument("--checkpoint", default="rescore_checkpoint.json",
+                            help="Progress file; an interrupted run with the same filters resumes from it")
+        parser.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint")
+        parser.add_argument("--reextract", action="store_true",
+                            help="Re-download and re-extract PDFs even where the text is stored")
+        parser.add_argument("--scores-only", action="store_true",
+                            help="With --job: keep the parsed fields and only recompute scores (vectorized)")
+        parser.add_argument("--rematch-keywords", action="store_true",
+                            help="With --scores-only: find the JD keywords again and recompute text similarity from the stored text")
+
+    def handle(self, *args, **options):
+        if options["scores_only"]:
+            return self.rescore_scores(options)
+
+        queryset = self.get_queryset(options)
+        checkpoint_path = Path(options["checkpoint"])
+        filters = {"job": options["job"], "since": options["since"]}
+        checkpoint = self.load_checkpoint(checkpoint_path, filters, options["restart"])
+
+        queryset = queryset.filter(id__gt=checkpoint["last_id"])
+        if checkpoint["last_id"]:
+            self.stdout.write(f"Resuming after application {checkpoint['last_id']}")
+
+        taxonomy = SKILL_TAXONOMY.current()
+        ids = list(queryset.values_list("id", flat=True))
+        jobs = Job.objects.in_bulk(set(queryset.order_by().values_list("job_id", flat=True)))
+        corpus_stats = (
+            KEYWORD_STATS.current() if any(job.keyword_scorer == "tfidf" for job in jobs.values()) else None
+        )
+
+        total = len(ids)
+        batch_size = options["batch_size"]
+        self.stdout.write(f"{total} applications to rescore with {options['workers']} workers")
+
+        started = time.monotonic()
+        done = 0
+
+        with self.worker_pool(options, taxonomy, corpus_stats) as run:
+            for start in range(0, total, batch_size):
+                rows = (
+                    Application.objects.filter(id__in=ids[start:start + batch_size])
+                    .order_by("id")
+                    .values_list("id", "resume_url", "job_id", "resume_text__compressed_text")
+                )
+                tasks = [
+                    (app_id, resume_url, jobs[job_id], None if options["reextract"] or blob is None else bytes(blob))
+                    for app_id, resume_url, job_id, blob in rows
+                ]
+
+                updates, texts = [], []
+                for app_id, fields, text, error in run(tasks):
+                    done += 1
+                    if fields is None:
+                        checkpoint["failed"] += 1
+                        self.stderr.write(f"Application {app_id}: {error or 'no text extracted'}, kept as is")
+                        continue
+
+                    updates.append(Application(id=app_id, **fields))
+                    if text:
+                        texts.append(ApplicationText.build(Application(id=app_id), text))
+
+                save_rescored(updates, texts)
+
+                checkpoint["updated"] += len(updates)
+                checkpoint["last_id"] = tasks[-1][0] if tasks else checkpoint["last_id"]
+                self.save_checkpoint(checkpoint_path, checkpoint)
+                self.report(done, total, started)
+
+        # finished: the next run (after the next parser change) starts over
+        checkpoint_path.unlink(missing_ok=True)
+        self.stdout.write(self.style.SUCCESS(
+            f"Rescored {checkpoint['updated']} applications, {checkpoint['failed']} failed"
+        ))
+
+    def rescore_scores(self, options):
+        # after a change to the job, not the parser: one NumPy pass over the
+        # stored parse results, no PDFs or text parsing
+        if not options["job"]:
+            raise CommandError("--scores-only needs --job")
+
+        job = options["job"]
+        lookup = {"id": int(job)} if job.isdigit() else {"slug": job}
+        job = Job.objects.filter(**lookup).first()
+        if job is None:
+            raise CommandError(f"No job {options['job']}")
+
+        started = time.monotonic()
+        written = rescore_job(
+            job, keywords="text" if options["rematch_keywords"] or job.needs_rematch else "stored",
+            batch_size=options["batch_size"],
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"Rescored {written} applications for {job.slug} in {time.monotonic() - started:.1f}s"
+        ))
+
+    def get_queryset(self, options):
+        queryset = Application.objects.filter(job__isnull=False).filter(
+            Q(resume_text__isnull=False) | (Q(resume_url__isnull=False) & ~Q(resume_url=""))
+        )
+
+        if options["job"]:
+            job = options["job"]
+            queryset = queryset.filter(job_id=int(job)) if job.isdigit() else queryset.filter(job__slug=job)
+        if options["since"]:
+            queryset = queryset.filter(applied_at__gte=_parse_since(options["since"]))
+
+        return queryset.order_by("id")
+
+    @contextmanager
+    def worker_pool(self, options, taxonomy, corpus_stats):
+        # yields run(tasks) -> results in task order
+        workers = options["workers"]
+        if workers <= 0:
+            _worker_state.update(taxonomy=taxonomy, corpus_stats=corpus_stats, cache_dir=options["cache_dir"])
+            yield lambda tasks: map(_rescore_task, tasks)
+            return
+
+        # forked children must not share the parent's DB sockets
+        connections.close_all()
+        pool = multiprocessing.Pool(
+            workers, initializer=_init_worker, initargs=(taxonomy, corpus_stats, options["cache_dir"])
+        )
+        try:
+            yield lambda tasks: pool.imap(_rescore_task, tasks, chunksize=max(1, len(tasks) // (workers * 4)))
+            pool.close()
+        except BaseException:
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
+
+    def load_checkpoint(self, path, filters, restart):
+        fresh = {"filters": filters, "last_id": 0, "updated": 0, "failed": 0}
+        if restart or not path.exists():
+            return fresh
+
+        checkpoint = json.loads(path.read_text())
+        if checkpoint.get("filters") != filters:
+            raise CommandError(f"{path} belongs to a run with other filters; pass --restart or another --checkpoint")
+        return checkpoint
+
+    def save_checkpoint(self, path, checkpoint):
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(json.dumps(checkpoint))
+        os.replace(tmp, path)
+
+    def report(self, done, total, started):
+        elapsed = time.monotonic() - started
+        rate = done / elapsed if elapsed else 0.0
+        eta = (total - done) / rate if rate else 0.0
+        self.stdout.write(f"{done}/{total} | {rate:.1f} resumes/s | elapsed {elapsed:.0f}s | eta {eta:.0f}s")
+
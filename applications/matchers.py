@@ -0,0 +1,212 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+
+from applications.document import ResumeDocument
+from applications.normalization import normalize
+
+# =====================================================================
+# ONE-PASS TERM MATCHER
+# =====================================================================
+# Replaces the "one re.search per term" loops while keeping their exact
+# rule: a term is found when re.search(rf"\b{term}\b", text) would have
+# found it.
+#
+#   - plain words ("python", "api") are looked up in the document's token
+#     set: a whole \w+ run is exactly what \bword\b matches
+#   - multi-word or punctuated terms ("django rest framework", "c++",
+#     "node.js") are folded into one character trie, compiled once, and
+#     the text is scanned once -- and only if one of their words occurs
+
+_WORD_CHAR = re.compile(r"\w")
+_WORD_RUN = re.compile(r"\w+")
+
+
+def _is_word_char(ch):
+    return bool(_WORD_CHAR.match(ch))
+
+
+def _trie_pattern(terms):
+    trie = {}
+    for term in terms:
+        node = trie
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[""] = True
+    return _node_pattern(trie)
+
+
+def _node_pattern(node):
+    branches = [
+        re.escape(ch) + _node_pattern(child)
+        for ch, child in sorted(node.items())
+        if ch
+    ]
+    if not branches:
+        return ""
+
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+
+    # greedy "?" tries the longer terms first and backtracks to this one
+    if "" in node:
+        return "(?:" + body + ")?"
+    return body
+
+
+class TermMatcher:
+    """Compiled matcher for a fixed vocabulary.
+
+    ``terms`` maps every surface form (lowercased) to the canonical names it
+    stands for. ``find(text)`` returns the set of canonical names present;
+    ``text`` may be a string or a ResumeDocument.
+    """
+
+    def __init__(self, terms):
+        self.terms = {}
+        for term, canonical in terms.items():
+            if term:
+                self.terms.setdefault(term, set()).update(canonical)
+
+        self._words = {
+            term: frozenset(canonical)
+            for term, canonical in self.terms.items()
+            if _WORD_RUN.fullmatch(term)
+        }
+        self._word_set = frozenset(self._words)
+        compound = {term: canonical for term, canonical in self.terms.items() if term not in self._words}
+
+        # Only the longest term can match at a given position, so every term
+        # that is a boundary-aligned prefix of it is credited along with it.
+        self._closure = {}
+        for term in compound:
+            found = set(compound[term])
+            for i in range(1, len(term)):
+                prefix = term[:i]
+                if prefix in compound and _is_word_char(term[i - 1]) != _is_word_char(term[i]):
+                    found |= compound[prefix]
+            self._closure[term] = frozenset(found)
+
+        # the scan can only succeed if one of these words is a token; terms
+        # without any word character ("++") always need the scan
+        self._scan_words = set()
+        self._always_scan = False
+        for term in compound:
+            words = _WORD_RUN.findall(term)
+            if words:
+                self._scan_words.update(words)
+            else:
+                self._always_scan = True
+
+        self._pattern = None
+        if compound:
+            self._pattern = re.compile(r"\b(?=(" + _trie_pattern(compound) + r")\b)")
+
+    def __len__(self):
+        return len(self.terms)
+
+    def canonical(self, terms):
+        """Canonical names of already normalized ``terms``; unknown terms are kept as written."""
+        found = set()
+        for term in terms:
+            found |= self.terms.get(term) or {term}
+        return frozenset(found)
+
+    def find(self, text):
+        doc = ResumeDocument.wrap(text)
+        found = set()
+        if not self.terms or not doc.text:
+            return found
+
+        for word in doc.tokens & self._word_set:
+            found |= self._words[word]
+
+        if self._pattern and (self._always_scan or not doc.tokens.isdisjoint(self._scan_words)):
+            seen = set()
+            for m in self._pattern.finditer(doc.text):
+                term = m.group(1)
+                if term not in seen:
+                    seen.add(term)
+                    found |= self._closure[term]
+        return found
+
+
+def build_skill_matcher(skill_db):
+    terms = {}
+    for skill, synonyms in skill_db.items():
+        for term in [skill] + synonyms:
+            terms.setdefault(term.lower(), set()).add(skill)
+    return TermMatcher(terms)
+
+
+def build_keyword_matcher(jd_keywords):
+    return TermMatcher({w: {w} for w in normalize(jd_keywords)})
+
+
+# =====================================================================
+# PER-JOB MATCHER CACHE
+# =====================================================================
+# Keyword lists only change when a recruiter edits the job, so compiled
+# matchers are kept per process and keyed by job id + content_version.
+# A save in any worker bumps the version in the DB, which makes every
+# other worker's entry stale on its next lookup.
+#
+# ``version`` picks another per-job version key, and ``max_age`` (seconds)
+# also expires entries for data that changes without one.
+
+def content_version(job):
+    return job.content_version
+
+
+class MatcherCache:
+
+    def __init__(self, build, max_size=512, version=content_version, max_age=None):
+        self.build = build
+        self.max_size = max_size
+        self.version = version
+        self.max_age = max_age
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, job):
+        key = job.pk
+        version = self.version(job)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == version and (self.max_age is None or now - entry[2] < self.max_age):
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return entry[1]
+
+            self.stats["misses"] += 1
+            if entry:
+                # stale version: replaced below
+                self.stats["evictions"] += 1
+
+        value = self.build(job)
+
+        with self._lock:
+            self._entries[key] = (version, value, now)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+        return value
+
+    def invalidate(self, job_id):
+        with self._lock:
+            if self._entries.pop(job_id, None) is not None:
+                self.stats["evictions"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def info(self):
+        with self._lock:
+            return {**self.stats, "size": len(self._entries), "max_size": self.max_size}
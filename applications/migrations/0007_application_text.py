@@ -0,0 +1,22 @@
+# Generated by Django 5.2.8 on 2026-10-17 02:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0006_skill_taxonomy'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationText',
+            fields=[
+                ('application', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='resume_text', serialize=False, to='applications.application')),
+                ('compressed_text', models.BinaryField()),
+                ('text_length', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+    ]
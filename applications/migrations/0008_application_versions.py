@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-10-17 02:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0007_application_text'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='parser_version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='taxonomy_version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-17 02:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0008_application_versions'),
+        ('jobs', '0009_job_scoring_version'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['job', '-match_score', 'id'], name='application_job_rank_idx'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.8 on 2026-10-17 02:33
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0009_application_rank_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('skill', models.CharField(max_length=100)),
+                ('application', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill_index', to='applications.application')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['skill', 'application'], name='application_skill_lookup_idx')],
+                'unique_together': {('application', 'skill')},
+            },
+        ),
+    ]
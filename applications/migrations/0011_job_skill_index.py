@@ -0,0 +1,27 @@
+# Generated by Django 5.2.8 on 2026-10-17 02:35
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0010_application_skill_index'),
+        ('jobs', '0009_job_scoring_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('skill', models.CharField(max_length=100)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill_index', to='jobs.job')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['skill', 'job'], name='job_skill_lookup_idx')],
+                'unique_together': {('job', 'skill')},
+            },
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.8 on 2026-10-17 02:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0011_job_skill_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='KeywordCorpus',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('documents', models.PositiveIntegerField(default=0)),
+                ('terms_version', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='KeywordTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=255, unique=True)),
+                ('document_count', models.PositiveIntegerField(default=0)),
+                ('backfilled', models.BooleanField(default=False)),
+            ],
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-17 02:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0012_keyword_stats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='similarity_score',
+            field=models.FloatField(default=0),
+        ),
+    ]
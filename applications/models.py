@@ -1,5 +1,12 @@
+import zlib
+
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils.functional import cached_property
+from applications.profiles import invalidate_job_profile
 from jobs.models import Job
+from jobs.signals import scoring_fields_changed
 
 STATUS_CHOICES = [
     ("screening", "Screening"),
@@ -32,12 +39,19 @@ class Application(models.Model):
     experience_score = models.FloatField(default=0)
     skill_score = models.FloatField(default=0)
     keyword_score = models.FloatField(default=0)
+    # resume text vs job description, 0 - 100 (applications.similarity)
+    similarity_score = models.FloatField(default=0)
 
 
     summary = models.TextField(blank=True, null=True)
     evaluation = models.TextField(blank=True, null=True)
     fit_category = models.CharField(max_length=20, blank=True, null=True)
 
+    # PARSER_VERSION / skill taxonomy version the fields above came from;
+    # 0 means "before stamping", i.e. always stale
+    parser_version = models.PositiveIntegerField(default=0)
+    taxonomy_version = models.PositiveIntegerField(default=0)
+
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="screening")
     applied_at = models.DateTimeField(auto_now_add=True)
  
@@ -45,3 +59,249 @@ class Application(models.Model):
 
     class Meta:
         unique_together = ("job", "email")  
+        indexes = [
+            # ranked candidates: a job's applications by score, best first
+            models.Index(fields=["job", "-match_score", "id"], name="application_job_rank_idx"),
+        ]
+
+    @property
+    def raw_text(self):
+        # extracted resume text, loaded and decompressed on first access
+        try:
+            return self.resume_text.text
+        except ApplicationText.DoesNotExist:
+            return ""
+
+
+# =====================================================================
+# RAW RESUME TEXT (SIDE TABLE)
+# =====================================================================
+# The extracted text is kept so reparsing / rescoring never has to fetch
+# and decode the PDF again. It lives zlib-compressed in its own table so
+# Application rows stay narrow for list queries.
+
+class ApplicationText(models.Model):
+    application = models.OneToOneField(
+        Application, on_delete=models.CASCADE, primary_key=True, related_name="resume_text"
+    )
+    compressed_text = models.BinaryField()
+    text_length = models.PositiveIntegerField(default=0)
+
+    @staticmethod
+    def compress(text):
+        return zlib.compress(text.encode("utf-8"), 6)
+
+    @staticmethod
+    def decompress(data):
+        return zlib.decompress(data).decode("utf-8")
+
+    @cached_property
+    def text(self):
+        return self.decompress(self.compressed_text)
+
+    @classmethod
+    def build(cls, application, text):
+        return cls(application=application, compressed_text=cls.compress(text), text_length=len(text))
+
+    @classmethod
+    def store(cls, application, text):
+        if not text:
+            return None
+        row, _ = cls.objects.update_or_create(
+            application=application,
+            defaults={"compressed_text": cls.compress(text), "text_length": len(text)},
+        )
+        return row
+
+
+# =====================================================================
+# SKILL -> APPLICATION INDEX
+# =====================================================================
+# One row per canonical skill of an application (see skill_index.py), so
+# "who has any of these skills" is an index lookup instead of a scan of
+# every parsed_skills list.
+
+class ApplicationSkill(models.Model):
+    application = models.ForeignKey(Application, on_delete=models.CASCADE, related_name="skill_index")
+    skill = models.CharField(max_length=100)
+
+    class Meta:
+        unique_together = ("application", "skill")
+        indexes = [
+            models.Index(fields=["skill", "application"], name="application_skill_lookup_idx"),
+        ]
+
+
+# The same for open jobs and their canonical required skills; a
+# soft-deleted job has no rows (see recommendations.py).
+
+class JobSkill(models.Model):
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name="skill_index")
+    skill = models.CharField(max_length=100)
+
+    class Meta:
+        unique_together = ("job", "skill")
+        indexes = [
+            models.Index(fields=["skill", "job"], name="job_skill_lookup_idx"),
+        ]
+
+
+# =====================================================================
+# KEYWORD CORPUS STATISTICS
+# =====================================================================
+# Document frequencies of the JD keywords over the stored resume texts,
+# for the TF-IDF keyword scorer (see keyword_stats.py). Every keyword any
+# job uses is a KeywordTerm; its count is updated as texts are stored.
+
+class KeywordTerm(models.Model):
+    term = models.CharField(max_length=255, unique=True)
+    document_count = models.PositiveIntegerField(default=0)
+    # False until the texts stored before the term existed were counted
+    backfilled = models.BooleanField(default=False)
+
+    def __str__(self):
+        return self.term
+
+
+class KeywordCorpus(models.Model):
+    # single row, pk=1
+    documents = models.PositiveIntegerField(default=0)
+    # bumped when terms are added or recounted
+    terms_version = models.PositiveIntegerField(default=0)
+
+    @classmethod
+    def current(cls):
+        # (documents, terms_version)
+        return cls.objects.filter(pk=1).values_list("documents", "terms_version").first() or (0, 0)
+
+    @classmethod
+    def add_documents(cls, count):
+        if not cls.objects.filter(pk=1).update(documents=models.F("documents") + count):
+            cls.objects.get_or_create(pk=1, defaults={"documents": count})
+
+    @classmethod
+    def bump_terms(cls):
+        if not cls.objects.filter(pk=1).update(terms_version=models.F("terms_version") + 1):
+            cls.objects.get_or_create(pk=1, defaults={"terms_version": 1})
+
+
+# =====================================================================
+# SKILL TAXONOMY
+# =====================================================================
+# Canonical skills and their synonyms. Any change bumps the singleton
+# SkillTaxonomyVersion row; every worker compares that number with the
+# version its compiled matcher was built from and rebuilds lazily.
+# An empty table means "use SKILL_DB from parsing.py".
+
+class Skill(models.Model):
+    name = models.CharField(max_length=100, unique=True)
+    category = models.CharField(max_length=50, blank=True)
+
+    class Meta:
+        ordering = ["name"]
+
+    def __str__(self):
+        return self.name
+
+    def save(self, *args, **kwargs):
+        self.name = " ".join(self.name.lower().split())
+        super().save(*args, **kwargs)
+
+
+class SkillSynonym(models.Model):
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name="synonyms")
+    term = models.CharField(max_length=100)
+
+    class Meta:
+        unique_together = ("skill", "term")
+
+    def __str__(self):
+        return f"{self.term} -> {self.skill.name}"
+
+    def save(self, *args, **kwargs):
+        self.term = " ".join(self.term.lower().split())
+        super().save(*args, **kwargs)
+
+
+class SkillTaxonomyVersion(models.Model):
+    # single row, pk=1
+    version = models.PositiveIntegerField(default=0)
+
+    @classmethod
+    def current(cls):
+        return cls.objects.filter(pk=1).values_list("version", flat=True).first() or 0
+
+    @classmethod
+    def bump(cls):
+        if not cls.objects.filter(pk=1).update(version=models.F("version") + 1):
+            cls.objects.get_or_create(pk=1, defaults={"version": 1})
+
+
+@receiver([post_save, post_delete], sender=Skill)
+@receiver([post_save, post_delete], sender=SkillSynonym)
+def bump_taxonomy_version(sender, **kwargs):
+    # signals rather than save()/delete(): admin bulk deletes skip those
+    SkillTaxonomyVersion.bump()
+
+    # canonical names may have changed; open jobs are few, reindex them all
+    from applications import background
+    from applications.recommendations import reindex_open_jobs
+
+    background.submit(reindex_open_jobs)
+
+
+@receiver(post_save, sender=Application)
+def index_new_application(sender, instance, created, **kwargs):
+    # reparses go through save_rescored(), which reindexes their rows
+    if created:
+        from applications.skill_index import index_application_skills
+
+        index_application_skills([instance])
+
+
+@receiver(post_save, sender=Application)
+def drop_job_components(sender, instance, created, **kwargs):
+    # the what-if preview of this job must include the new applicant
+    if created and instance.job_id:
+        from applications.weights import JOB_COMPONENTS
+
+        JOB_COMPONENTS.invalidate(instance.job_id)
+
+
+@receiver(post_save, sender=Job)
+def drop_job_profile(sender, instance, **kwargs):
+    # this process right away; other workers see the new content_version
+    invalidate_job_profile(instance.pk)
+
+
+@receiver(post_save, sender=ApplicationText)
+def count_stored_text(sender, instance, created, **kwargs):
+    # bulk_create callers record their texts themselves
+    if created:
+        from applications.keyword_stats import schedule_record_documents
+
+        schedule_record_documents([instance.text])
+
+
+@receiver(post_save, sender=Job)
+def register_job_keywords(sender, instance, **kwargs):
+    # new terms are counted over the stored texts in the background
+    from applications.keyword_stats import register_keywords
+
+    register_keywords(instance.jd_keywords)
+
+
+@receiver(post_save, sender=Job)
+def update_job_skill_index(sender, instance, **kwargs):
+    # also clears the rows of a soft-deleted job
+    from applications.recommendations import index_job_skills
+
+    index_job_skills(instance)
+
+
+@receiver(scoring_fields_changed, sender=Job)
+def rescore_job_applicants(sender, job, fields, **kwargs):
+    # background rescore of this job's applicants against the new requirements
+    from applications.bulk_scoring import schedule_job_rescore
+
+    schedule_job_rescore(job, fields)
@@ -0,0 +1,120 @@
+import logging
+
+from django.db import IntegrityError, transaction
+
+from applications.document import resume_document
+from applications.keyword_stats import schedule_record_documents
+from applications.models import Application, ApplicationText
+from applications.parsing import extract_keywords
+from applications.skill_index import index_application_skills
+from applications.utils import compute_match_score, evaluate_candidate, fit_category, generate_summary
+
+logger = logging.getLogger(__name__)
+
+# =====================================================================
+# MULTI-JOB APPLY
+# =====================================================================
+# One resume sent to several openings at once. The PDF is parsed once and
+# uploaded once (all the rows share its resume_url). Each job is scored
+# from the cached job profile, with its JD keywords matched in the same
+# text, and the new rows are written with one bulk_create.
+#
+# bulk_create sends no post_save, so the skill index, the stored text and
+# its keyword statistics are written here for all the rows together. Jobs
+# the candidate already applied to (the unique (job, email) pair) are
+# skipped and reported back one by one.
+
+MAX_JOBS_PER_APPLY = 10
+
+
+def build_application(job, candidate, parsed, resume_url, doc):
+    scoring = compute_match_score(
+        {**parsed, "keywords": extract_keywords(doc, job.jd_keywords, job)}, job
+    )
+    score = scoring["final_score"]
+    return Application(
+        job=job,
+        full_name=candidate["full_name"],
+        email=candidate["email"],
+        phone=candidate["phone"],
+        resume_url=resume_url,
+        parsed_skills=parsed.get("skills"),
+        parsed_experience=parsed.get("experience_years"),
+        parsed_projects=parsed.get("projects"),
+        parsed_education=parsed.get("education"),
+        parsed_certifications=parsed.get("certifications"),
+        match_score=score,
+        skill_score=scoring["skill_score"],
+        experience_score=scoring["experience_score"],
+        keyword_score=scoring["keyword_score"],
+        similarity_score=scoring["similarity_score"],
+        matched_skills=scoring.get("matched_skills", []),
+        missing_skills=scoring.get("missing_skills", []),
+        summary=generate_summary(parsed, score),
+        evaluation=evaluate_candidate(score),
+        fit_category=fit_category(score),
+        # a failed parse stays unstamped and is retried on upgrade
+        parser_version=parsed.get("parser_version", 0),
+        taxonomy_version=parsed.get("taxonomy_version", 0),
+    )
+
+
+def already_applied(jobs, email):
+    return set(Application.objects.filter(job__in=jobs, email=email).values_list("job_id", flat=True))
+
+
+def _insert(rows):
+    # one INSERT; if another request added one of the pairs in between,
+    # fall back to row by row so only that job is reported
+    try:
+        with transaction.atomic():
+            return Application.objects.bulk_create(rows), []
+    except IntegrityError:
+        pass
+
+    created, duplicates = [], []
+    for row in rows:
+        try:
+            with transaction.atomic():
+                created.extend(Application.objects.bulk_create([row]))
+        except IntegrityError:
+            duplicates.append(row.job)
+    return created, duplicates
+
+
+def create_applications(jobs, candidate, parsed, resume_url):
+    """Create one Application per job in ``jobs`` from one parsed resume.
+
+    ``candidate`` holds full_name, email and phone. Returns
+    ``(created applications, jobs already applied to)``.
+    """
+    skip = already_applied(jobs, candidate["email"])
+    duplicates = [job for job in jobs if job.id in skip]
+
+    doc = resume_document(parsed.get("raw_text") or "")
+    rows = [build_application(job, candidate, parsed, resume_url, doc) for job in jobs if job.id not in skip]
+    if not rows:
+        return [], duplicates
+
+    created, raced = _insert(rows)
+    duplicates.extend(raced)
+    if not created:
+        return [], duplicates
+
+    index_application_skills(created)
+
+    # kept for later rescoring; losing it only costs a re-download
+    text = parsed.get("raw_text")
+    if text:
+        try:
+            compressed = ApplicationText.compress(text)
+            ApplicationText.objects.bulk_create([
+                ApplicationText(application=app, compressed_text=compressed, text_length=len(text))
+                for app in created
+            ])
+            # one copy per row, as a recount over the stored texts would see it
+            schedule_record_documents([text] * len(created))
+        except Exception as e:
+            logger.warning(f"Storing resume text failed for applications={[app.id for app in created]}: {e}")
+
+    return created, duplicates
@@ -0,0 +1,20 @@
+import re
+
+# =====================================================================
+# NORMALIZER (SAFE + CONSISTENT)
+# =====================================================================
+# Shared by scoring, the matchers and the job profiles; kept free of
+# other imports so any of them can use it.
+
+def normalize(text):
+    if not text:
+        return []
+
+    if isinstance(text, list):
+        return [" ".join(t.lower().split()) for t in text if t.strip()]
+
+    if isinstance(text, str):
+        parts = re.split(r"[,\n]", text)
+        return [" ".join(p.lower().split()) for p in parts if p.strip()]
+
+    return []
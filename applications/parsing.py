@@ -1,7 +1,17 @@
 import re
 import logging
-import PyPDF2
-from applications.utils import normalize
+import time
+from django.conf import settings
+from django.core.cache import caches
+from applications.matchers import build_keyword_matcher, build_skill_matcher
+from applications import pdf_pool
+from applications.ingest import ResumeBuffer
+from applications.document import ResumeDocument, resume_document
+from applications.pdf_pool import PDFExtractionTimeout
+from applications.pdf_backends import get_backend
+from applications.profiles import job_profile
+from applications.timing import NULL_TIMER, start_timer
+from applications.taxonomy import SkillTaxonomy
 
 logger = logging.getLogger(__name__)
 
@@ -139,44 +149,116 @@ SKILL_DB = {
 "flows": ["salesforce flow"],
 }
 
+# compiled once at import: every skill and synonym in a single pass
+SKILL_MATCHER = build_skill_matcher(SKILL_DB)
+
+# the live taxonomy from the Skill tables, SKILL_MATCHER until they are seeded
+SKILL_TAXONOMY = SkillTaxonomy(fallback_matcher=SKILL_MATCHER)
+
 
 # ================================================================
 # PDF Extraction (LOGGING REQUIRED HERE)
 # ================================================================
 def extract_text_from_pdf(file_input):
-    text = ""
+    return extract_pdf(file_input)[0]
 
-    try:
-        file_input.seek(0)
-        reader = PyPDF2.PdfReader(file_input, strict=False)
 
-        if reader.is_encrypted:
-          raise ValueError("Password-protected PDFs are not allowed. Please upload an unlocked resume.")
+def extract_pdf(file_input):
+    buffer = ResumeBuffer.wrap(file_input)
+
+    # "pool" runs the PDF backend in a worker process with a timeout and memory cap;
+    # spooled uploads are passed by path so the worker maps the file itself
+    if getattr(settings, "PDF_EXTRACTION_MODE", "inline") == "pool":
+        return pdf_pool.extract(buffer.path or buffer.data)
+
+    return read_pdf(buffer.stream())
+
+
+def open_pdf(file_input, backend=None):
+    # backend: a PDFBackend instance, PDF_TEXT_BACKEND when omitted
+    backend = backend or get_backend()
+    return backend.open(file_input)
 
-        for i in range(min(5, len(reader.pages))):
-            try:
-                page_text = reader.pages[i].extract_text()  #built in funtion 
-                if page_text:
-                    text += page_text + "\n"
-            except Exception as e:
-                logger.warning(f"Failed to extract page {i} from {file_input} | error={e}")
-                continue
+
+def iter_pdf_pages(document, max_pages, source=None):
+    # lazy: a page is only decoded when the consumer asks for it
+    for i in range(min(max_pages, document.page_count)):
+        try:
+            yield document.page_text(i)
+        except Exception as e:
+            logger.warning(f"Failed to extract page {i} from {source} | error={e}")
+            yield ""
+
+
+def read_pdf(file_input, backend=None):
+    # Pages are pulled one at a time until the page / character / time
+    # budget runs out. With PDF_REQUIRED_SECTIONS (off by default) reading
+    # also stops after a page where every required section has had its
+    # heading line and the last of them is followed by another heading.
+    # A section that is not required and is still open there (e.g.
+    # "additional information") loses what it has on later pages.
+    backend = backend or get_backend()
+    max_pages = getattr(settings, "PDF_MAX_PAGES", 5)
+    char_budget = getattr(settings, "PDF_TEXT_CHAR_BUDGET", 20000)
+    time_budget = getattr(settings, "PDF_TEXT_TIME_BUDGET", 5.0)
+    required = set(getattr(settings, "PDF_REQUIRED_SECTIONS", []))
+    seen, closed = set(), False
+
+    parts = []
+    stats = {"pages_read": 0, "pages_total": 0, "chars": 0, "bytes_decoded": 0, "stopped_by": "pages"}
+    started = time.monotonic()
+
+    try:
+        document = open_pdf(file_input, backend)
+        stats["pages_total"] = document.page_count
+
+        for page_text in iter_pdf_pages(document, max_pages, file_input):
+            stats["pages_read"] += 1
+            if page_text:
+                parts.append(page_text)
+                stats["chars"] += len(page_text)
+                stats["bytes_decoded"] += len(page_text.encode("utf-8"))
+
+            if required:
+                for line in page_text.split("\n"):
+                    section = heading_section(line)
+                    if section in required:
+                        seen.add(section)
+                        closed = False
+                    elif section is not None:
+                        closed = True
+                # the last required section is followed by another heading
+                # on this page, so it does not go on to the next one
+                if closed and seen >= required:
+                    stats["stopped_by"] = "sections"
+                    break
+            if stats["chars"] >= char_budget:
+                stats["stopped_by"] = "chars"
+                break
+            if time.monotonic() - started >= time_budget:
+                stats["stopped_by"] = "time"
+                break
 
     except Exception as e:
         logger.error(f"PDF extraction crashed for {file_input} | error={e}")
-        return ""
+        return "", stats
 
+    text = "\n".join(parts)
     if not text.strip():
         logger.warning(f"No extractable text found in PDF: {file_input}")
 
-    return text.lower().strip()
+    logger.info(
+        f"PDF extracted: pages={stats['pages_read']}/{stats['pages_total']} "
+        f"bytes={stats['bytes_decoded']} stopped_by={stats['stopped_by']}"
+    )
+    return text.lower().strip(), stats
 
 
 # ================================================================
 # EXTRACTION FUNCTIONS 
 # ================================================================
 def extract_name(text):
-    lines = text.split("\n")
+    lines = ResumeDocument.wrap(text).lines
     BLOCK = ["developer", "engineer", "skills", "experience", "projects", "email", "phone"]
 
     for raw in lines[:10]:
@@ -191,11 +273,13 @@ def extract_name(text):
 
 
 def extract_email(text):
+    text = ResumeDocument.wrap(text).text
     m = re.search(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}", text)
     return m.group(0) if m else None
 
 
 def extract_phone(text):
+    text = ResumeDocument.wrap(text).text
     m = re.search(r"\+?\d[\d\s\-]{6,15}", text)
     if not m:
         return None
@@ -214,6 +298,7 @@ def extract_phone(text):
     return None
 
 def extract_experience(text):
+    text = ResumeDocument.wrap(text).text
     patterns = [
         r"(\d+(?:\.\d+)?)\s*\+?\s*years?",
         r"(\d+(?:\.\d+)?)\s*yrs?",
@@ -221,7 +306,6 @@ def extract_experience(text):
     ]
 
     for p in patterns:
-        print(p)
         m = re.search(p, text)
         if m:
             try:
@@ -240,116 +324,231 @@ def extract_experience(text):
     return 0
 
 
-def extract_skills(text):
-    found = set()
-    for skill, synonyms in SKILL_DB.items():
-        all_terms = [skill] + synonyms
-        for term in all_terms:
-            if re.search(rf"\b{re.escape(term.lower())}\b", text):
-                found.add(skill)
-                break
-    return list(found)
+def extract_skills(text, matcher=None):
+    if matcher is None:
+        _, matcher = SKILL_TAXONOMY.current()
+    return list(matcher.find(text))
 
 
-def extract_keywords(text, jd_keywords):
-    jd = normalize(jd_keywords)
-    found = set()
-    for w in jd:
-        if re.search(rf"\b{re.escape(w)}\b", text):
-            found.add(w)
-    return list(found)
+def extract_keywords(text, jd_keywords, job=None):
+    if job is not None:
+        # compiled once per job version
+        matcher = job_profile(job).keyword_matcher
+    else:
+        matcher = build_keyword_matcher(jd_keywords)
+    return list(matcher.find(text))
 
-def extract_projects(text):
-    lines = text.split("\n")
-    block = []
-    capturing = False
-    STOP = ["education", "experience", "certification", "summary"]
+# ================================================================
+# SECTION SEGMENTER (ONE PASS FOR PROJECTS / EDUCATION / CERTS)
+# ================================================================
+def _keyword_pattern(words):
+    return re.compile("|".join(re.escape(w) for w in words))
+
+
+# section -> (heading keywords, stop keywords, bullet chars stripped)
+SECTION_HEADINGS = {
+    "projects": (
+        _keyword_pattern(["project"]),
+        _keyword_pattern(["education", "experience", "certification", "summary"]),
+        "•*- ",
+    ),
+    "education": (
+        _keyword_pattern(["education", "academic", "qualification"]),
+        _keyword_pattern(["experience", "work", "skills", "projects", "certification"]),
+        "•*-⭐ ",
+    ),
+    "certifications": (
+        _keyword_pattern(["certification", "certifications", "courses", "training"]),
+        _keyword_pattern(["education", "experience", "projects", "skills"]),
+        "•*-⭐ ",
+    ),
+}
 
-    for line in lines:
-        lower = line.lower().strip()
+# heading lines that decide whether read_pdf needs another page; the
+# segmenter's heading keywords plus skills and experience
+REQUIRED_SECTION_HEADINGS = {
+    "skills": _keyword_pattern(["skill"]),
+    "experience": _keyword_pattern(["experience", "employment"]),
+    **{name: heading for name, (heading, _, _) in SECTION_HEADINGS.items()},
+}
+OTHER_SECTION_HEADINGS = _keyword_pattern([
+    "summary", "objective", "profile", "additional information", "languages", "interests",
+    "hobbies", "achievements", "awards", "references", "declaration", "personal details",
+])
 
-        if "project" in lower:
-            capturing = True
-            continue
 
-        if capturing:
-            if any(s in lower for s in STOP):
-                break
-            cleaned = line.strip("•*- ").strip()
-            if cleaned:
-                block.append(cleaned)
+def heading_section(line):
+    # the section a heading line ("TECHNICAL SKILLS", "Education:") opens,
+    # "other" for a known non-required heading, None for body text
+    text = line.strip().lower()
+    if not text or text[0] in "•*-⭐" or any(c.isdigit() for c in text):
+        return None
+    words = text.rstrip(":").split()
+    if len(words) > 4:
+        return None
+    text = " ".join(words)
+    for name, heading in REQUIRED_SECTION_HEADINGS.items():
+        if heading.search(text):
+            return name
+    return "other" if OTHER_SECTION_HEADINGS.search(text) else None
 
-    return "\n".join(block) if block else None
 
+_IDLE, _CAPTURING, _DONE = 0, 1, 2
 
 
-def extract_education(text):
-    lines = text.split("\n")
-    block = []
-    capturing = False
-    KEYWORDS = ["education", "academic", "qualification"]
-    STOP = ["experience", "work", "skills", "projects", "certification"]
+def segment_sections(text):
+    # Each section captures the lines after its first heading, skips later
+    # heading lines and stops for good at the first stop keyword.
+    state = {name: _IDLE for name in SECTION_HEADINGS}
+    blocks = {name: [] for name in SECTION_HEADINGS}
+    open_sections = len(SECTION_HEADINGS)
 
-    for line in lines:
+    for line in ResumeDocument.wrap(text).lines:
         lower = line.lower().strip()
 
-        if any(k in lower for k in KEYWORDS):
-            capturing = True
-            continue
+        for name, (heading, stop, bullets) in SECTION_HEADINGS.items():
+            if state[name] == _DONE:
+                continue
 
-        if capturing:
-            if any(s in lower for s in STOP):
-                break
-            cleaned = line.strip("•*-⭐ ").strip()
-            if cleaned:
-                block.append(cleaned)
+            if heading.search(lower):
+                state[name] = _CAPTURING
+                continue
 
-    return "\n".join(block) if block else None
+            if state[name] == _CAPTURING:
+                if stop.search(lower):
+                    state[name] = _DONE
+                    open_sections -= 1
+                    continue
+                cleaned = line.strip(bullets).strip()
+                if cleaned:
+                    blocks[name].append(cleaned)
 
+        if not open_sections:
+            break
 
-def extract_certifications(text):
-    lines = text.split("\n")
-    block = []
-    capturing = False
-    KEYWORDS = ["certification", "certifications", "courses", "training"]
-    STOP = ["education", "experience", "projects", "skills"]
+    return {name: "\n".join(block) if block else None for name, block in blocks.items()}
 
-    for line in lines:
-        lower = line.lower().strip()
 
-        if any(k in lower for k in KEYWORDS):
-            capturing = True
-            continue
+def extract_projects(text):
+    return segment_sections(text)["projects"]
 
-        if capturing:
-            if any(s in lower for s in STOP):
-                break
-            cleaned = line.strip("•*-⭐ ").strip()
-            if cleaned:
-                block.append(cleaned)
 
-    return "\n".join(block) if block else None
+def extract_education(text):
+    return segment_sections(text)["education"]
+
+
+def extract_certifications(text):
+    return segment_sections(text)["certifications"]
 
 
 # ================================================================
-# MASTER PARSER (LOGGING REQUIRED ONLY FOR CRASH)
+# PARSE CACHE (KEYED BY FILE CONTENT)
 # ================================================================
-def parse_resume(file_input, job=None):
-    text = extract_text_from_pdf(file_input)
+# The same PDF is often uploaded to several jobs. Everything except the
+# JD keywords is job-independent, so it is cached under the SHA-256 of
+# the file in a cache shared by all workers. Bump PARSER_VERSION whenever
+# an extractor changes output so old entries are ignored.
+PARSER_VERSION = 2
+PARSE_CACHE_ALIAS = "resume_parse"
 
-    # DO NOT CRASH FOR EMPTY TEXT
 
+def _parse_cache():
+    if PARSE_CACHE_ALIAS not in settings.CACHES:
+        return None
+    return caches[PARSE_CACHE_ALIAS]
+
+
+def _parse_cache_key(digest, taxonomy_version):
+    # backends differ in whitespace and glyph handling, so each has its own
+    # entries; a taxonomy edit changes the skills, so it starts fresh entries
+    backend = getattr(settings, "PDF_TEXT_BACKEND", "pypdf2")
+    return f"resume-parse:v{PARSER_VERSION}:t{taxonomy_version}:{backend}:{digest}"
+
+
+def parse_resume_base(file_input, timer=NULL_TIMER, skill_matcher=None):
+    text, extraction = timer.run("extract_pdf", extract_pdf, file_input)
+
+    base = parse_resume_text(text, timer, skill_matcher)
+    base["extraction"] = extraction
+    return base
+
+
+def parse_resume_text(text, timer=NULL_TIMER, skill_matcher=None):
+    # everything after PDF extraction; also used on stored ApplicationText
+
+    # lines and tokens are derived once and shared by every extractor
+    doc = resume_document(text)
+
+    # DO NOT CRASH FOR EMPTY TEXT
+    sections = timer.run("sections", segment_sections, doc)
 
     return {
-        "name": extract_name(text),
-        "email": extract_email(text),
-        "phone": extract_phone(text),
-        "skills": extract_skills(text),
-        "experience_years": extract_experience(text),
-        "keywords": extract_keywords(text, job.jd_keywords if job else []),
-        "projects": extract_projects(text),
-        "education": extract_education(text),
-        "certifications": extract_certifications(text),
+        "name": timer.run("name", extract_name, doc),
+        "email": timer.run("email", extract_email, doc),
+        "phone": timer.run("phone", extract_phone, doc),
+        "skills": timer.run("skills", extract_skills, doc, skill_matcher),
+        "experience_years": timer.run("experience", extract_experience, doc),
+        "projects": sections["projects"],
+        "education": sections["education"],
+        "certifications": sections["certifications"],
         "raw_text": text,
+        "extraction": None,
     }
 
+
+def get_parsed_base(file_input, timer=NULL_TIMER, taxonomy=None):
+    # taxonomy: (version, matcher) from SKILL_TAXONOMY.current()
+    buffer = ResumeBuffer.wrap(file_input)
+    taxonomy_version, skill_matcher = taxonomy or SKILL_TAXONOMY.current()
+
+    cache = _parse_cache()
+    if cache is None:
+        return parse_resume_base(buffer, timer, skill_matcher)
+
+    key = _parse_cache_key(buffer.digest(), taxonomy_version)
+
+    with timer.stage("cache_get"):
+        try:
+            base = cache.get(key)
+        except Exception as e:
+            logger.warning(f"Parse cache read failed | error={e}")
+            base = None
+
+    if base is not None:
+        return base
+
+    base = parse_resume_base(buffer, timer, skill_matcher)
+
+    # empty text may be a transient extraction failure, do not pin it
+    if base["raw_text"]:
+        with timer.stage("cache_set"):
+            try:
+                cache.set(key, base)
+            except Exception as e:
+                logger.warning(f"Parse cache write failed | error={e}")
+
+    return base
+
+
+# ================================================================
+# MASTER PARSER (LOGGING REQUIRED ONLY FOR CRASH)
+# ================================================================
+def parse_resume(file_input, job=None):
+    timer = start_timer()
+    taxonomy = SKILL_TAXONOMY.current()
+    parsed = dict(get_parsed_base(file_input, timer, taxonomy))
+
+    # stamped on the Application so stale rows can be found and upgraded
+    parsed["parser_version"] = PARSER_VERSION
+    parsed["taxonomy_version"] = taxonomy[0]
+
+    # job-dependent: always recomputed
+    parsed["keywords"] = timer.run(
+        "keywords", extract_keywords, resume_document(parsed["raw_text"]), job.jd_keywords if job else [], job
+    )
+
+    # only when PARSER_TIMING_ENABLED; never stored in the parse cache
+    timings = timer.finish("parse_resume")
+    if timings is not None:
+        parsed["timings"] = timings
+    return parsed
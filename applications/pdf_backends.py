@@ -0,0 +1,143 @@
+import importlib
+import io
+
+from django.conf import settings
+
+# =====================================================================
+# PDF TEXT BACKENDS
+# =====================================================================
+# read_pdf only needs three things from a PDF library: open a stream,
+# count the pages and pull the text of one page at a time. Each backend
+# wraps one library behind that interface; PDF_TEXT_BACKEND picks one.
+#
+# Backends whose library is not installed are skipped by
+# available_backends(), so bench_pdf_backends runs whatever is present.
+
+ENCRYPTED_MESSAGE = "Password-protected PDFs are not allowed. Please upload an unlocked resume."
+
+
+class PDFDocument:
+    """An opened PDF: ``page_count`` and lazy ``page_text(i)``."""
+
+    def __init__(self, page_count, page_text):
+        self.page_count = page_count
+        self.page_text = page_text
+
+
+class PDFBackend:
+    name = ""
+    module = ""
+
+    @classmethod
+    def is_available(cls):
+        try:
+            importlib.import_module(cls.module)
+        except ImportError:
+            return False
+        return True
+
+    def open(self, stream):
+        raise NotImplementedError
+
+
+class PyPDF2Backend(PDFBackend):
+    name = "pypdf2"
+    module = "PyPDF2"
+
+    def open(self, stream):
+        import PyPDF2
+
+        stream.seek(0)
+        reader = PyPDF2.PdfReader(stream, strict=False)
+        if reader.is_encrypted:
+            raise ValueError(ENCRYPTED_MESSAGE)
+        return PDFDocument(len(reader.pages), lambda i: reader.pages[i].extract_text() or "")
+
+
+class PypdfBackend(PDFBackend):
+    # the maintained successor of PyPDF2, same reader API
+    name = "pypdf"
+    module = "pypdf"
+
+    def open(self, stream):
+        import pypdf
+
+        stream.seek(0)
+        reader = pypdf.PdfReader(stream, strict=False)
+        if reader.is_encrypted:
+            raise ValueError(ENCRYPTED_MESSAGE)
+        return PDFDocument(len(reader.pages), lambda i: reader.pages[i].extract_text() or "")
+
+
+class PyMuPDFBackend(PDFBackend):
+    name = "pymupdf"
+    module = "fitz"
+
+    def open(self, stream):
+        import fitz
+
+        stream.seek(0)
+        doc = fitz.open(stream=stream.read(), filetype="pdf")
+        if doc.needs_pass:
+            raise ValueError(ENCRYPTED_MESSAGE)
+        return PDFDocument(doc.page_count, lambda i: doc[i].get_text() or "")
+
+
+class PdfminerBackend(PDFBackend):
+    name = "pdfminer"
+    module = "pdfminer.high_level"
+
+    def open(self, stream):
+        from pdfminer.converter import TextConverter
+        from pdfminer.layout import LAParams
+        from pdfminer.pdfdocument import PDFDocument as MinerDocument, PDFPasswordIncorrect
+        from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+        from pdfminer.pdfpage import PDFPage
+        from pdfminer.pdfparser import PDFParser
+
+        stream.seek(0)
+        try:
+            document = MinerDocument(PDFParser(stream))
+        except PDFPasswordIncorrect:
+            raise ValueError(ENCRYPTED_MESSAGE) from None
+        pages = list(PDFPage.create_pages(document))
+
+        # one interpreter over the document parsed above, as extract_text
+        # sets it up, instead of extract_text(page_numbers=[i]) parsing the
+        # whole file again for every page
+        manager = PDFResourceManager()
+        output = io.StringIO()
+        interpreter = PDFPageInterpreter(manager, TextConverter(manager, output, laparams=LAParams()))
+        texts = []
+
+        def page_text(i):
+            # pages are asked for in order; each is interpreted once
+            while len(texts) <= i:
+                output.seek(0)
+                output.truncate()
+                interpreter.process_page(pages[len(texts)])
+                texts.append(output.getvalue())
+            return texts[i]
+
+        return PDFDocument(len(pages), page_text)
+
+
+BACKENDS = {
+    backend.name: backend
+    for backend in (PyPDF2Backend, PypdfBackend, PyMuPDFBackend, PdfminerBackend)
+}
+
+DEFAULT_BACKEND = PyPDF2Backend.name
+
+
+def get_backend(name=None):
+    name = name or getattr(settings, "PDF_TEXT_BACKEND", DEFAULT_BACKEND)
+    try:
+        backend = BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown PDF_TEXT_BACKEND {name!r}, expected one of {sorted(BACKENDS)}") from None
+    return backend()
+
+
+def available_backends():
+    return [name for name, backend in BACKENDS.items() if backend.is_available()]
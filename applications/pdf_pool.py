@@ -0,0 +1,127 @@
+import atexit
+import logging
+import multiprocessing
+import signal
+import threading
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+# =====================================================================
+# OUT-OF-PROCESS PDF EXTRACTION
+# =====================================================================
+# PDF_EXTRACTION_MODE = "pool" moves the PDF backend out of the request thread.
+# Each worker process:
+#   - may grow its address space by at most PDF_EXTRACTION_MAX_MEMORY_MB
+#   - aborts a document after PDF_EXTRACTION_TIMEOUT seconds (SIGALRM)
+#   - is replaced after PDF_EXTRACTION_MAX_TASKS_PER_CHILD documents
+# If a worker is stuck somewhere the alarm cannot reach, the caller stops
+# waiting shortly after the timeout and the whole pool is recycled.
+
+class PDFExtractionTimeout(ValueError):
+    pass
+
+
+class _Deadline(BaseException):
+    # BaseException so the per-page "except Exception" in the extractor
+    # cannot swallow it
+    pass
+
+
+TIMEOUT_MESSAGE = "Resume processing took too long. Please upload a simpler PDF."
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _address_space_size():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[0]) * resource.getpagesize()
+    except (OSError, ValueError, AttributeError):
+        return 0
+
+
+def _init_worker(max_memory_mb):
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    if resource and max_memory_mb:
+        # headroom on top of what the forked worker already maps
+        limit = _address_space_size() + max_memory_mb * 1024 * 1024
+        try:
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        except (ValueError, OSError) as e:
+            logger.warning(f"Could not cap PDF worker memory | error={e}")
+
+
+def _on_alarm(signum, frame):
+    raise _Deadline()
+
+
+def _extract_in_worker(source, timeout):
+    import io
+    from applications.parsing import read_pdf
+
+    use_alarm = hasattr(signal, "SIGALRM")
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+
+    try:
+        if isinstance(source, str):
+            with open(source, "rb") as f:
+                return read_pdf(f)
+        return read_pdf(io.BytesIO(source))
+    except _Deadline:
+        raise PDFExtractionTimeout(TIMEOUT_MESSAGE) from None
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def _get_pool():
+    global _pool
+
+    with _pool_lock:
+        if _pool is None:
+            _pool = multiprocessing.Pool(
+                processes=getattr(settings, "PDF_EXTRACTION_WORKERS", 2),
+                initializer=_init_worker,
+                initargs=(getattr(settings, "PDF_EXTRACTION_MAX_MEMORY_MB", 512),),
+                maxtasksperchild=getattr(settings, "PDF_EXTRACTION_MAX_TASKS_PER_CHILD", 50),
+            )
+        return _pool
+
+
+def shutdown():
+    global _pool
+
+    with _pool_lock:
+        if _pool is not None:
+            _pool.terminate()
+            _pool.join()
+            _pool = None
+
+
+atexit.register(shutdown)
+
+
+def extract(source):
+    # source: PDF bytes, or the path of a file the worker can open itself
+    timeout = getattr(settings, "PDF_EXTRACTION_TIMEOUT", 15)
+    result = _get_pool().apply_async(_extract_in_worker, (source, timeout))
+
+    try:
+        # grace period for the in-worker alarm to fire first
+        return result.get(timeout + 2)
+    except multiprocessing.TimeoutError:
+        logger.error(f"PDF worker unresponsive after {timeout}s, recycling pool")
+        shutdown()
+        raise PDFExtractionTimeout(TIMEOUT_MESSAGE) from None
@@ -0,0 +1,98 @@
+from django.conf import settings
+from django.utils.functional import cached_property
+
+from applications.matchers import MatcherCache, build_keyword_matcher
+from applications.normalization import normalize
+
+# =====================================================================
+# COMPILED JOB PROFILES
+# =====================================================================
+# Everything scoring reads from a job, normalized once per job version
+# instead of on every application: the required-skill and JD keyword
+# sets, the compiled keyword matcher, the experience bounds, the
+# keyword scorer with its weights, the component weights and the hashed
+# description vector for text similarity.
+#
+# Profiles are kept per process in an LRU keyed by job id and
+# content_version. Job.save() bumps the version in the database, so two
+# concurrent edits never share one (stale entries in other workers miss
+# on their next lookup), and the saving process also drops its own entry
+# right away. Unsaved jobs get a fresh, uncached profile.
+
+
+def score_weights(job):
+    # (skill, experience, keyword, similarity) as fractions: 50 -> 0.5
+    return tuple(getattr(job, name) / 100 for name in job.WEIGHT_FIELDS)
+
+
+class JobProfile:
+
+    def __init__(self, job):
+        self.job_id = job.pk
+        self.version = job.content_version
+        self.required_skills = frozenset(normalize(job.required_skills))
+        self.jd_keywords = frozenset(normalize(job.jd_keywords))
+        self.min_experience = job.min_experience
+        self.max_experience = job.max_experience
+        self.keyword_scorer = job.keyword_scorer
+        self.score_weights = score_weights(job)
+        self.description = job.description or ""
+        self.has_description = bool(self.description.strip())
+        self._canonical = (None, None)
+        self._weights = (None, None)
+
+    def __repr__(self):
+        return f"<JobProfile job={self.job_id} v{self.version}>"
+
+    @cached_property
+    def keyword_matcher(self):
+        # compiled on first use: scoring alone only needs the sets
+        return build_keyword_matcher(sorted(self.jd_keywords))
+
+    @cached_property
+    def description_vector(self):
+        from applications.similarity import text_vector
+
+        return text_vector(self.description)
+
+    def canonical_skills(self, skill_matcher):
+        """Required skills mapped to the taxonomy's canonical names.
+
+        "k8s" becomes "kubernetes" when it is a synonym in ``skill_matcher``
+        (SKILL_TAXONOMY.current()[1]); terms the taxonomy does not know are
+        kept as written. Remembered for the last matcher passed in.
+        """
+        matcher, canonical = self._canonical
+        if matcher is not skill_matcher:
+            canonical = skill_matcher.canonical(self.required_skills)
+            self._canonical = (skill_matcher, canonical)
+        return canonical
+
+    def keyword_weights(self, corpus_stats):
+        """JD keywords with their idf (KeywordWeights) for the TF-IDF scorer.
+
+        Remembered for the last snapshot passed in (KEYWORD_STATS.current()).
+        """
+        from applications.keyword_stats import KeywordWeights
+
+        stats, weights = self._weights
+        if stats is not corpus_stats:
+            weights = KeywordWeights(self.jd_keywords, corpus_stats)
+            self._weights = (corpus_stats, weights)
+        return weights
+
+
+JOB_PROFILES = MatcherCache(
+    JobProfile,
+    max_size=getattr(settings, "JOB_PROFILE_CACHE_SIZE", 512),
+)
+
+
+def job_profile(job):
+    if job.pk is None or job._state.adding:
+        return JobProfile(job)
+    return JOB_PROFILES.get(job)
+
+
+def invalidate_job_profile(job_id):
+    JOB_PROFILES.invalidate(job_id)
@@ -0,0 +1,105 @@
+from django.db.models import Case, Count, F, FloatField, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Cast
+
+from applications.models import Application
+
+# =====================================================================
+# RANKED CANDIDATES (TOP K PER JOB)
+# =====================================================================
+# A job's applicants best first: ORDER BY match_score DESC, id, read from
+# the (job, -match_score, id) index, with keyset pagination. The cursor is
+# the (match_score, id) of the last row shown; the next page starts right
+# after it, so it costs the same however deep the recruiter pages.
+#
+# Each row carries its percentile rank within the job, the value
+# PERCENT_RANK() OVER (ORDER BY match_score) would give it: the share of
+# the job's other applicants scoring strictly lower. It is computed in the
+# query for the K rows returned only, as
+#
+#     (applicants - applicants scoring >= this one) / (applicants - 1)
+#
+# Both counts are index range scans from the top of the job's scores, so
+# they stay small for the candidates near the top that this is used for.
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(application):
+    return f"{application.match_score!r}:{application.id}"
+
+
+def decode_cursor(cursor):
+    try:
+        score, app_id = cursor.split(":")
+        return float(score), int(app_id)
+    except (AttributeError, ValueError):
+        raise InvalidCursor(f"Invalid cursor: {cursor!r}")
+
+
+def parse_limit(value):
+    try:
+        limit = int(value) if value not in (None, "") else DEFAULT_LIMIT
+    except (TypeError, ValueError):
+        limit = DEFAULT_LIMIT
+    return max(1, min(limit, MAX_LIMIT))
+
+
+def _job_count(job, exclude=None, **filters):
+    # COUNT(*) over the job's applications as a scalar subquery
+    applications = Application.objects.filter(job=job, **filters)
+    if exclude is not None:
+        applications = applications.exclude(exclude)
+    return Subquery(
+        applications
+        .order_by()
+        .values("job")
+        .annotate(n=Count("id"))
+        .values("n")
+    )
+
+
+def with_percentile(queryset, job, exclude=None):
+    """Annotate ``percentile`` (0.0 - 1.0) within ``job`` on each row.
+
+    Applications matching the ``exclude`` Q are not counted.
+    """
+    total = _job_count(job, exclude)
+    at_or_above = _job_count(job, exclude, match_score__gte=OuterRef("match_score"))
+    return queryset.alias(job_applicants=total).annotate(
+        percentile=Case(
+            When(job_applicants__gt=1, then=(
+                Cast(F("job_applicants") - at_or_above, FloatField())
+                / Cast(F("job_applicants") - 1, FloatField())
+            )),
+            default=Value(0.0),
+            output_field=FloatField(),
+        )
+    )
+
+
+def ranked_applications(queryset, job, limit=DEFAULT_LIMIT, after=None, exclude=None):
+    """One page of ``job``'s applications in ``queryset``, best first.
+
+    ``after`` is a cursor from a previous page (see encode_cursor).
+    Applications matching the ``exclude`` Q (e.g. upgrades.pending_filter())
+    are left out of the ranking and the percentiles. Returns
+    ``(rows, next_cursor)``; next_cursor is None on the last page.
+    """
+    qs = queryset.filter(job=job).order_by("-match_score", "id")
+    if exclude is not None:
+        qs = qs.exclude(exclude)
+    if after:
+        score, app_id = decode_cursor(after)
+        qs = qs.filter(Q(match_score__lt=score) | Q(match_score=score, id__gt=app_id))
+
+    # one extra row tells whether there is a next page
+    rows = list(with_percentile(qs, job, exclude)[:limit + 1])
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return rows, encode_cursor(rows[-1])
+    return rows, None
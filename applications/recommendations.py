@@ -0,0 +1,92 @@
+from django.db import transaction
+
+from applications.document import resume_document
+from applications.models import JobSkill
+from applications.normalization import normalize
+from applications.parsing import SKILL_TAXONOMY, extract_keywords
+from applications.profiles import JobProfile
+from applications.utils import compute_match_score, fit_category
+from jobs.models import Job
+
+# =====================================================================
+# JOB RECOMMENDATIONS FOR ONE RESUME
+# =====================================================================
+# The reverse of scoring applicants for a job: one parsed resume scored
+# against the open jobs it could fit.
+#
+# JobSkill indexes every open job under the canonical names of its
+# required skills. The rows are rewritten whenever a Job is saved. A
+# soft-deleted job has no rows. A taxonomy change reindexes all open jobs
+# in the background.
+#
+# The resume is parsed once. Only jobs sharing at least one canonical
+# skill with it are loaded and scored. Jobs without required skills
+# therefore never appear. Keywords are matched per job in the same parsed
+# text, using each job's cached keyword matcher.
+
+DEFAULT_RECOMMENDATIONS = 10
+MAX_RECOMMENDATIONS = 50
+
+
+def job_index_terms(job, skill_matcher):
+    if job.is_deleted:
+        return frozenset()
+    # not job_profile(): indexing a save should not fill the scoring cache
+    return JobProfile(job).canonical_skills(skill_matcher)
+
+
+def index_job_skills(job):
+    """Bring ``job``'s JobSkill rows in line with its required skills."""
+    _, matcher = SKILL_TAXONOMY.current()
+    wanted = {skill[:100] for skill in job_index_terms(job, matcher)}
+    current = set(JobSkill.objects.filter(job=job).values_list("skill", flat=True))
+    if wanted == current:
+        return
+
+    with transaction.atomic():
+        JobSkill.objects.filter(job=job, skill__in=current - wanted).delete()
+        JobSkill.objects.bulk_create(
+            [JobSkill(job=job, skill=skill) for skill in wanted - current], ignore_conflicts=True
+        )
+
+
+def reindex_open_jobs():
+    for job in Job.objects.filter(is_deleted=False).iterator():
+        index_job_skills(job)
+    # soft-deleted jobs should have none; clear any left behind
+    JobSkill.objects.filter(job__is_deleted=True).delete()
+
+
+def candidate_jobs(parsed):
+    """Open jobs sharing at least one canonical skill with the parsed resume."""
+    _, matcher = SKILL_TAXONOMY.current()
+    skills = matcher.canonical(normalize(parsed.get("skills")))
+    if not skills:
+        return Job.objects.none()
+
+    return Job.objects.filter(
+        is_deleted=False,
+        id__in=JobSkill.objects.filter(skill__in=skills).values("job_id"),
+    )
+
+
+def recommend_jobs(parsed, limit=DEFAULT_RECOMMENDATIONS):
+    """Best ``limit`` open jobs for a resume parsed by parse_resume().
+
+    Returns ``[{"job": Job, **compute_match_score fields, "fit_category"}]``,
+    best first.
+    """
+    doc = resume_document(parsed.get("raw_text") or "")
+    results = []
+    for job in candidate_jobs(parsed):
+        scoring = compute_match_score(
+            {**parsed, "keywords": extract_keywords(doc, job.jd_keywords, job)}, job
+        )
+        results.append({
+            "job": job,
+            **scoring,
+            "fit_category": fit_category(scoring["final_score"]),
+        })
+
+    results.sort(key=lambda r: (-r["final_score"], r["job"].id))
+    return results[:limit]
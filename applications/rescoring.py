@@ -0,0 +1,130 @@
+import logging
+from pathlib import Path
+
+from applications.document import resume_document
+from applications.parsing import PARSER_VERSION, SKILL_TAXONOMY, extract_keywords, extract_pdf, parse_resume_text
+from applications.utils import compute_match_score, evaluate_candidate, fit_category, generate_summary
+
+logger = logging.getLogger(__name__)
+
+# =====================================================================
+# RESCORING STORED APPLICATIONS
+# =====================================================================
+# Shared by the rescore command and anything else that recomputes an
+# Application from its resume. Everything here except save_rescored() is
+# free of DB access so it can run in worker processes, given the skill
+# taxonomy and (for TF-IDF jobs) the keyword corpus snapshot.
+
+# every Application field derived from the resume + job
+RESCORED_FIELDS = [
+    "parsed_skills",
+    "parsed_experience",
+    "parsed_projects",
+    "parsed_education",
+    "parsed_certifications",
+    "match_score",
+    "skill_score",
+    "experience_score",
+    "keyword_score",
+    "similarity_score",
+    "matched_skills",
+    "missing_skills",
+    "summary",
+    "evaluation",
+    "fit_category",
+    "parser_version",
+    "taxonomy_version",
+]
+
+
+def scored_fields(parsed, job, corpus_stats=None):
+    """Application field values for a parse result scored against ``job``."""
+    scoring = compute_match_score(parsed, job, corpus_stats)
+    score = scoring["final_score"]
+
+    return {
+        "parsed_skills": parsed.get("skills"),
+        "parsed_experience": parsed.get("experience_years"),
+        "parsed_projects": parsed.get("projects"),
+        "parsed_education": parsed.get("education"),
+        "parsed_certifications": parsed.get("certifications"),
+        "match_score": score,
+        "skill_score": scoring["skill_score"],
+        "experience_score": scoring["experience_score"],
+        "keyword_score": scoring["keyword_score"],
+        "similarity_score": scoring["similarity_score"],
+        "matched_skills": scoring["matched_skills"],
+        "missing_skills": scoring["missing_skills"],
+        "summary": generate_summary(parsed, score),
+        "evaluation": evaluate_candidate(score),
+        "fit_category": fit_category(score),
+    }
+
+
+def fetch_resume(resume_url, cache_dir=None):
+    """PDF bytes for a stored resume, read through a local mirror if given.
+
+    ``cache_dir`` mirrors the bucket layout (``<job-slug>/<uuid>.pdf``); a
+    miss is downloaded once and written there for the next run.
+    """
+    from applications.supabase_client import download_resume, resume_path
+
+    cached = Path(cache_dir) / resume_path(resume_url) if cache_dir else None
+    if cached and cached.exists():
+        return cached.read_bytes()
+
+    data = download_resume(resume_url)
+
+    if cached:
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        cached.write_bytes(data)
+    return data
+
+
+def rescore_text(text, job, taxonomy=None, corpus_stats=None):
+    """Reparse extracted resume text and score it against ``job``.
+
+    ``taxonomy`` is a (version, matcher) pair from SKILL_TAXONOMY.current()
+    and ``corpus_stats`` a KEYWORD_STATS.current() snapshot; workers get
+    both from the parent. Returns the field values, stamped with
+    the versions used, or None for empty text; an empty parse must not
+    overwrite what the application already holds.
+    """
+    if not text:
+        return None
+
+    taxonomy_version, skill_matcher = taxonomy or SKILL_TAXONOMY.current()
+    parsed = parse_resume_text(text, skill_matcher=skill_matcher)
+    parsed["keywords"] = extract_keywords(resume_document(text), job.jd_keywords, job)
+
+    fields = scored_fields(parsed, job, corpus_stats)
+    fields["parser_version"] = PARSER_VERSION
+    fields["taxonomy_version"] = taxonomy_version
+    return fields
+
+
+def rescore_resume(data, job, taxonomy=None, corpus_stats=None):
+    """Extract PDF bytes, then rescore; returns (fields, extracted text)."""
+    text, _ = extract_pdf(data)
+    return rescore_text(text, job, taxonomy, corpus_stats), text
+
+
+def save_rescored(updates, texts):
+    """Write rescored Applications and newly extracted ApplicationText rows."""
+    from django.db import transaction
+
+    from applications.models import Application, ApplicationText
+    from applications.keyword_stats import schedule_record_documents
+    from applications.skill_index import index_application_skills
+
+    with transaction.atomic():
+        Application.objects.bulk_update(updates, RESCORED_FIELDS)
+        # first rescore of an old application: keep its text for next time
+        replaced = ApplicationText.objects.filter(application_id__in=[t.application_id for t in texts])
+        counted = set(replaced.values_list("application_id", flat=True))
+        replaced.delete()
+        ApplicationText.objects.bulk_create(texts)
+        # a replaced text is already in the keyword statistics
+        schedule_record_documents([t.text for t in texts if t.application_id not in counted])
+        # the reparse may have found different skills
+        index_application_skills(updates, replace=True)
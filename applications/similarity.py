@@ -0,0 +1,102 @@
+import math
+import re
+import zlib
+from collections import Counter
+
+import numpy as np
+from django.conf import settings
+
+# =====================================================================
+# TEXT SIMILARITY (HASHED N-GRAMS)
+# =====================================================================
+# Skills and JD keywords only count exact terms, so a resume that says
+# "built REST services" misses a job asking for "API development". The
+# similarity component compares the whole resume text with the job
+# description instead, with no model or external service:
+#
+#   - features: words, word pairs and the 4-character pieces of each word
+#     ("developer" shares "<dev", "deve", "evel" ... with "development"),
+#     English stopwords left out;
+#   - each feature is hashed (CRC32) to one of SIMILARITY_DIMENSIONS
+#     columns, with a sign from another hash bit so collisions tend to
+#     cancel; the weight is 1 + ln(count);
+#   - vectors are L2-normalized, so cosine similarity is a dot product,
+#     and a batch of resumes against one job is one matrix product.
+#
+# similarity_score = 100 * cosine, clipped to 0 - 100 and rounded to 2
+# places. A job's description vector is built once per job version
+# (JobProfile.description_vector); a resume's once per text
+# (ResumeDocument.similarity_vector).
+
+_WORD = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+STOPWORDS = frozenset("""
+a about above after all also am an and any are as at be been being both but by can could did do does
+doing during each etc for from had has have having he her here hers him his how i if in into is it its
+itself just me more most my no nor not now of off on once only or other our ours out over own per same
+she should so some such than that the their theirs them then there these they this those through to
+too under until up us very via was we were what when where which while who whom why will with within
+would you your yours
+""".split())
+
+
+def dimensions():
+    # a power of two, so a hash maps to a column with one mask
+    return 1 << max(8, int(math.log2(getattr(settings, "SIMILARITY_DIMENSIONS", 8192))))
+
+
+def features(text):
+    words = [w for w in _WORD.findall((text or "").lower()) if w not in STOPWORDS]
+    found = Counter(f"w:{w}" for w in words)
+    found.update(f"b:{a} {b}" for a, b in zip(words, words[1:]))
+    for word in words:
+        padded = f"<{word}>"
+        found.update(f"c:{padded[i:i + 4]}" for i in range(len(padded) - 3))
+    return found
+
+
+def text_vector(text):
+    """The normalized hashed n-gram vector of ``text`` (float32, all zeros if empty)."""
+    size = dimensions()
+    vector = np.zeros(size, dtype=np.float32)
+    found = features(text)
+    if not found:
+        return vector
+
+    hashes = np.fromiter((zlib.crc32(f.encode("utf-8")) for f in found), dtype=np.uint32, count=len(found))
+    weights = 1 + np.log(np.fromiter(found.values(), dtype=np.float32, count=len(found)))
+    signs = np.where(hashes >> 31, -1, 1).astype(np.float32)
+    np.add.at(vector, hashes & (size - 1), signs * weights)
+
+    norm = np.linalg.norm(vector)
+    if norm:
+        vector /= norm
+    return vector
+
+
+def similarity_scores(resume_vectors, job_vector):
+    """0 - 100 per row of ``resume_vectors`` (one per resume), as a list."""
+    if not len(resume_vectors):
+        return []
+    cosine = np.asarray(resume_vectors, dtype=np.float32) @ job_vector
+    return [round(value, 2) for value in (np.clip(cosine, 0, 1) * 100).astype(np.float64).tolist()]
+
+
+def similarity_score_for(document, profile):
+    """``document``: ResumeDocument (or None); ``profile``: the job's JobProfile."""
+    if document is None or not document.text or not profile.has_description:
+        return 0.0
+    return similarity_scores(document.similarity_vector[np.newaxis, :], profile.description_vector)[0]
+
+
+def batch_similarity_scores(documents, profile):
+    """similarity_score_for over many documents with one matrix product; None scores 0."""
+    rows = [i for i, doc in enumerate(documents) if doc is not None and doc.text]
+    scores = [0.0] * len(documents)
+    if not rows or not profile.has_description:
+        return scores
+
+    matrix = np.stack([documents[i].similarity_vector for i in rows])
+    for i, score in zip(rows, similarity_scores(matrix, profile.description_vector)):
+        scores[i] = score
+    return scores
@@ -0,0 +1,147 @@
+import numpy as np
+
+from applications.bulk_scoring import BulkScorer
+from applications.document import ResumeDocument
+from applications.models import Application, ApplicationSkill, ApplicationText
+from applications.normalization import normalize
+from applications.parsing import SKILL_TAXONOMY, extract_keywords
+from applications.profiles import job_profile
+from applications.similarity import batch_similarity_scores
+from applications.utils import fit_category
+
+# =====================================================================
+# SKILL -> APPLICATION INDEX (REVERSE MATCHING)
+# =====================================================================
+# Every application's parsed skills are stored once more as canonical
+# names in ApplicationSkill: written when an application is created and
+# again whenever a reparse rewrites its skills (save_rescored). Rows saved
+# before the index existed are added by `manage.py index_application_skills`.
+#
+# find_matching_candidates() uses it to match a job against applications
+# made to *other* jobs. Only applicants who share at least one canonical
+# required skill with the job are loaded and scored. Scoring uses
+# BulkScorer, so a score is exactly what compute_match_score would give
+# the applicant for this job. The exceptions are JD keywords and text
+# similarity: they come from the stored resume text, and an applicant with
+# no stored text scores 0 on both.
+#
+# Reading the text is the expensive step, so it runs best-first and stops
+# early. Skills and experience are scored for every candidate first, and
+# keywords and similarity can add at most their weights (20 points by
+# default) on top.
+# Candidates are then checked in order of that upper bound, and the search
+# stops once the next bound cannot beat the current limit-th best one.
+
+MATCH_BATCH_SIZE = 100
+
+
+def index_application_skills(applications, replace=False):
+    """Write the canonical skill rows of ``applications``.
+
+    ``replace=True`` drops their existing rows first (after a reparse).
+    """
+    _, matcher = SKILL_TAXONOMY.current()
+    rows = [
+        ApplicationSkill(application_id=app.id, skill=skill[:100])
+        for app in applications
+        for skill in matcher.canonical(normalize(app.parsed_skills))
+    ]
+    if replace:
+        ApplicationSkill.objects.filter(application_id__in=[app.id for app in applications]).delete()
+    ApplicationSkill.objects.bulk_create(rows, ignore_conflicts=True)
+    return len(rows)
+
+
+def candidate_queryset(job, queryset):
+    """Applications in ``queryset`` sharing a required skill with ``job``, minus its own applicants."""
+    _, matcher = SKILL_TAXONOMY.current()
+    wanted = job_profile(job).canonical_skills(matcher)
+    if not wanted:
+        return queryset.none()
+
+    return (
+        queryset.filter(id__in=ApplicationSkill.objects.filter(skill__in=wanted).values("application_id"))
+        .exclude(job=job)
+        .exclude(email__in=Application.objects.filter(job=job).values("email"))
+    )
+
+
+def _stored_documents(ids):
+    # each application's stored resume text, None without one
+    blobs = dict(ApplicationText.objects.filter(application_id__in=ids).values_list("application_id", "compressed_text"))
+    return [
+        ResumeDocument(ApplicationText.decompress(bytes(blobs[app_id]))) if app_id in blobs else None
+        for app_id in ids
+    ]
+
+
+def find_matching_candidates(job, queryset, limit=20):
+    """Best ``limit`` existing candidates for ``job`` among ``queryset``.
+
+    One entry per email (the applicant's best-matching application), best
+    first. Each entry holds the Application and its scores for ``job``.
+    """
+    rows = list(
+        candidate_queryset(job, queryset)
+        .order_by("id")
+        .values_list("id", "email", "parsed_skills", "parsed_experience")
+    )
+    if not rows:
+        return []
+
+    ids, emails, skills, experience = map(list, zip(*rows))
+    scorer = BulkScorer(job)
+
+    # score without keywords, plus the most keywords could add
+    skill_score, _, _ = scorer.skill_scores(skills)
+    skill_weight, experience_weight, keyword_weight, similarity_weight = scorer.profile.score_weights
+    bound = np.minimum(
+        100,
+        skill_score * skill_weight + scorer.experience_scores(experience) * experience_weight
+        + 100 * (keyword_weight + similarity_weight),
+    )
+    order = np.lexsort((np.asarray(ids), -bound)).tolist()
+
+    best = {}
+    for start in range(0, len(order), MATCH_BATCH_SIZE):
+        if len(best) >= limit:
+            kth = sorted((entry["match_score"] for entry in best.values()), reverse=True)[limit - 1]
+            # scores are rounded to 2 places; the margin keeps ties in
+            if bound[order[start]] + 0.005 < kth:
+                break
+
+        batch = order[start:start + MATCH_BATCH_SIZE]
+        documents = _stored_documents([ids[i] for i in batch])
+        found = [
+            extract_keywords(doc, job.jd_keywords, job) if doc is not None and scorer.jd_keywords else []
+            for doc in documents
+        ]
+        scores = scorer.score(
+            [skills[i] for i in batch],
+            [experience[i] for i in batch],
+            keywords=found,
+            similarity_score=batch_similarity_scores(documents, scorer.profile),
+        )
+        for n, i in enumerate(batch):
+            entry = {
+                "application_id": ids[i],
+                "match_score": scores["final_score"][n],
+                "skill_score": scores["skill_score"][n],
+                "experience_score": scores["experience_score"][n],
+                "keyword_score": scores["keyword_score"][n],
+                "similarity_score": scores["similarity_score"][n],
+                "matched_skills": scores["matched_skills"][n],
+                "missing_skills": scores["missing_skills"][n],
+            }
+            current = best.get(emails[i])
+            if current is None or (entry["match_score"], -entry["application_id"]) > (
+                current["match_score"], -current["application_id"]
+            ):
+                best[emails[i]] = entry
+
+    top = sorted(best.values(), key=lambda e: (-e["match_score"], e["application_id"]))[:limit]
+    applications = Application.objects.select_related("job").in_bulk([e["application_id"] for e in top])
+    for entry in top:
+        entry["application"] = applications[entry.pop("application_id")]
+        entry["fit_category"] = fit_category(entry["match_score"])
+    return top
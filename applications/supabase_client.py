@@ -1,6 +1,8 @@
 from supabase import create_client
 import os
 import uuid
+from urllib.parse import unquote, urlsplit
+from applications.ingest import ResumeBuffer
 
 supabase = create_client(
     os.getenv("SUPABASE_URL"),
@@ -10,23 +12,49 @@ supabase = create_client(
 BUCKET = os.getenv("SUPABASE_BUCKET", "resumes")
 
 def upload_resume(file, job_slug):
+    # file: a ResumeBuffer shared with the parser (an UploadedFile also works;
+    # the buffer wrapped around it here is closed here too)
+    buffer = ResumeBuffer.wrap(file)
+    owns_buffer = buffer is not file
 
-    ext = file.name.split(".")[-1].lower() #resume.pdf->ext = pdf
+    ext = buffer.name.split(".")[-1].lower() #resume.pdf->ext = pdf
     filename = f"{job_slug}/{uuid.uuid4()}.{ext}"  #python-backend-developer/3f8c8d2a-92d4-4e1a-b9c2-45df.pdf
 
-    file.seek(0)
-    file_bytes = file.read()
+    body = buffer.upload_body()
 
     try:
         supabase.storage.from_(BUCKET).upload(
             path=filename,
-            file=file_bytes,
+            file=body,
             file_options={
                 "content-type": "application/pdf",
                 "x-upsert": "false",
             },
         )
     except Exception as e:
-        raise Exception(f" upload failed: {e}")
+        raise Exception(f"Upload failed: {e}")
+    finally:
+        if body is not buffer.data:
+            body.close()
+        if owns_buffer:
+            buffer.close()
 
     return supabase.storage.from_(BUCKET).get_public_url(filename)
+
+
+def resume_path(resume_url):
+    # public URL -> object path: .../object/public/<bucket>/<job-slug>/<uuid>.pdf
+    marker = f"/object/public/{BUCKET}/"
+    path = urlsplit(resume_url or "").path
+    if marker not in path:
+        raise ValueError(f"Not a {BUCKET} bucket URL: {resume_url}")
+    return unquote(path.split(marker, 1)[1])
+
+
+def download_resume(resume_url):
+    try:
+        return supabase.storage.from_(BUCKET).download(resume_path(resume_url))
+    except ValueError:
+        raise
+    except Exception as e:
+        raise Exception(f" download failed: {e}")
@@ -0,0 +1,56 @@
+import logging
+import threading
+
+from applications.matchers import build_skill_matcher
+from applications.models import Skill, SkillSynonym, SkillTaxonomyVersion
+
+logger = logging.getLogger(__name__)
+
+# =====================================================================
+# COMPILED SKILL TAXONOMY (PER PROCESS)
+# =====================================================================
+# The skill matcher is compiled from the Skill / SkillSynonym tables and
+# kept in memory together with the taxonomy version it was built from.
+# Each parse reads the version (one primary-key lookup); only when it
+# changed does the worker reload the tables and recompile. Until the
+# tables are seeded (`python manage.py import_skills`) the built-in
+# SKILL_DB matcher is used.
+
+
+def load_skill_db():
+    skill_db = {name: [] for name in Skill.objects.values_list("name", flat=True)}
+    for name, term in SkillSynonym.objects.values_list("skill__name", "term"):
+        skill_db[name].append(term)
+    return skill_db
+
+
+class SkillTaxonomy:
+
+    def __init__(self, fallback_matcher):
+        self.fallback_matcher = fallback_matcher
+        self._version = None
+        self._matcher = None
+        self._lock = threading.Lock()
+        self.stats = {"builds": 0}
+
+    def current(self):
+        """Return (taxonomy version, compiled matcher), rebuilding if stale."""
+        version = SkillTaxonomyVersion.current()
+        if version == self._version:
+            return version, self._matcher
+
+        with self._lock:
+            if version != self._version:
+                skill_db = load_skill_db()
+                matcher = build_skill_matcher(skill_db) if skill_db else self.fallback_matcher
+                self._version, self._matcher = version, matcher
+                self.stats["builds"] += 1
+                logger.info(f"Skill matcher compiled | taxonomy_version={version} terms={len(matcher)}")
+
+            return version, self._matcher
+
+    def clear(self):
+        with self._lock:
+            self._version = None
+            self._matcher = None
+            self.stats = {"builds": 0}
@@ -1,11 +1,62 @@
+import hashlib
+import io
+import json
+import re
+import shutil
+import signal
+import tempfile
+import time
+from pathlib import Path
+from unittest import skipUnless
 from unittest.mock import patch
 
-from django.core.files.uploadedfile import SimpleUploadedFile
-from django.test import TestCase
+from django.conf import settings
+from django.core.cache import caches
+from django.core.management import call_command
+
+from django.core.files.uploadedfile import SimpleUploadedFile, TemporaryUploadedFile
+from django.test import TestCase, override_settings
 from django.urls import reverse
 
-from applications.models import Application
-from applications.utils import compute_match_score
+from applications.bulk_scoring import BulkScorer, rescore_job, rounded
+from applications.management.commands.bench_bulk_scoring import synthetic_applicants
+from applications.management.commands.bench_skills import legacy_extract_skills
+from applications import pdf_pool
+from applications.pdf_backends import PDFBackend, PDFDocument, available_backends, get_backend
+from applications.document import ResumeDocument, resume_document
+from applications.ingest import ResumeBuffer
+from applications.keyword_stats import KEYWORD_STATS
+from applications.models import (
+    Application,
+    ApplicationText,
+    KeywordCorpus,
+    KeywordTerm,
+    Skill,
+    SkillSynonym,
+    SkillTaxonomyVersion,
+)
+from applications.parsing import (
+    SKILL_DB,
+    SKILL_MATCHER,
+    SKILL_TAXONOMY,
+    PDFExtractionTimeout,
+    extract_certifications,
+    extract_education,
+    extract_experience,
+    extract_keywords,
+    extract_name,
+    extract_projects,
+    extract_skills,
+    extract_pdf,
+    parse_resume,
+    read_pdf,
+    segment_sections,
+)
+from applications.profiles import JOB_PROFILES, JobProfile, job_profile
+from applications.weights import JOB_COMPONENTS, rerank
+from applications.timing import collect_timings
+from applications import upgrades
+from applications.utils import compute_match_score, fit_category, generate_summary
 from jobs.models import Job
 from users.models import User
 
@@ -173,3 +224,1777 @@ class ApplicationWorkflowTests(TestCase):
 
         listed_ids = {app.id for app in response.context["applications_page"].object_list}
         self.assertEqual(listed_ids, {app_one.id, app_two.id})
+
+
+class SkillMatcherTests(TestCase):
+    def test_overlapping_terms_are_all_credited(self):
+        text = "built apis with django rest framework and node.js"
+
+        self.assertCountEqual(
+            extract_skills(text),
+            ["django", "django rest framework", "nodejs", "javascript"],
+        )
+
+    def test_matches_regex_loop_for_every_term(self):
+        for skill, synonyms in SKILL_DB.items():
+            for term in [skill] + synonyms:
+                for text in [f"skills: {term}, git", f"{term}x", f"x{term} {term}"]:
+                    self.assertCountEqual(
+                        extract_skills(text), legacy_extract_skills(text), msg=text
+                    )
+
+
+class ResumeDocumentTests(TestCase):
+    TEXT = "asha rao\nasha@example.com\n3 years with c++, node.js and django rest framework\nskills\npython"
+
+    def test_views_are_computed_once(self):
+        doc = ResumeDocument(self.TEXT)
+
+        self.assertIs(doc.tokens, doc.tokens)
+        self.assertIs(doc.lines, doc.lines)
+        self.assertIn("node", doc.tokens)
+        self.assertIs(resume_document(self.TEXT), resume_document(self.TEXT))
+
+    def test_extractors_give_same_result_for_document_and_string(self):
+        doc = ResumeDocument(self.TEXT)
+
+        for extractor in [extract_name, extract_experience, extract_skills, segment_sections]:
+            result, expected = extractor(doc), extractor(self.TEXT)
+            if isinstance(result, list):
+                result, expected = sorted(result), sorted(expected)
+            self.assertEqual(result, expected, msg=extractor.__name__)
+
+    def test_keyword_lookup_matches_word_boundary_regex(self):
+        keywords = ["api", "rest api", "c++", "ci/cd", "++", "a.b"]
+        texts = ["rest api", "rest  api", "c++ dev", "c++dev", "ci/cd", "x++y", "a.b.c", "apis", "_api"]
+
+        for text in texts:
+            expected = {w for w in keywords if re.search(rf"\b{re.escape(w)}\b", text)}
+            self.assertEqual(set(extract_keywords(ResumeDocument(text), keywords)), expected, msg=text)
+
+
+class SkillTaxonomyTests(TestCase):
+    def setUp(self):
+        SKILL_TAXONOMY.clear()
+        caches["resume_parse"].clear()
+        self.addCleanup(SKILL_TAXONOMY.clear)
+
+    def test_empty_table_falls_back_to_skill_db(self):
+        self.assertEqual(SkillTaxonomyVersion.current(), 0)
+        self.assertCountEqual(extract_skills("python and k8s"), ["python", "kubernetes"])
+
+    def test_import_command_seeds_skill_db(self):
+        call_command("import_skills", stdout=io.StringIO())
+
+        self.assertEqual(Skill.objects.count(), len(SKILL_DB))
+        self.assertEqual(SkillSynonym.objects.count(), sum(len(s) for s in SKILL_DB.values()))
+        self.assertEqual(SkillTaxonomyVersion.current(), 1)
+
+        text = "django rest framework, node.js, k8s, sf integration"
+        self.assertCountEqual(extract_skills(text), legacy_extract_skills(text))
+
+        # idempotent
+        call_command("import_skills", stdout=io.StringIO())
+        self.assertEqual(Skill.objects.count(), len(SKILL_DB))
+
+    def test_edit_bumps_version_and_matcher_rebuilds_lazily(self):
+        call_command("import_skills", stdout=io.StringIO())
+        self.assertNotIn("rust", extract_skills("rust and python"))
+        self.assertNotIn("rust", extract_skills("rust and python"))
+        self.assertEqual(SKILL_TAXONOMY.stats["builds"], 1)
+
+        rust = Skill.objects.create(name="Rust")
+        SkillSynonym.objects.create(skill=rust, term="rustlang")
+
+        self.assertEqual(SkillTaxonomyVersion.current(), 3)
+        self.assertIn("rust", extract_skills("rustlang and python"))
+        self.assertEqual(SKILL_TAXONOMY.stats["builds"], 2)
+
+        rust.delete()
+        self.assertNotIn("rust", extract_skills("rust and python"))
+
+    def test_taxonomy_edit_invalidates_parse_cache(self):
+        with open(SAMPLE_RESUME, "rb") as f:
+            before = parse_resume(f)
+
+        Skill.objects.create(name="mumbai")
+        with open(SAMPLE_RESUME, "rb") as f:
+            after = parse_resume(f)
+
+        self.assertNotIn("mumbai", before["skills"])
+        self.assertEqual(after["skills"], ["mumbai"])
+
+
+class JobProfileCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        recruiter = User.objects.create_user(
+            email="cache-recruiter@example.com",
+            password="CacheRecruiter123!",
+            role="RECRUITER",
+        )
+        cls.job = Job.objects.create(
+            title="Backend Developer",
+            slug="backend-developer",
+            description="Backend role",
+            location="Pune",
+            work_mode="onsite",
+            employment_type="full_time",
+            created_by=recruiter,
+            jd_keywords=["api", "Backend", "rest api"],
+        )
+
+    def setUp(self):
+        JOB_PROFILES.clear()
+
+    def test_matcher_is_compiled_once_per_job_version(self):
+        text = "designed rest api backends and a backend api"
+
+        first = extract_keywords(text, self.job.jd_keywords, self.job)
+        second = extract_keywords(text, self.job.jd_keywords, self.job)
+
+        self.assertCountEqual(first, ["api", "backend", "rest api"])
+        self.assertCountEqual(second, first)
+        self.assertEqual(JOB_PROFILES.info()["misses"], 1)
+        self.assertEqual(JOB_PROFILES.info()["hits"], 1)
+
+    def test_new_content_version_rebuilds_matcher(self):
+        extract_keywords("api", self.job.jd_keywords, self.job)
+
+        self.job.jd_keywords = ["django"]
+        self.job.content_version += 1
+        found = extract_keywords("django api", self.job.jd_keywords, self.job)
+
+        self.assertEqual(found, ["django"])
+        self.assertEqual(JOB_PROFILES.info()["evictions"], 1)
+
+    def test_profile_holds_normalized_job_data(self):
+        self.job.required_skills = [" Python ", "K8S", "django"]
+        self.job.min_experience = 2
+        profile = JobProfile(self.job)
+
+        self.assertEqual(profile.required_skills, {"python", "k8s", "django"})
+        self.assertEqual(profile.jd_keywords, {"api", "backend", "rest api"})
+        self.assertEqual((profile.min_experience, profile.max_experience), (2, None))
+        self.assertEqual(profile.canonical_skills(SKILL_MATCHER), {"python", "kubernetes", "django"})
+
+    def test_scoring_reuses_the_profile_until_the_job_is_saved(self):
+        parsed = {"skills": ["python"], "experience_years": 2, "keywords": ["api"]}
+
+        first = compute_match_score(parsed, self.job)
+        compute_match_score(parsed, self.job)
+        self.assertEqual(JOB_PROFILES.info()["misses"], 1)
+        self.assertIs(job_profile(self.job), job_profile(self.job))
+
+        self.job.jd_keywords = ["api"]
+        self.job.save()
+        self.assertNotIn(self.job.pk, JOB_PROFILES._entries)
+
+        self.assertEqual(first["keyword_score"], 33.33)
+        self.assertEqual(compute_match_score(parsed, self.job)["keyword_score"], 100.0)
+
+
+class SectionSegmenterTests(TestCase):
+    RESUME = "\n".join([
+        "asha rao",
+        "projects",
+        "• smart ats - resume parser",
+        "- inventory api",
+        "education",
+        "b.tech computer science",
+        "certifications",
+        "⭐ aws cloud practitioner",
+        "experience",
+        "2 years at acme",
+    ])
+
+    def test_single_pass_returns_every_section(self):
+        sections = segment_sections(self.RESUME)
+
+        self.assertEqual(sections["projects"], "smart ats - resume parser\ninventory api")
+        self.assertEqual(sections["education"], "b.tech computer science")
+        self.assertEqual(sections["certifications"], "aws cloud practitioner")
+
+    def test_missing_heading_gives_none(self):
+        text = "asha rao\nprojects\nsmart ats\nexperience\n2 years"
+
+        self.assertEqual(extract_projects(text), "smart ats")
+        self.assertIsNone(extract_education(text))
+        self.assertIsNone(extract_certifications(text))
+
+
+SAMPLE_RESUME = Path(settings.BASE_DIR) / "media" / "resumes" / "python-developer-junior" / "neha-gupta.pdf"
+
+
+@skipUnless(hasattr(signal, "SIGALRM"), "pool timeouts need SIGALRM")
+@override_settings(PDF_EXTRACTION_MODE="pool", PDF_EXTRACTION_WORKERS=1, PDF_EXTRACTION_TIMEOUT=0.5)
+class PDFExtractionPoolTests(TestCase):
+    def setUp(self):
+        pdf_pool.shutdown()
+        self.addCleanup(pdf_pool.shutdown)
+
+    def test_pool_matches_inline_extraction(self):
+        with open(SAMPLE_RESUME, "rb") as f:
+            pooled = extract_pdf(f)
+            inline = read_pdf(f)
+
+        self.assertTrue(pooled[0])
+        self.assertEqual(pooled, inline)
+
+    def test_slow_document_fails_cleanly(self):
+        # workers are forked after the patch, so they inherit it
+        with patch("applications.parsing.read_pdf", side_effect=lambda f: time.sleep(30)):
+            with open(SAMPLE_RESUME, "rb") as f:
+                with self.assertRaises(PDFExtractionTimeout):
+                    extract_pdf(f)
+
+        self.assertTrue(issubclass(PDFExtractionTimeout, ValueError))
+
+
+class ParseCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        recruiter = User.objects.create_user(
+            email="parse-cache@example.com",
+            password="ParseCache123!",
+            role="RECRUITER",
+        )
+        job_fields = dict(
+            description="Backend role",
+            location="Pune",
+            work_mode="onsite",
+            employment_type="full_time",
+            created_by=recruiter,
+        )
+        cls.django_job = Job.objects.create(
+            title="Django Developer", slug="django-dev", jd_keywords=["django"], **job_fields
+        )
+        cls.git_job = Job.objects.create(
+            title="Git Developer", slug="git-dev", jd_keywords=["git", "kubernetes"], **job_fields
+        )
+
+    def setUp(self):
+        caches["resume_parse"].clear()
+
+    def test_same_file_is_parsed_once_and_rescored_per_job(self):
+        with patch("applications.parsing.extract_pdf", wraps=extract_pdf) as extract:
+            with open(SAMPLE_RESUME, "rb") as f:
+                first = parse_resume(f, self.django_job)
+            with open(SAMPLE_RESUME, "rb") as f:
+                second = parse_resume(f, self.git_job)
+
+        extract.assert_called_once()
+        self.assertEqual(first["skills"], second["skills"])
+        self.assertEqual(first["raw_text"], second["raw_text"])
+        self.assertEqual(first["keywords"], ["django"])
+        self.assertEqual(second["keywords"], ["git"])
+
+
+class BudgetedPDFExtractionTests(TestCase):
+    TWO_PAGE_RESUME = Path(settings.BASE_DIR) / "media" / "resumes" / "python-developer-junior" / "priya-mehta.pdf"
+
+    def test_reports_pages_and_bytes(self):
+        with open(self.TWO_PAGE_RESUME, "rb") as f:
+            text, stats = read_pdf(f)
+
+        self.assertEqual(stats["pages_total"], 2)
+        self.assertGreaterEqual(stats["bytes_decoded"], len(text))
+
+    TWO_PAGE_RESUMES = [
+        SAMPLE_RESUME.with_name(name)
+        for name in ("priya-mehta.pdf", "python-junior-dev-ajay.pdf", "vikram-singh.pdf", "rohan_patel_python_developer_resume.pdf")
+    ]
+
+    def read_pages(self, *pages):
+        class PagesBackend(PDFBackend):
+            def open(self, stream):
+                return PDFDocument(len(pages), lambda i: pages[i])
+
+        return read_pdf(None, backend=PagesBackend())
+
+    def assert_budgeted_equals_full(self):
+        for path in self.TWO_PAGE_RESUMES:
+            with self.subTest(path.name), open(path, "rb") as f:
+                budgeted, stats = read_pdf(f)
+                with override_settings(PDF_REQUIRED_SECTIONS=[]):
+                    f.seek(0)
+                    full, _ = read_pdf(f)
+                self.assertEqual(stats["pages_total"], 2)
+                self.assertEqual(budgeted, full)
+
+    def test_budgeted_extraction_equals_full_extraction(self):
+        self.assert_budgeted_equals_full()
+
+    @override_settings(PDF_REQUIRED_SECTIONS=["skills", "experience", "education", "projects", "certifications"])
+    def test_section_words_in_body_text_do_not_stop_reading(self):
+        self.assert_budgeted_equals_full()
+
+    @override_settings(PDF_REQUIRED_SECTIONS=["skills", "experience"])
+    def test_stops_once_a_heading_follows_the_required_sections(self):
+        text, stats = self.read_pages(
+            "Technical Skills\nPython, Django\nExperience\nDeveloper at Acme",
+            "Built an API\nEducation\nB.Tech",
+            "Languages\nEnglish",
+        )
+
+        self.assertEqual(stats["pages_read"], 2)
+        self.assertEqual(stats["stopped_by"], "sections")
+        self.assertIn("built an api", text)
+
+    @override_settings(PDF_REQUIRED_SECTIONS=["skills", "experience"])
+    def test_section_words_in_body_text_are_not_headings(self):
+        _, stats = self.read_pages(
+            "Summary\nExperience building APIs with strong skills in Python\nSkills\nPython\nEducation",
+            "Experience\nDeveloper at Acme",
+        )
+
+        self.assertEqual(stats["pages_read"], 2)
+        self.assertEqual(stats["stopped_by"], "pages")
+
+    @override_settings(PDF_REQUIRED_SECTIONS=[], PDF_TEXT_CHAR_BUDGET=10)
+    def test_character_budget_limits_pages(self):
+        with open(self.TWO_PAGE_RESUME, "rb") as f:
+            _, stats = read_pdf(f)
+
+        self.assertEqual(stats["pages_read"], 1)
+        self.assertEqual(stats["stopped_by"], "chars")
+
+
+class PDFBackendTests(TestCase):
+    def test_default_backend_is_pypdf2(self):
+        self.assertEqual(get_backend().name, "pypdf2")
+        self.assertIn("pypdf2", available_backends())
+
+    def test_unknown_backend_is_rejected(self):
+        with self.assertRaises(ValueError):
+            get_backend("nope")
+
+    @override_settings(PDF_TEXT_BACKEND="pypdf")
+    @skipUnless("pypdf" in available_backends(), "pypdf not installed")
+    def test_backend_is_selected_from_settings(self):
+        with open(SAMPLE_RESUME, "rb") as f:
+            with patch("applications.pdf_backends.PyPDF2Backend.open") as pypdf2_open:
+                text, stats = read_pdf(f)
+
+        pypdf2_open.assert_not_called()
+        self.assertTrue(text)
+        self.assertIn("python", extract_skills(text))
+
+    @skipUnless("pdfminer" in available_backends(), "pdfminer.six not installed")
+    def test_pdfminer_pages_match_extract_text(self):
+        from pdfminer.high_level import extract_text
+
+        with open(SAMPLE_RESUME, "rb") as f:
+            document = get_backend("pdfminer").open(f)
+            pages = [document.page_text(i) for i in range(document.page_count)]
+            expected = [extract_text(f, page_numbers=[i]) for i in range(document.page_count)]
+
+        self.assertEqual(pages, expected)
+
+    def test_benchmark_reports_every_backend(self):
+        out = io.StringIO()
+        call_command("bench_pdf_backends", corpus=str(SAMPLE_RESUME.parent), rounds=1, stdout=out)
+
+        for name in available_backends():
+            self.assertIn(name, out.getvalue())
+
+
+class ParserBenchmarkTests(TestCase):
+    def test_corpus_is_reproducible_and_results_compare(self):
+        tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, tmp)
+
+        for name in ["a", "b"]:
+            call_command(
+                "bench_parser", count=3, rounds=1, corpus_dir=str(tmp / name),
+                output=str(tmp / f"{name}.json"), stdout=io.StringIO(),
+            )
+
+        manifest = lambda name: json.loads((tmp / name / "seed42-n3" / "manifest.json").read_text())
+        self.assertEqual(
+            [(f["file"], f["bytes"]) for f in manifest("a")["files"]],
+            [(f["file"], f["bytes"]) for f in manifest("b")["files"]],
+        )
+
+        results = json.loads((tmp / "a.json").read_text())
+        self.assertIn("extract_pdf", results["stages"])
+        self.assertIn("score", results["stages"])
+        self.assertGreater(results["resumes_per_sec"], 0)
+
+        out = io.StringIO()
+        call_command("bench_parser", compare=[str(tmp / "a.json"), str(tmp / "b.json")], stdout=out)
+        self.assertIn("resumes/sec", out.getvalue())
+
+
+class StageTimingTests(TestCase):
+    def setUp(self):
+        caches["resume_parse"].clear()
+        self.job = Job(required_skills=["python"], jd_keywords=["django"], min_experience=1, max_experience=3)
+
+    def test_timings_are_off_by_default(self):
+        with collect_timings() as records, open(SAMPLE_RESUME, "rb") as f:
+            parsed = parse_resume(f, self.job)
+            scoring = compute_match_score(parsed, self.job)
+
+        self.assertNotIn("timings", parsed)
+        self.assertNotIn("timings", scoring)
+        self.assertEqual(records, [])
+
+    @override_settings(PARSER_TIMING_ENABLED=True, PARSER_TIMING_SINKS=[])
+    def test_enabled_timings_reach_result_and_sinks(self):
+        with collect_timings() as records, open(SAMPLE_RESUME, "rb") as f:
+            parsed = parse_resume(f, self.job)
+            scoring = compute_match_score(parsed, self.job)
+
+        for stage in ["extract_pdf", "skills", "sections", "keywords", "total"]:
+            self.assertIn(stage, parsed["timings"])
+        self.assertIn("skill_score", scoring["timings"])
+        self.assertEqual([event for event, _ in records], ["parse_resume", "compute_match_score"])
+        self.assertIs(records[0][1], parsed["timings"])
+
+        # a cache hit gets fresh timings, not the ones of the first parse
+        with open(SAMPLE_RESUME, "rb") as f:
+            cached = parse_resume(f, self.job)
+
+        self.assertIn("cache_get", cached["timings"])
+        self.assertNotIn("extract_pdf", cached["timings"])
+
+    @override_settings(PARSER_TIMING_ENABLED=True, PARSER_TIMING_SINKS=["applications.timing.does_not_exist"])
+    def test_broken_sink_does_not_break_parsing(self):
+        with open(SAMPLE_RESUME, "rb") as f:
+            parsed = parse_resume(f, self.job)
+
+        self.assertIn("total", parsed["timings"])
+
+    def test_experience_extraction_does_not_print(self):
+        with patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            self.assertEqual(extract_experience("5 years of python"), 5.0)
+
+        self.assertEqual(stdout.getvalue(), "")
+
+
+class RescoreApplicationsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.job = Job.objects.create(
+            title="Rescore Job",
+            slug="rescore-job",
+            description="Python role",
+            location="Pune",
+            work_mode="remote",
+            employment_type="full_time",
+            required_skills=["python", "django"],
+            jd_keywords=["api"],
+            min_experience=0,
+            max_experience=3,
+        )
+        cls.apps = [
+            Application.objects.create(
+                job=cls.job,
+                full_name=f"Candidate {i}",
+                email=f"candidate{i}@example.com",
+                phone="9999999999",
+                resume_url=f"https://x.supabase.co/storage/v1/object/public/resumes/rescore-job/{i}.pdf",
+            )
+            for i in range(3)
+        ]
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp)
+        (self.tmp / "cache" / "rescore-job").mkdir(parents=True)
+        for i in range(2):
+            shutil.copy(SAMPLE_RESUME, self.tmp / "cache" / "rescore-job" / f"{i}.pdf")
+
+    def _run(self, **options):
+        err = io.StringIO()
+        with patch("applications.supabase_client.download_resume", side_effect=Exception("offline")):
+            call_command(
+                "rescore_applications", cache_dir=str(self.tmp / "cache"),
+                checkpoint=str(self.tmp / "checkpoint.json"), stdout=io.StringIO(), stderr=err, **options,
+            )
+        return err.getvalue()
+
+    def test_rescores_from_local_cache_and_keeps_failures(self):
+        errors = self._run(workers=0, batch_size=1)
+
+        for app in self.apps:
+            app.refresh_from_db()
+        self.assertIn("python", self.apps[0].parsed_skills)
+        self.assertGreater(self.apps[1].match_score, 0)
+        self.assertIsNone(self.apps[2].parsed_skills)
+        self.assertIn("offline", errors)
+        self.assertFalse((self.tmp / "checkpoint.json").exists())
+        self.assertTrue(self.apps[0].raw_text)
+        self.assertFalse(ApplicationText.objects.filter(application=self.apps[2]).exists())
+
+    def test_resumes_after_checkpoint(self):
+        checkpoint = {"filters": {"job": "rescore-job", "since": None}, "last_id": self.apps[0].id, "updated": 1, "failed": 0}
+        (self.tmp / "checkpoint.json").write_text(json.dumps(checkpoint))
+
+        self._run(workers=0, job="rescore-job")
+
+        self.apps[0].refresh_from_db()
+        self.apps[1].refresh_from_db()
+        self.assertIsNone(self.apps[0].parsed_skills)
+        self.assertIn("python", self.apps[1].parsed_skills)
+
+    def test_process_pool_gives_same_result(self):
+        self._run(workers=0)
+        inline = Application.objects.get(id=self.apps[0].id).match_score
+        Application.objects.update(match_score=0)
+
+        self._run(workers=2)
+
+        self.assertEqual(Application.objects.get(id=self.apps[0].id).match_score, inline)
+
+
+class ApplicationTextTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.job = Job.objects.create(
+            title="Text Job",
+            slug="text-job",
+            description="Python role",
+            location="Pune",
+            work_mode="remote",
+            employment_type="full_time",
+            required_skills=["python"],
+        )
+
+    def test_text_is_compressed_and_decompressed_lazily(self):
+        application = Application.objects.create(job=self.job, full_name="A", email="a@example.com", phone="1")
+        text = "python django rest framework\n" * 200
+
+        ApplicationText.store(application, text)
+        stored = ApplicationText.objects.get(application=application)
+
+        self.assertLess(len(bytes(stored.compressed_text)), len(text) // 10)
+        self.assertEqual(stored.text_length, len(text))
+        self.assertEqual(Application.objects.get(id=application.id).raw_text, text)
+        self.assertEqual(Application(job=self.job).raw_text, "")
+
+    @patch("applications.views.public.upload_resume", return_value="https://cdn.example.com/resume.pdf")
+    def test_apply_keeps_extracted_text(self, mock_upload_resume):
+        caches["resume_parse"].clear()
+        with open(SAMPLE_RESUME, "rb") as f:
+            self.client.post(
+                reverse("apply_job", args=[self.job.slug]),
+                {"full_name": "Candidate", "email": "c@example.com", "phone": "9999999999", "resume": f},
+            )
+
+        application = Application.objects.get(job=self.job, email="c@example.com")
+        with open(SAMPLE_RESUME, "rb") as f:
+            self.assertEqual(application.raw_text, extract_pdf(f)[0])
+
+    def test_rescore_uses_stored_text_without_download(self):
+        application = Application.objects.create(
+            job=self.job, full_name="B", email="b@example.com", phone="1",
+            resume_url="https://x.supabase.co/storage/v1/object/public/resumes/text-job/b.pdf",
+        )
+        ApplicationText.store(application, "python developer with 2 years of experience")
+
+        tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, tmp)
+        with patch("applications.supabase_client.download_resume") as download:
+            call_command("rescore_applications", workers=0, checkpoint=str(tmp / "c.json"), stdout=io.StringIO())
+
+        download.assert_not_called()
+        application.refresh_from_db()
+        self.assertEqual(application.parsed_skills, ["python"])
+        self.assertEqual(application.parsed_experience, 2.0)
+
+
+class ApplicationUpgradeTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = User.objects.create_user(
+            email="upgrade-recruiter@example.com",
+            password="UpgradeRecruiter123!",
+            role="RECRUITER",
+        )
+        cls.job = Job.objects.create(
+            title="Upgrade Job",
+            slug="upgrade-job",
+            description="Python role",
+            location="Pune",
+            work_mode="remote",
+            employment_type="full_time",
+            created_by=cls.recruiter,
+            required_skills=["python", "django"],
+        )
+
+    def setUp(self):
+        SKILL_TAXONOMY.clear()
+        upgrades._failed.clear()
+        upgrades._queued.clear()
+        self.client.login(email="upgrade-recruiter@example.com", password="UpgradeRecruiter123!")
+
+    def _stale_application(self, i, text="python developer with 2 years of experience"):
+        application = Application.objects.create(
+            job=self.job, full_name=f"Candidate {i}", email=f"c{i}@example.com", phone="1",
+            resume_url=f"https://x.supabase.co/storage/v1/object/public/resumes/upgrade-job/{i}.pdf",
+        )
+        ApplicationText.store(application, text)
+        return application
+
+    def _assert_current(self, application):
+        self.assertEqual(
+            (application.parser_version, application.taxonomy_version), upgrades.current_versions()
+        )
+
+    @patch("applications.views.public.upload_resume", return_value="https://cdn.example.com/resume.pdf")
+    def test_apply_stamps_versions(self, mock_upload_resume):
+        caches["resume_parse"].clear()
+        with open(SAMPLE_RESUME, "rb") as f:
+            self.client.post(
+                reverse("apply_job", args=[self.job.slug]),
+                {"full_name": "Candidate", "email": "apply@example.com", "phone": "9999999999", "resume": f},
+            )
+
+        self._assert_current(Application.objects.get(job=self.job, email="apply@example.com"))
+
+    def test_detail_view_upgrades_on_read(self):
+        application = self._stale_application(1)
+
+        with patch("applications.supabase_client.download_resume") as download:
+            response = self.client.get(reverse("recruiter_application_detail", args=[application.id]))
+
+        download.assert_not_called()
+        self.assertEqual(response.context["application"].parsed_skills, ["python"])
+        application.refresh_from_db()
+        self._assert_current(application)
+        self.assertEqual(application.parsed_experience, 2.0)
+
+    def test_list_page_never_mixes_versions(self):
+        applications = [self._stale_application(i) for i in range(12)]
+
+        response = self.client.get(reverse("recruiter_applications_list"))
+
+        for application in response.context["applications_page"]:
+            self._assert_current(application)
+        # the rows beyond the first page were queued (run inline in tests)
+        for application in applications:
+            application.refresh_from_db()
+            self._assert_current(application)
+
+    def test_list_page_queues_rows_without_stored_text(self):
+        applications = [self._stale_application(i) for i in range(2)]
+        ApplicationText.objects.filter(application=applications[1]).delete()
+
+        with patch("applications.upgrades.fetch_resume") as fetch, \
+                patch("applications.upgrades.schedule_upgrade") as schedule:
+            response = self.client.get(reverse("recruiter_applications_list"))
+
+        fetch.assert_not_called()
+        self.assertEqual(schedule.call_args.args[0], [applications[1].id])
+        rows = {application.id: application for application in response.context["applications_page"]}
+        self._assert_current(rows[applications[0].id])
+        self.assertEqual(rows[applications[1].id].parser_version, 0)
+        self.assertFalse(rows[applications[0].id].pending_upgrade)
+        self.assertTrue(rows[applications[1].id].pending_upgrade)
+        self.assertTrue(response.context["page_obj"].provisional)
+
+    def test_pending_rows_are_flagged_and_left_out_of_rankings(self):
+        current, pending = [self._stale_application(i) for i in range(2)]
+        upgrades.upgrade_applications([current])
+        ApplicationText.objects.filter(application=pending).delete()
+        Application.objects.filter(id=pending.id).update(match_score=99.0)
+
+        from rest_framework.authtoken.models import Token
+
+        token, _ = Token.objects.get_or_create(user=self.recruiter)
+        auth = {"HTTP_AUTHORIZATION": f"Token {token.key}"}
+        with patch("applications.upgrades.schedule_upgrade"):
+            ranked = self.client.get(reverse("api-recruiter-job-ranked", args=[self.job.id]), **auth).json()
+            page = self.client.get(reverse("recruiter_job_ranked", args=[self.job.id]))
+            listed = self.client.get(reverse("api-recruiter-applications"), **auth).json()
+
+        self.assertEqual([row["id"] for row in ranked["results"]], [current.id])
+        self.assertEqual(ranked["results"][0]["percentile"], 0.0)
+        self.assertEqual(ranked["pending_upgrades"], 1)
+        self.assertEqual([row.id for row in page.context["candidates"]], [current.id])
+        self.assertEqual(page.context["pending_count"], 1)
+        self.assertEqual(
+            {row["id"]: row["pending_upgrade"] for row in listed}, {current.id: False, pending.id: True}
+        )
+
+    def test_taxonomy_edit_makes_rows_stale(self):
+        application = self._stale_application(1, "python and quarkus developer")
+        upgrades.upgrade_applications([application])
+        self.assertEqual(application.parsed_skills, ["python"])
+
+        Skill.objects.create(name="quarkus")
+        self.assertTrue(upgrades.is_stale(application, upgrades.current_versions()))
+
+        upgrades.upgrade_applications([application])
+        application.refresh_from_db()
+        self.assertEqual(application.parsed_skills, ["quarkus"])
+        self._assert_current(application)
+
+    def test_failed_upgrade_is_not_retried(self):
+        application = Application.objects.create(job=self.job, full_name="X", email="x@example.com", phone="1")
+
+        self.assertEqual(upgrades.upgrade_applications([application]), 0)
+        with patch("applications.upgrades.rescore_text") as rescore:
+            upgrades.upgrade_applications([application])
+            self.assertEqual(upgrades.queue_stale_applications(Application.objects.all()), 0)
+
+        rescore.assert_not_called()
+        application.refresh_from_db()
+        self.assertEqual(application.parser_version, 0)
+
+    def test_failures_are_forgotten_when_versions_change(self):
+        application = Application.objects.create(job=self.job, full_name="X", email="x@example.com", phone="1")
+        upgrades.upgrade_applications([application])
+        self.assertEqual(upgrades._failed, {application.id})
+
+        Skill.objects.create(name="quarkus")
+        self.assertEqual(upgrades.failed_ids(upgrades.current_versions()), set())
+
+
+class BulkScoringTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.job = Job.objects.create(
+            title="Bulk Job",
+            slug="bulk-job",
+            description="Backend role",
+            location="Pune",
+            work_mode="remote",
+            employment_type="full_time",
+            required_skills=["Python", "django", "docker", "AWS"],
+            jd_keywords=["api", "backend", "microservices"],
+            min_experience=2,
+            max_experience=5,
+        )
+
+    def setUp(self):
+        # job ids are reused between test cases
+        JOB_PROFILES.clear()
+
+    def assert_same_as_scalar(self, job, skills, experience, keywords):
+        bulk = BulkScorer(job).score(skills, experience, keywords=keywords)
+        for i in range(len(skills)):
+            scalar = compute_match_score(
+                {"skills": skills[i], "experience_years": experience[i], "keywords": keywords[i]}, job
+            )
+            for field in ("final_score", "skill_score", "experience_score", "keyword_score"):
+                self.assertEqual(bulk[field][i], scalar[field], (field, i))
+            self.assertEqual(str(bulk["final_score"][i]), str(scalar["final_score"]))
+            self.assertCountEqual(bulk["matched_skills"][i], scalar["matched_skills"])
+            self.assertCountEqual(bulk["missing_skills"][i], scalar["missing_skills"])
+
+    def test_scores_match_compute_match_score(self):
+        skills, experience, keywords = synthetic_applicants(500, seed=3)
+        skills[:4] = [None, "python, Django", ["  PYTHON ", "aws"], []]
+        experience[:4] = [None, 0, "3", 40]
+        self.assert_same_as_scalar(self.job, skills, experience, keywords)
+
+    def test_edge_case_jobs(self):
+        skills, experience, keywords = synthetic_applicants(100, seed=4)
+        for required, jd, job_min, job_max in [
+            ([], [], None, None),
+            (["python"], [], 0, None),
+            ([], ["api"], None, 3),
+        ]:
+            job = Job(required_skills=required, jd_keywords=jd, min_experience=job_min, max_experience=job_max)
+            self.assert_same_as_scalar(job, skills, experience, keywords)
+
+    def test_rounding_matches_python_round(self):
+        import numpy as np
+
+        values = np.array([0.125, 2.675, 1.005, 33.333333, 62.5, 99.995, 0.0, 100.0, 45.675])
+        self.assertEqual(rounded(values), [round(v, 2) for v in values.tolist()])
+
+    def test_rescore_job_writes_every_applicant(self):
+        parsed = [
+            {"name": "A", "skills": ["python", "django"], "experience_years": 3, "keywords": ["api"]},
+            {"name": "B", "skills": ["docker"], "experience_years": 8, "keywords": ["api", "backend"]},
+            {"name": "C", "skills": [], "experience_years": None, "keywords": []},
+        ]
+        old_job = Job(required_skills=["python"], jd_keywords=self.job.jd_keywords)
+        for i, data in enumerate(parsed):
+            old = compute_match_score(data, old_job)
+            Application.objects.create(
+                job=self.job, full_name=data["name"], email=f"bulk{i}@example.com", phone="1",
+                parsed_skills=data["skills"], parsed_experience=data["experience_years"],
+                match_score=old["final_score"], keyword_score=old["keyword_score"],
+                summary=generate_summary(data, old["final_score"]),
+            )
+
+        self.assertEqual(rescore_job(self.job), 3)
+
+        for data in parsed:
+            application = Application.objects.get(job=self.job, full_name=data["name"])
+            expected = compute_match_score(data, self.job)
+            self.assertEqual(application.match_score, expected["final_score"])
+            self.assertEqual(application.keyword_score, expected["keyword_score"])
+            self.assertCountEqual(application.missing_skills, expected["missing_skills"])
+            self.assertEqual(application.summary, generate_summary(data, expected["final_score"]))
+
+    def test_scores_only_command(self):
+        application = Application.objects.create(
+            job=self.job, full_name="D", email="d@example.com", phone="1",
+            parsed_skills=["python"], parsed_experience=1,
+        )
+        ApplicationText.store(application, "we built a backend api in python")
+
+        call_command(
+            "rescore_applications", job=self.job.slug, scores_only=True, rematch_keywords=True, stdout=io.StringIO()
+        )
+
+        application.refresh_from_db()
+        expected = compute_match_score(
+            {"skills": ["python"], "experience_years": 1, "keywords": ["api", "backend"]}, self.job
+        )
+        self.assertEqual(application.match_score, expected["final_score"])
+        self.assertEqual(application.keyword_score, expected["keyword_score"])
+
+    def test_rematch_keeps_keyword_score_of_rows_without_text(self):
+        with_text, without_text = [
+            Application.objects.create(
+                job=self.job, full_name=name, email=f"{name}@example.com", phone="1",
+                parsed_skills=["python"], parsed_experience=3, keyword_score=66.67,
+            )
+            for name in ("with-text", "without-text")
+        ]
+        ApplicationText.store(with_text, "graphql api in python")
+        job = Job.objects.get(pk=self.job.pk)
+        job.jd_keywords = ["api", "graphql"]
+
+        rescore_job(job, keywords="text")
+
+        with_text.refresh_from_db()
+        without_text.refresh_from_db()
+        self.assertEqual(with_text.keyword_score, 100.0)
+        self.assertEqual(without_text.keyword_score, 66.67)
+
+
+class JobRescoreTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = User.objects.create_user(
+            email="rescore-recruiter@example.com",
+            password="RescoreRecruiter123!",
+            role="RECRUITER",
+        )
+
+    def setUp(self):
+        JOB_PROFILES.clear()
+        self.job = Job.objects.create(
+            title="Rescore Job",
+            slug="rescore-job",
+            description="Backend role",
+            location="Pune",
+            work_mode="onsite",
+            employment_type="full_time",
+            created_by=self.recruiter,
+            required_skills=["python"],
+            jd_keywords=["api"],
+        )
+        self.parsed = {"skills": ["python", "docker"], "experience_years": 3, "keywords": ["api"]}
+        scoring = compute_match_score(self.parsed, self.job)
+        self.application = Application.objects.create(
+            job=self.job, full_name="A", email="a@example.com", phone="1",
+            parsed_skills=self.parsed["skills"], parsed_experience=3,
+            match_score=scoring["final_score"], keyword_score=scoring["keyword_score"],
+            matched_skills=scoring["matched_skills"],
+        )
+        ApplicationText.store(self.application, "python docker api backend developer")
+
+    def _edit(self, **changes):
+        data = {
+            "title": self.job.title,
+            "description": self.job.description,
+            "required_skills": ", ".join(self.job.required_skills),
+            "jd_keywords": ", ".join(self.job.jd_keywords),
+            "salary_type": "negotiable",
+            "location": self.job.location,
+            "work_mode": self.job.work_mode,
+            "employment_type": self.job.employment_type,
+            "vacancies": "1",
+            **changes,
+        }
+        self.client.force_login(self.recruiter)
+        return self.client.post(reverse("recruiter_job_edit", args=[self.job.id]), data)
+
+    def test_requirement_change_rescores_applicants(self):
+        self._edit(required_skills="python, docker, kubernetes")
+
+        self.job.refresh_from_db()
+        self.application.refresh_from_db()
+        expected = compute_match_score(self.parsed, self.job)
+        self.assertEqual(self.application.match_score, expected["final_score"])
+        self.assertCountEqual(self.application.missing_skills, ["kubernetes"])
+        self.assertEqual(self.job.scoring_status, "current")
+
+    def test_other_edits_queue_nothing(self):
+        with patch("applications.bulk_scoring.schedule_job_rescore") as schedule:
+            self._edit(title="Renamed Job", location="Mumbai")
+            self.job.refresh_from_db()
+            self.job.is_deleted = True
+            self.job.save()
+
+        schedule.assert_not_called()
+        self.assertEqual(self.job.scoring_version, 0)
+
+    def test_status_is_rescoring_until_the_task_ran(self):
+        from applications.bulk_scoring import _rescore_job_task
+
+        with patch("applications.background.submit") as submit:
+            self._edit(min_experience="5")
+
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.scoring_status, "rescoring")
+        submit.assert_called_once_with(_rescore_job_task, self.job.id)
+
+        _rescore_job_task(self.job.id)
+        self.job.refresh_from_db()
+        self.application.refresh_from_db()
+        self.assertEqual(self.job.scoring_status, "current")
+        self.assertEqual(self.application.experience_score, 60.0)
+
+    def test_rematch_survives_tasks_running_out_of_order(self):
+        from applications.bulk_scoring import _rescore_job_task
+
+        with patch("applications.background.submit"):
+            self._edit(jd_keywords="api, backend")
+            self.job.refresh_from_db()
+            self._edit(min_experience="5")
+        self.job.refresh_from_db()
+        self.assertTrue(self.job.needs_rematch)
+
+        # the experience edit's task runs first and scores the latest version
+        _rescore_job_task(self.job.id)
+        _rescore_job_task(self.job.id)
+
+        self.job.refresh_from_db()
+        self.application.refresh_from_db()
+        self.assertFalse(self.job.needs_rematch)
+        self.assertEqual(self.job.scoring_status, "current")
+        self.assertEqual(self.application.keyword_score, 100.0)
+
+    def test_api_keyword_change_rematches_stored_text(self):
+        from rest_framework.authtoken.models import Token
+        from rest_framework.test import APIClient
+
+        client = APIClient()
+        token, _ = Token.objects.get_or_create(user=self.recruiter)
+        client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+        response = client.patch(
+            reverse("api-recruiter-job-update", args=[self.job.id]), {"jd_keywords": ["api", "backend"]}, format="json"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.application.refresh_from_db()
+        self.assertEqual(self.application.keyword_score, 100.0)
+
+
+class RankedCandidatesTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = User.objects.create_user(
+            email="ranked-recruiter@example.com",
+            password="RankedRecruiter123!",
+            role="RECRUITER",
+        )
+        cls.other = User.objects.create_user(
+            email="ranked-other@example.com",
+            password="RankedOther123!",
+            role="RECRUITER",
+        )
+        cls.job = Job.objects.create(
+            title="Ranked Job",
+            slug="ranked-job",
+            description="Backend role",
+            location="Pune",
+            work_mode="onsite",
+            employment_type="full_time",
+            created_by=cls.recruiter,
+        )
+        parser_version, taxonomy_version = upgrades.current_versions()
+        for i, score in enumerate([72.5, 90.0, 35.0, 90.0, 61.25, 72.5, 10.0]):
+            Application.objects.create(
+                job=cls.job, full_name=f"Candidate {i}", email=f"ranked{i}@example.com", phone="1",
+                match_score=score, parser_version=parser_version, taxonomy_version=taxonomy_version,
+            )
+
+    def _api_client(self, user):
+        from rest_framework.authtoken.models import Token
+        from rest_framework.test import APIClient
+
+        client = APIClient()
+        token, _ = Token.objects.get_or_create(user=user)
+        client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+        return client
+
+    def test_keyset_pages_cover_the_job_best_first(self):
+        from applications.ranking import ranked_applications
+
+        seen, cursor = [], None
+        while True:
+            rows, cursor = ranked_applications(Application.objects.all(), self.job, limit=3, after=cursor)
+            seen.extend(rows)
+            if cursor is None:
+                break
+
+        expected = list(Application.objects.filter(job=self.job).order_by("-match_score", "id"))
+        self.assertEqual([app.id for app in seen], [app.id for app in expected])
+
+    def test_percentile_matches_percent_rank(self):
+        from django.db.models import F, Window
+        from django.db.models.functions import PercentRank
+
+        from applications.ranking import ranked_applications
+
+        rows, _ = ranked_applications(Application.objects.all(), self.job, limit=10)
+        expected = dict(
+            Application.objects.filter(job=self.job)
+            .annotate(rank=Window(PercentRank(), order_by=F("match_score").asc()))
+            .values_list("id", "rank")
+        )
+        for app in rows:
+            self.assertAlmostEqual(app.percentile, expected[app.id])
+        self.assertEqual(rows[0].percentile, 5 / 6)
+        self.assertEqual(rows[-1].percentile, 0.0)
+
+    def test_api_returns_top_k_with_next_link(self):
+        client = self._api_client(self.recruiter)
+
+        response = client.get(reverse("api-recruiter-job-ranked", args=[self.job.id]), {"limit": 2})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([row["match_score"] for row in response.data["results"]], [90.0, 90.0])
+
+        response = client.get(response.data["next"])
+        self.assertEqual([row["match_score"] for row in response.data["results"]], [72.5, 72.5])
+        self.assertEqual(response.data["results"][0]["percentile"], 3 / 6)
+
+    def test_api_rejects_other_recruiters_and_bad_cursors(self):
+        url = reverse("api-recruiter-job-ranked", args=[self.job.id])
+
+        self.assertEqual(self._api_client(self.other).get(url).status_code, 404)
+        self.assertEqual(self._api_client(self.recruiter).get(url, {"cursor": "top"}).status_code, 400)
+
+    def test_recruiter_page_lists_candidates(self):
+        self.client.force_login(self.recruiter)
+
+        response = self.client.get(reverse("recruiter_job_ranked", args=[self.job.id]), {"limit": 3})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([app.match_score for app in response.context["candidates"]], [90.0, 90.0, 72.5])
+        self.assertIsNotNone(response.context["next_cursor"])
+
+
+class ScoringWeightsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = User.objects.create_user(
+            email="weights-recruiter@example.com",
+            password="WeightsRecruiter123!",
+            role="RECRUITER",
+        )
+        cls.other = User.objects.create_user(
+            email="weights-other@example.com",
+            password="WeightsOther123!",
+            role="RECRUITER",
+        )
+
+    def setUp(self):
+        JOB_PROFILES.clear()
+        JOB_COMPONENTS.clear()
+        self.job = Job.objects.create(
+            title="Weights Job", slug="weights-job", description="Role", location="Pune",
+            work_mode="onsite", employment_type="full_time", created_by=self.recruiter,
+            required_skills=["python", "django"], jd_keywords=["api"], min_experience=2, max_experience=5,
+        )
+        # (skills, experience, keywords): strong skills vs strong experience
+        self.applicants = {}
+        parser_version, taxonomy_version = upgrades.current_versions()
+        for name, parsed in {
+            "skills": {"skills": ["python", "django"], "experience_years": 0.5, "keywords": []},
+            "experience": {"skills": ["python"], "experience_years": 4, "keywords": ["api"]},
+            "neither": {"skills": [], "experience_years": 1, "keywords": []},
+        }.items():
+            scoring = compute_match_score(parsed, self.job)
+            self.applicants[name] = Application.objects.create(
+                job=self.job, full_name=name, email=f"{name}@example.com", phone="1",
+                parsed_skills=parsed["skills"], parsed_experience=parsed["experience_years"],
+                match_score=scoring["final_score"], skill_score=scoring["skill_score"],
+                experience_score=scoring["experience_score"], keyword_score=scoring["keyword_score"],
+                summary=f"{name} summary. Overall match score is {scoring['final_score']}%.",
+                parser_version=parser_version, taxonomy_version=taxonomy_version,
+            )
+
+    def _api_client(self, user):
+        from rest_framework.authtoken.models import Token
+        from rest_framework.test import APIClient
+
+        client = APIClient()
+        token, _ = Token.objects.get_or_create(user=user)
+        client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+        return client
+
+    def _weights(self, skill, experience, keyword):
+        return {"skill_weight": skill, "experience_weight": experience, "keyword_weight": keyword}
+
+    def test_job_weights_drive_scalar_and_bulk_scores(self):
+        job = Job(required_skills=["python", "django"], jd_keywords=["api"], min_experience=2,
+                  skill_weight=70, experience_weight=20, keyword_weight=10)
+        parsed = {"skills": ["python"], "experience_years": 1, "keywords": ["api"]}
+
+        scoring = compute_match_score(parsed, job)
+        self.assertEqual(scoring["final_score"], round(50 * 0.7 + 50 * 0.2 + 100 * 0.1, 2))
+
+        skills, experience, keywords = synthetic_applicants(200, seed=6)
+        bulk = BulkScorer(job).score(skills, experience, keywords=keywords)
+        for i in range(len(skills)):
+            scalar = compute_match_score(
+                {"skills": skills[i], "experience_years": experience[i], "keywords": keywords[i]}, job
+            )
+            self.assertEqual(bulk["final_score"][i], scalar["final_score"], i)
+
+    def test_what_if_reranks_without_writing(self):
+        url = reverse("api-recruiter-job-what-if", args=[self.job.id])
+        before = dict(Application.objects.values_list("id", "match_score"))
+
+        response = self._api_client(self.recruiter).post(url, self._weights(10, 80, 10), format="json")
+
+        self.assertEqual(response.status_code, 200)
+        results = response.data["results"]
+        self.assertEqual([row["full_name"] for row in results], ["experience", "neither", "skills"])
+        self.assertEqual([row["current_rank"] for row in results], [1, 3, 2])
+        experience = self.applicants["experience"]
+        self.assertEqual(
+            results[0]["match_score"],
+            round(experience.skill_score * 0.1 + experience.experience_score * 0.8 + experience.keyword_score * 0.1, 2),
+        )
+        self.assertEqual(dict(Application.objects.values_list("id", "match_score")), before)
+
+    def test_what_if_keeps_the_components_in_memory(self):
+        weights = {"skill_weight": 10, "experience_weight": 80, "keyword_weight": 10, "similarity_weight": 0}
+        rerank(self.job, weights)
+        with self.assertNumQueries(1):
+            # only the top rows' names and statuses
+            rerank(self.job, {**weights, "skill_weight": 20, "experience_weight": 70})
+
+        Application.objects.create(
+            job=self.job, full_name="late", email="late@example.com", phone="1",
+            skill_score=100.0, experience_score=100.0, keyword_score=100.0,
+        )
+        self.assertEqual(rerank(self.job, weights)[0]["application"].full_name, "late")
+
+    def test_what_if_validates_weights_and_owner(self):
+        url = reverse("api-recruiter-job-what-if", args=[self.job.id])
+
+        response = self._api_client(self.recruiter).post(url, self._weights(60, 30, 20), format="json")
+        self.assertEqual(response.status_code, 400)
+        response = self._api_client(self.other).post(url, self._weights(50, 30, 20), format="json")
+        self.assertEqual(response.status_code, 404)
+
+    def test_saving_weights_persists_the_preview(self):
+        client = self._api_client(self.recruiter)
+        preview = client.post(
+            reverse("api-recruiter-job-what-if", args=[self.job.id]), self._weights(10, 80, 10), format="json"
+        ).data["results"]
+
+        with patch("applications.bulk_scoring.rescore_job") as rescore:
+            response = client.put(
+                reverse("api-recruiter-job-weights", args=[self.job.id]), self._weights(10, 80, 10), format="json"
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["scoring_status"], "current")
+        rescore.assert_not_called()
+
+        ranked = client.get(reverse("api-recruiter-job-ranked", args=[self.job.id])).data["results"]
+        self.assertEqual(
+            [(row["id"], row["match_score"]) for row in ranked],
+            [(row["application_id"], row["match_score"]) for row in preview],
+        )
+        experience = Application.objects.get(pk=self.applicants["experience"].pk)
+        self.assertEqual(experience.skill_score, self.applicants["experience"].skill_score)
+        self.assertTrue(experience.summary.endswith(f"Overall match score is {experience.match_score}%."))
+        self.assertEqual(experience.fit_category, fit_category(experience.match_score))
+
+        # the scalar path scores new applicants with the saved weights
+        self.job.refresh_from_db()
+        JOB_PROFILES.clear()
+        self.assertEqual(
+            compute_match_score({"skills": ["python"], "experience_years": 4, "keywords": ["api"]}, self.job)[
+                "final_score"
+            ],
+            experience.match_score,
+        )
+
+    def test_reweight_waits_for_a_pending_rescore(self):
+        from applications.bulk_scoring import _reweight_job_task
+
+        with patch("applications.background.submit"):
+            self.job.min_experience = 3
+            self.job.save()
+            self.job.skill_weight, self.job.experience_weight = 40, 40
+            self.job.save()
+
+        # requirements changed before the weights: everything is rescored
+        with patch("applications.weights.reweight_job") as reweight:
+            _reweight_job_task(self.job.id, self.job.scoring_version)
+        reweight.assert_not_called()
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.scoring_status, "current")
+
+
+class TextSimilarityTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = User.objects.create_user(
+            email="similarity-recruiter@example.com",
+            password="SimilarityRecruiter123!",
+            role="RECRUITER",
+        )
+
+    def setUp(self):
+        JOB_PROFILES.clear()
+        self.job = Job.objects.create(
+            title="Similarity Job", slug="similarity-job", location="Pune",
+            work_mode="onsite", employment_type="full_time", created_by=self.recruiter,
+            description="Develop and maintain RESTful web services and data pipelines for our payments platform.",
+            required_skills=["python"], skill_weight=40, experience_weight=20, keyword_weight=10, similarity_weight=30,
+        )
+        self.related = "Developer maintaining REST web service APIs and data pipeline jobs for a payment platform."
+        self.unrelated = "Registered nurse with ward management, patient care and hospital shift scheduling."
+
+    def test_paraphrases_score_higher_than_unrelated_text(self):
+        from applications.similarity import similarity_score_for
+
+        profile = job_profile(self.job)
+        related = similarity_score_for(ResumeDocument(self.related), profile)
+        unrelated = similarity_score_for(ResumeDocument(self.unrelated), profile)
+
+        self.assertGreater(related, 30)
+        self.assertLess(unrelated, 10)
+        self.assertEqual(similarity_score_for(ResumeDocument(""), profile), 0.0)
+        self.assertEqual(similarity_score_for(ResumeDocument(self.related), JobProfile(Job(description=""))), 0.0)
+
+    def test_batch_matches_single_scores(self):
+        from applications.similarity import batch_similarity_scores, similarity_score_for
+
+        profile = job_profile(self.job)
+        documents = [ResumeDocument(self.related), None, ResumeDocument(self.unrelated), ResumeDocument("")]
+        self.assertEqual(
+            batch_similarity_scores(documents, profile),
+            [similarity_score_for(doc, profile) for doc in documents],
+        )
+
+    def test_job_vector_is_built_once_per_version(self):
+        vector = job_profile(self.job).description_vector
+        self.assertIs(job_profile(self.job).description_vector, vector)
+
+        self.job.description = "Hospital nurse for patient care."
+        self.job.save()
+        self.assertIsNot(job_profile(self.job).description_vector, vector)
+
+    def test_fourth_component_in_the_match_score(self):
+        parsed = {"skills": ["python"], "experience_years": None, "keywords": [], "raw_text": self.related}
+        scoring = compute_match_score(parsed, self.job)
+
+        self.assertGreater(scoring["similarity_score"], 0)
+        self.assertEqual(
+            scoring["final_score"], round(100 * 0.4 + 0 * 0.2 + 100 * 0.1 + scoring["similarity_score"] * 0.3, 2)
+        )
+
+        self.job.similarity_weight, self.job.skill_weight = 0, 70
+        JOB_PROFILES.clear()
+        self.assertEqual(compute_match_score(parsed, self.job)["final_score"], 80.0)
+
+    def test_description_edit_rescores_from_stored_text(self):
+        application = Application.objects.create(
+            job=self.job, full_name="S", email="s@example.com", phone="1",
+            parsed_skills=["python"], parsed_experience=None,
+        )
+        ApplicationText.store(application, self.unrelated)
+
+        self.job.description = "Hospital ward nurse for patient care and shift scheduling."
+        self.job.save()
+
+        application.refresh_from_db()
+        self.assertGreater(application.similarity_score, 10)
+        self.assertEqual(
+            application.match_score, round(40 + 10 + application.similarity_score * 0.3, 2)
+        )
+
+
+class MatchingCandidatesTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = User.objects.create_user(
+            email="matching-recruiter@example.com",
+            password="MatchingRecruiter123!",
+            role="RECRUITER",
+        )
+        cls.other = User.objects.create_user(
+            email="matching-other@example.com",
+            password="MatchingOther123!",
+            role="RECRUITER",
+        )
+        cls.old_job = cls._job("old-job", cls.recruiter, required_skills=["java"])
+        cls.other_job = cls._job("other-job", cls.other, required_skills=["python"])
+        cls.new_job = cls._job(
+            "new-job", cls.recruiter,
+            required_skills=["python", "django", "k8s"], jd_keywords=["rest api"], min_experience=2,
+        )
+
+    @classmethod
+    def _job(cls, slug, owner, **fields):
+        return Job.objects.create(
+            title=slug, slug=slug, description="Backend role", location="Pune",
+            work_mode="onsite", employment_type="full_time", created_by=owner, **fields,
+        )
+
+    def setUp(self):
+        JOB_PROFILES.clear()
+
+    def _apply(self, job, email, skills, experience=3, text=None):
+        application = Application.objects.create(
+            job=job, full_name=email.split("@")[0], email=email, phone="1",
+            parsed_skills=skills, parsed_experience=experience,
+        )
+        if text:
+            ApplicationText.store(application, text)
+        return application
+
+    def _find(self, user, limit=20):
+        from applications.skill_index import find_matching_candidates
+        from applications.views.recruiter import application_queryset_for
+
+        return find_matching_candidates(self.new_job, application_queryset_for(user), limit=limit)
+
+    def test_new_applications_are_indexed_by_canonical_skill(self):
+        from applications.models import ApplicationSkill
+
+        application = self._apply(self.old_job, "k8s@example.com", ["Python", "k8s"])
+
+        self.assertCountEqual(
+            ApplicationSkill.objects.filter(application=application).values_list("skill", flat=True),
+            ["python", "kubernetes"],
+        )
+
+    def test_only_visible_candidates_sharing_a_skill_are_scored(self):
+        text = "python developer building rest api services"
+        python = self._apply(self.old_job, "python@example.com", ["python", "java"], text=text)
+        self._apply(self.old_job, "java@example.com", ["java"])
+        hidden = self._apply(self.other_job, "hidden@example.com", ["python", "django"])
+        self._apply(self.new_job, "applied@example.com", ["python", "django"])
+
+        matches = self._find(self.recruiter)
+
+        self.assertEqual([m["application"] for m in matches], [python])
+        expected = compute_match_score({"skills": ["python", "java"], "experience_years": 3, "keywords": ["rest api"]}, self.new_job)
+        self.assertEqual(matches[0]["match_score"], expected["final_score"])
+        self.assertEqual(matches[0]["keyword_score"], 100.0)
+        self.assertEqual([m["application"] for m in self._find(self.other)], [hidden])
+
+    def test_early_stop_keeps_the_best_candidate_once_per_email(self):
+        for i in range(6):
+            self._apply(self.old_job, f"c{i}@example.com", ["python"], experience=i)
+        second_job = self._job("second-job", self.recruiter)
+        c1 = self._apply(second_job, "c1@example.com", ["python", "django"], experience=1)
+        best = self._apply(second_job, "c5@example.com", ["python", "django"], experience=5, text="rest api")
+
+        with patch("applications.skill_index.MATCH_BATCH_SIZE", 1):
+            matches = self._find(self.recruiter, limit=2)
+
+        self.assertEqual(matches[0]["application"], best)
+        self.assertEqual(matches[0]["match_score"], 83.33)
+        # c1's application to second_job (48.33) beats c4's 46.67
+        self.assertEqual([m["application"] for m in matches], [best, c1])
+
+    def test_reparse_reindexes_skills(self):
+        from applications.models import ApplicationSkill
+        from applications.rescoring import save_rescored
+
+        application = self._apply(self.old_job, "reparse@example.com", ["java"])
+        application.parsed_skills = ["django"]
+        save_rescored([application], [])
+
+        self.assertEqual(list(ApplicationSkill.objects.filter(application=application).values_list("skill", flat=True)), ["django"])
+
+    def test_api_lists_matches(self):
+        from rest_framework.authtoken.models import Token
+        from rest_framework.test import APIClient
+
+        self._apply(self.old_job, "api@example.com", ["django"])
+        client = APIClient()
+        token, _ = Token.objects.get_or_create(user=self.recruiter)
+        client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+        response = client.get(reverse("api-recruiter-job-matches", args=[self.new_job.id]))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["results"][0]["email"], "api@example.com")
+        self.assertEqual(response.data["results"][0]["applied_job_title"], "old-job")
+        self.assertEqual(response.data["results"][0]["matched_skills"], ["django"])
+
+
+class JobRecommendationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = User.objects.create_user(
+            email="recommend-recruiter@example.com",
+            password="RecommendRecruiter123!",
+            role="RECRUITER",
+        )
+
+    def setUp(self):
+        JOB_PROFILES.clear()
+        self.backend = self._job("backend", required_skills=["python", "django"], jd_keywords=["rest api"])
+        self.devops = self._job("devops", required_skills=["k8s", "docker"])
+        self.frontend = self._job("frontend", required_skills=["react"])
+        self.parsed = {
+            "skills": ["python", "kubernetes"],
+            "experience_years": 3,
+            "raw_text": "python developer, rest api services on kubernetes",
+        }
+
+    def _job(self, slug, **fields):
+        return Job.objects.create(
+            title=slug, slug=slug, description="Role", location="Pune",
+            work_mode="onsite", employment_type="full_time", created_by=self.recruiter, **fields,
+        )
+
+    def _indexed(self, job):
+        from applications.models import JobSkill
+
+        return set(JobSkill.objects.filter(job=job).values_list("skill", flat=True))
+
+    def test_index_follows_job_saves_and_soft_delete(self):
+        self.assertEqual(self._indexed(self.devops), {"kubernetes", "docker"})
+
+        self.devops.required_skills = ["docker", "terraform"]
+        self.devops.save()
+        self.assertEqual(self._indexed(self.devops), {"docker", "terraform"})
+
+        self.devops.is_deleted = True
+        self.devops.save()
+        self.assertEqual(self._indexed(self.devops), set())
+
+    def test_only_jobs_sharing_a_skill_are_scored(self):
+        from applications.recommendations import recommend_jobs
+
+        with patch("applications.recommendations.compute_match_score", wraps=compute_match_score) as scored:
+            results = recommend_jobs(self.parsed)
+
+        self.assertEqual(scored.call_count, 2)
+        self.assertEqual([r["job"] for r in results], [self.backend, self.devops])
+        expected = compute_match_score({**self.parsed, "keywords": ["rest api"]}, self.backend)
+        self.assertEqual(results[0]["final_score"], expected["final_score"])
+        self.assertEqual(results[0]["keyword_score"], 100.0)
+        self.assertEqual(results[0]["missing_skills"], ["django"])
+
+    def test_soft_deleted_jobs_are_not_recommended(self):
+        from applications.recommendations import recommend_jobs
+
+        self.backend.is_deleted = True
+        self.backend.save()
+
+        self.assertEqual([r["job"] for r in recommend_jobs(self.parsed)], [self.devops])
+
+    def test_api_parses_once_and_returns_breakdown(self):
+        upload = SimpleUploadedFile("resume.pdf", SAMPLE_RESUME.read_bytes(), content_type="application/pdf")
+
+        with patch("api.views.parse_resume", return_value=self.parsed) as parse:
+            response = self.client.post(reverse("api-recommend-jobs"), {"resume": upload, "limit": 1})
+
+        self.assertEqual(response.status_code, 200)
+        parse.assert_called_once()
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(response.data["results"][0]["job"]["slug"], "backend")
+        self.assertEqual(response.data["results"][0]["matched_skills"], ["python"])
+
+    def test_api_rejects_non_pdf(self):
+        upload = SimpleUploadedFile("resume.txt", b"python", content_type="text/plain")
+
+        response = self.client.post(reverse("api-recommend-jobs"), {"resume": upload})
+
+        self.assertEqual(response.status_code, 400)
+
+
+@patch("applications.views.public.upload_resume", return_value="https://cdn.example.com/resume.pdf")
+@patch("api.views.upload_resume", return_value="https://cdn.example.com/resume.pdf")
+class MultiApplyTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = User.objects.create_user(
+            email="multi-recruiter@example.com",
+            password="MultiRecruiter123!",
+            role="RECRUITER",
+        )
+        cls.backend = cls._job("multi-backend", required_skills=["python", "django"], jd_keywords=["rest api"])
+        cls.data = cls._job("multi-data", required_skills=["python", "pandas"], jd_keywords=["etl"])
+        cls.closed = cls._job("multi-closed", required_skills=["python"], is_deleted=True)
+        cls.parsed = {
+            "skills": ["python", "django"],
+            "experience_years": 3,
+            "raw_text": "python django developer building rest api services",
+        }
+
+    @classmethod
+    def _job(cls, slug, **fields):
+        return Job.objects.create(
+            title=slug, slug=slug, description="Role", location="Pune",
+            work_mode="onsite", employment_type="full_time", created_by=cls.recruiter, **fields,
+        )
+
+    def setUp(self):
+        JOB_PROFILES.clear()
+
+    def _post(self, name, jobs, email="multi@example.com"):
+        return self.client.post(reverse(name), {
+            "full_name": "Multi Candidate",
+            "email": email,
+            "phone": "9999999999",
+            "resume": SimpleUploadedFile("resume.pdf", b"%PDF-1.4 test content", content_type="application/pdf"),
+            "jobs": jobs,
+        })
+
+    def test_api_parses_and_uploads_once_for_every_job(self, api_upload, view_upload):
+        with patch("api.views.parse_resume", return_value=self.parsed) as parse:
+            response = self._post("api-apply-multiple", ["multi-backend", "multi-data", "multi-closed", "missing"])
+
+        self.assertEqual(response.status_code, 201)
+        parse.assert_called_once()
+        api_upload.assert_called_once()
+        self.assertEqual([a["job"] for a in response.data["applied"]], ["multi-backend", "multi-data"])
+        self.assertEqual(response.data["not_found"], ["multi-closed", "missing"])
+
+        backend = Application.objects.get(job=self.backend, email="multi@example.com")
+        expected = compute_match_score({**self.parsed, "keywords": ["rest api"]}, self.backend)
+        self.assertEqual(backend.match_score, expected["final_score"])
+        self.assertEqual(backend.keyword_score, 100.0)
+        self.assertEqual(Application.objects.get(job=self.data).keyword_score, 0.0)
+        self.assertEqual(backend.resume_text.text, self.parsed["raw_text"])
+        self.assertTrue(backend.skill_index.filter(skill="django").exists())
+
+    def test_api_reports_existing_applications_per_job(self, api_upload, view_upload):
+        Application.objects.create(job=self.backend, full_name="Multi Candidate", email="multi@example.com", phone="1")
+
+        with patch("api.views.parse_resume", return_value=self.parsed):
+            response = self._post("api-apply-multiple", ["multi-backend", "multi-data"])
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["already_applied"], ["multi-backend"])
+        self.assertEqual([a["job"] for a in response.data["applied"]], ["multi-data"])
+
+        with patch("api.views.parse_resume") as parse:
+            response = self._post("api-apply-multiple", ["multi-backend", "multi-data"])
+
+        self.assertEqual(response.status_code, 400)
+        parse.assert_not_called()
+
+    def test_insert_race_is_reported_per_job(self, api_upload, view_upload):
+        from applications.multi_apply import create_applications
+
+        candidate = {"full_name": "Race", "email": "race@example.com", "phone": "1"}
+        with patch("applications.multi_apply.already_applied", return_value=set()):
+            Application.objects.create(job=self.data, **candidate)
+            created, duplicates = create_applications([self.backend, self.data], candidate, self.parsed, None)
+
+        self.assertEqual([app.job for app in created], [self.backend])
+        self.assertEqual(duplicates, [self.data])
+
+    def test_form_flow(self, api_upload, view_upload):
+        with patch("applications.views.public.parse_resume", return_value=self.parsed) as parse:
+            response = self._post("apply_multiple", ["multi-backend", "multi-data"])
+
+        self.assertEqual(response.status_code, 200)
+        parse.assert_called_once()
+        view_upload.assert_called_once()
+        self.assertCountEqual(response.context["applied_jobs"], [self.backend, self.data])
+        self.assertEqual(Application.objects.filter(email="multi@example.com").count(), 2)
+
+
+class KeywordStatsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = User.objects.create_user(
+            email="keyword-recruiter@example.com",
+            password="KeywordRecruiter123!",
+            role="RECRUITER",
+        )
+
+    def setUp(self):
+        JOB_PROFILES.clear()
+        KEYWORD_STATS.clear()
+        self.job = Job.objects.create(
+            title="Keyword Job", slug="keyword-job", description="Role", location="Pune",
+            work_mode="onsite", employment_type="full_time", created_by=self.recruiter,
+            required_skills=["python"], jd_keywords=["api", "graphql"], keyword_scorer="tfidf",
+        )
+
+    def _store(self, email, text, job=None):
+        application = Application.objects.create(
+            job=job or self.job, full_name="K", email=email, phone="1", parsed_skills=["python"], parsed_experience=3,
+        )
+        ApplicationText.store(application, text)
+        return application
+
+    def _counts(self):
+        return dict(KeywordTerm.objects.values_list("term", "document_count"))
+
+    def test_counts_follow_stored_texts_and_new_terms(self):
+        for i, text in enumerate(["api developer", "rest api", "graphql and api", "python only"]):
+            self._store(f"k{i}@example.com", text)
+        self.assertEqual(self._counts(), {"api": 3, "graphql": 1})
+        self.assertEqual(KeywordCorpus.current()[0], 4)
+
+        # a keyword added later is counted over the texts already stored
+        self.job.jd_keywords = ["api", "graphql", "python"]
+        self.job.save()
+        self.assertEqual(self._counts()["python"], 1)
+        self.assertTrue(KeywordTerm.objects.get(term="python").backfilled)
+
+        KeywordTerm.objects.update(document_count=0)
+        call_command("build_keyword_stats", stdout=io.StringIO())
+        self.assertEqual(self._counts(), {"api": 3, "graphql": 1, "python": 1})
+
+    def test_rescore_workers_score_with_the_parents_snapshot(self):
+        applications = [self._store(f"k{i}@example.com", text) for i, text in enumerate(["api developer", "graphql api"])]
+        tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, tmp)
+
+        with patch("applications.keyword_stats.KeywordCorpus.current", wraps=KeywordCorpus.current) as corpus:
+            call_command("rescore_applications", workers=0, checkpoint=str(tmp / "c.json"), stdout=io.StringIO())
+
+        # loaded once by the parent, not once per task
+        self.assertEqual(corpus.call_count, 1)
+        for application in applications:
+            application.refresh_from_db()
+        self.assertLess(applications[0].keyword_score, applications[1].keyword_score)
+
+    def test_rare_keywords_weigh_more(self):
+        for i in range(9):
+            self._store(f"k{i}@example.com", "api developer")
+        self._store("rare@example.com", "graphql developer")
+
+        profile = job_profile(self.job)
+        weights = profile.keyword_weights(KEYWORD_STATS.current())
+        self.assertGreater(weights.score({"graphql"}), 50)
+        self.assertLess(weights.score({"api"}), 50)
+        self.assertEqual(weights.score({"api", "graphql"}), 100)
+        self.assertEqual(
+            compute_match_score({"skills": ["python"], "experience_years": 3, "keywords": ["GraphQL"]}, self.job)[
+                "keyword_score"
+            ],
+            round(weights.score({"graphql"}), 2),
+        )
+
+    def test_stats_reload_when_corpus_grows(self):
+        self._store("k0@example.com", "api developer")
+        first = KEYWORD_STATS.current()
+        self.assertIs(KEYWORD_STATS.current(), first)
+
+        self._store("k1@example.com", "graphql developer")
+        self.assertIsNot(KEYWORD_STATS.current(), first)
+        self.assertEqual(KEYWORD_STATS.current().documents, 2)
+
+    def test_bulk_scores_match_scalar(self):
+        for i, text in enumerate(["api", "api graphql", "backend"]):
+            self._store(f"k{i}@example.com", text)
+        skills, experience, keywords = synthetic_applicants(200, seed=5)
+        keywords = [k + (["api"] if i % 3 else []) + (["GraphQL"] if i % 4 == 0 else []) for i, k in enumerate(keywords)]
+
+        bulk = BulkScorer(self.job).score(skills, experience, keywords=keywords)
+        for i in range(len(skills)):
+            scalar = compute_match_score(
+                {"skills": skills[i], "experience_years": experience[i], "keywords": keywords[i]}, self.job
+            )
+            self.assertEqual(bulk["keyword_score"][i], scalar["keyword_score"], i)
+            self.assertEqual(bulk["final_score"][i], scalar["final_score"], i)
+
+        with self.assertRaises(ValueError):
+            BulkScorer(self.job).keyword_scores(keyword_counts=[1])
+
+    def test_switching_scorer_rematches_stored_text(self):
+        fraction_job = Job.objects.create(
+            title="Fraction Job", slug="fraction-job", description="Role", location="Pune",
+            work_mode="onsite", employment_type="full_time", created_by=self.recruiter,
+            required_skills=["python"], jd_keywords=["api", "graphql"],
+        )
+        for i in range(4):
+            self._store(f"other{i}@example.com", "api developer")
+        application = self._store("switch@example.com", "graphql developer", job=fraction_job)
+        Application.objects.filter(pk=application.pk).update(keyword_score=50.0)
+
+        self.client.force_login(self.recruiter)
+        response = self.client.post(reverse("recruiter_job_edit", args=[fraction_job.id]), {
+            "title": fraction_job.title,
+            "description": fraction_job.description,
+            "required_skills": "python",
+            "jd_keywords": "api, graphql",
+            "keyword_scorer": "tfidf",
+            "salary_type": "negotiable",
+            "location": fraction_job.location,
+            "work_mode": fraction_job.work_mode,
+            "employment_type": fraction_job.employment_type,
+            "vacancies": "1",
+        })
+
+        self.assertEqual(response.status_code, 302)
+        fraction_job.refresh_from_db()
+        application.refresh_from_db()
+        self.assertEqual(fraction_job.keyword_scorer, "tfidf")
+        self.assertEqual(fraction_job.scoring_status, "current")
+        self.assertGreater(application.keyword_score, 50.0)
+
+    def test_benchmark_command_runs(self):
+        out = io.StringIO()
+        call_command("bench_keyword_scoring", applicants=200, documents=1000, stdout=out)
+        self.assertIn("rank correlation", out.getvalue())
+
+
+class ResumeBufferTests(TestCase):
+    def setUp(self):
+        self.pdf_bytes = SAMPLE_RESUME.read_bytes()
+
+    def _spooled_upload(self):
+        upload = TemporaryUploadedFile("resume.pdf", "application/pdf", len(self.pdf_bytes), None)
+        upload.write(self.pdf_bytes)
+        upload.flush()
+        self.addCleanup(upload.close)
+        return upload
+
+    def test_in_memory_upload_is_shared_not_copied(self):
+        upload = SimpleUploadedFile("resume.pdf", self.pdf_bytes, content_type="application/pdf")
+
+        with ResumeBuffer(upload) as buffer:
+            self.assertIsInstance(buffer.upload_body(), bytes)
+            self.assertIs(buffer.upload_body(), buffer.data)
+            self.assertEqual(buffer.digest(), hashlib.sha256(self.pdf_bytes).hexdigest())
+            text, _ = extract_pdf(buffer)
+
+        self.assertTrue(text)
+
+    def test_spooled_upload_is_memory_mapped(self):
+        upload = self._spooled_upload()
+
+        with ResumeBuffer(upload) as buffer:
+            self.assertEqual(buffer.digest(), hashlib.sha256(self.pdf_bytes).hexdigest())
+            body = buffer.upload_body()
+            self.assertIsInstance(body, io.FileIO)
+            body.close()
+
+            with open(SAMPLE_RESUME, "rb") as f:
+                self.assertEqual(extract_pdf(buffer), read_pdf(f))
+
+    @patch("applications.supabase_client.supabase")
+    def test_upload_closes_only_the_buffer_it_wrapped(self, supabase):
+        from applications.supabase_client import upload_resume
+
+        with patch.object(ResumeBuffer, "close", autospec=True) as close:
+            upload_resume(self._spooled_upload(), "job")
+            self.assertEqual(close.call_count, 1)
+
+            with ResumeBuffer(self._spooled_upload()) as buffer:
+                upload_resume(buffer, "job")
+                self.assertEqual(close.call_count, 1)
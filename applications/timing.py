@@ -0,0 +1,132 @@
+import logging
+import time
+from contextlib import contextmanager, nullcontext
+from functools import lru_cache
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+# =====================================================================
+# PER-STAGE TIMING
+# =====================================================================
+# Off unless PARSER_TIMING_ENABLED (env PARSER_TIMING=1). When off,
+# start_timer() returns a shared no-op timer, so instrumented code pays
+# one attribute lookup per stage.
+#
+# When on, parse_resume and compute_match_score attach
+# {"stage": milliseconds, ..., "total": ms} as result["timings"] and hand
+# the same dict to every sink: the dotted paths in PARSER_TIMING_SINKS
+# plus any sink registered at runtime with add_sink().
+#
+# A sink is any callable sink(event, timings), e.g. a logger (log_sink),
+# a metrics client observing one histogram per stage, or collect_timings()
+# in tests. Sink errors are logged and never reach the request.
+
+
+class StageTimer:
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.started = clock()
+        self.timings = {}
+
+    def _record(self, name, start):
+        self.timings[name] = round((self.clock() - start) * 1000, 3)
+
+    @contextmanager
+    def stage(self, name):
+        start = self.clock()
+        try:
+            yield
+        finally:
+            self._record(name, start)
+
+    def run(self, name, fn, *args):
+        start = self.clock()
+        try:
+            return fn(*args)
+        finally:
+            self._record(name, start)
+
+    def finish(self, event):
+        self._record("total", self.started)
+        emit(event, self.timings)
+        return self.timings
+
+
+class _NullTimer:
+    timings = None
+
+    def stage(self, name):
+        return nullcontext()
+
+    def run(self, name, fn, *args):
+        return fn(*args)
+
+    def finish(self, event):
+        return None
+
+
+NULL_TIMER = _NullTimer()
+
+
+def timing_enabled():
+    return getattr(settings, "PARSER_TIMING_ENABLED", False)
+
+
+def start_timer():
+    return StageTimer() if timing_enabled() else NULL_TIMER
+
+
+# ---------------------------------------------------------------------
+# SINKS
+# ---------------------------------------------------------------------
+_runtime_sinks = []
+
+
+def log_sink(event, timings):
+    stages = " ".join(f"{stage}={ms}ms" for stage, ms in timings.items())
+    logger.info(f"{event} timings | {stages}")
+
+
+@lru_cache(maxsize=None)
+def _load_sink(path):
+    return import_string(path)
+
+
+def add_sink(sink):
+    _runtime_sinks.append(sink)
+
+
+def remove_sink(sink):
+    if sink in _runtime_sinks:
+        _runtime_sinks.remove(sink)
+
+
+@contextmanager
+def collect_timings():
+    # test helper: yields a list that receives every (event, timings)
+    records = []
+
+    def sink(event, timings):
+        records.append((event, timings))
+
+    add_sink(sink)
+    try:
+        yield records
+    finally:
+        remove_sink(sink)
+
+
+def emit(event, timings):
+    sinks = [*getattr(settings, "PARSER_TIMING_SINKS", ["applications.timing.log_sink"]), *_runtime_sinks]
+
+    for sink in sinks:
+        try:
+            if isinstance(sink, str):
+                sink = _load_sink(sink)
+            sink(event, timings)
+        except Exception as e:
+            logger.warning(f"Timing sink {sink} failed | error={e}")
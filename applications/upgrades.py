@@ -0,0 +1,209 @@
+import logging
+import threading
+
+from django.conf import settings
+from django.db.models import Q
+
+from applications import background
+from applications.models import Application, ApplicationText
+from applications.parsing import PARSER_VERSION, SKILL_TAXONOMY
+from applications.rescoring import fetch_resume, rescore_resume, rescore_text, save_rescored
+from jobs.models import Job
+
+logger = logging.getLogger(__name__)
+
+# =====================================================================
+# LAZY UPGRADE OF STALE APPLICATIONS
+# =====================================================================
+# Every Application is stamped with the PARSER_VERSION and skill taxonomy
+# version its parsed fields and scores came from. After a parser release
+# or a taxonomy edit, older rows are "stale" and are brought up to date
+# lazily instead of in one big migration:
+#
+#   - on read: the recruiter detail view is upgraded synchronously, and so
+#     are the rows of the list page being rendered that have a stored
+#     ApplicationText (a reparse, no download);
+#   - in the background: the remaining stale rows of that recruiter, page
+#     rows that still need their PDF downloaded included, are queued to
+#     the background thread and upgraded in small batches.
+#
+# Until then a row is "pending": list pages and the list API flag it and
+# show its scores as provisional, and the ranked candidates leave it out
+# (of the rows and of the percentiles), so no ranking compares scores
+# from two parser generations.
+#
+# Upgrades reparse the stored ApplicationText; only rows saved before it
+# existed download their PDF once. A row that cannot be upgraded (no
+# resume, download failure, empty text) keeps its old values and is not
+# retried by this process until the versions change again.
+#
+# APPLICATION_UPGRADE_MODE: "background" (default) or "off" (no upgrades
+# on read). BACKGROUND_TASK_MODE=eager runs the queued batches inline.
+
+# ids waiting in the executor, so repeated page views do not queue twice
+_queued = set()
+_queued_lock = threading.Lock()
+
+# ids whose upgrade failed at _failed_versions, forgotten when the
+# versions change, so the set never outgrows one version's failures
+_failed = set()
+_failed_versions = None
+
+
+def upgrade_mode():
+    return getattr(settings, "APPLICATION_UPGRADE_MODE", "background")
+
+
+def current_versions():
+    return PARSER_VERSION, SKILL_TAXONOMY.current()[0]
+
+
+def failed_ids(versions):
+    global _failed_versions
+    if versions != _failed_versions:
+        _failed.clear()
+        _failed_versions = versions
+    return _failed
+
+
+def is_stale(application, versions):
+    parser_version, taxonomy_version = versions
+    return application.parser_version < parser_version or application.taxonomy_version < taxonomy_version
+
+
+def stale_filter(versions):
+    # "<" rather than "!=": a row stamped by a newer deploy is never downgraded
+    parser_version, taxonomy_version = versions
+    return Q(parser_version__lt=parser_version) | Q(taxonomy_version__lt=taxonomy_version)
+
+
+def pending_versions():
+    # the versions a pending row is behind; None with upgrades off, when
+    # rows are shown as stored since nothing would ever upgrade them
+    return None if upgrade_mode() == "off" else current_versions()
+
+
+def is_pending(application, versions):
+    """Whether ``application`` still waits for an upgrade to ``versions`` (see pending_versions)."""
+    return (
+        versions is not None and application.job_id is not None and is_stale(application, versions)
+        and application.id not in failed_ids(versions)
+    )
+
+
+def pending_filter():
+    """Q matching the rows waiting for an upgrade, or None with upgrades off."""
+    versions = pending_versions()
+    if versions is None:
+        return None
+    return stale_filter(versions) & ~Q(id__in=list(failed_ids(versions)))
+
+
+def count_pending(queryset):
+    pending = pending_filter()
+    return 0 if pending is None else queryset.filter(pending, job__isnull=False).count()
+
+
+def upgrade_applications(applications, download=True):
+    """Reparse and rescore the stale ones among ``applications`` in place.
+
+    The instances are updated as well as the rows, so a caller can render
+    them right away. With ``download=False`` rows without a stored
+    ApplicationText are left stale for the background queue. Returns the
+    number upgraded.
+    """
+    if upgrade_mode() == "off":
+        return 0
+
+    taxonomy = SKILL_TAXONOMY.current()
+    versions = (PARSER_VERSION, taxonomy[0])
+    failed = failed_ids(versions)
+    stale = [
+        app for app in applications
+        if app.job_id and is_stale(app, versions) and app.id not in failed
+    ]
+    if not stale:
+        return 0
+
+    jobs = Job.objects.in_bulk({app.job_id for app in stale})
+    blobs = dict(
+        ApplicationText.objects.filter(application_id__in=[app.id for app in stale])
+        .values_list("application_id", "compressed_text")
+    )
+
+    updates, texts = [], []
+    for app in stale:
+        try:
+            if app.id in blobs:
+                fields = rescore_text(ApplicationText.decompress(bytes(blobs[app.id])), jobs[app.job_id], taxonomy)
+            elif not download:
+                continue
+            elif app.resume_url:
+                fields, text = rescore_resume(fetch_resume(app.resume_url), jobs[app.job_id], taxonomy)
+                if fields is not None:
+                    texts.append(ApplicationText.build(app, text))
+            else:
+                fields = None
+        except Exception as e:
+            logger.warning(f"Application upgrade failed | application={app.id} error={e}")
+            fields = None
+
+        if fields is None:
+            failed.add(app.id)
+            continue
+
+        for name, value in fields.items():
+            setattr(app, name, value)
+        updates.append(app)
+
+    if updates:
+        save_rescored(updates, texts)
+        logger.info(f"Upgraded {len(updates)} applications | parser_version={versions[0]} taxonomy_version={versions[1]}")
+    return len(updates)
+
+
+def _upgrade_ids(ids):
+    try:
+        upgrade_applications(list(Application.objects.filter(id__in=ids).order_by("id")))
+    except Exception:
+        logger.exception(f"Background application upgrade failed | ids={ids[0]}..{ids[-1]}")
+    finally:
+        with _queued_lock:
+            _queued.difference_update(ids)
+
+
+def schedule_upgrade(ids):
+    """Queue application ids for upgrade once the current transaction commits."""
+    if upgrade_mode() == "off" or not ids:
+        return
+
+    batch_size = getattr(settings, "APPLICATION_UPGRADE_BATCH_SIZE", 20)
+    for start in range(0, len(ids), batch_size):
+        background.submit(_upgrade_ids, ids[start:start + batch_size])
+
+
+def queue_stale_applications(queryset):
+    """Queue the stale rows of ``queryset`` (up to the per-request limit)."""
+    if upgrade_mode() == "off":
+        return 0
+
+    limit = getattr(settings, "APPLICATION_UPGRADE_QUEUE_LIMIT", 200)
+    versions = current_versions()
+    with _queued_lock:
+        queued = list(_queued)
+
+    ids = list(
+        queryset.filter(stale_filter(versions), job__isnull=False)
+        .exclude(id__in=queued)
+        .order_by("-applied_at")
+        .values_list("id", flat=True)[:limit]
+    )
+    failed = failed_ids(versions)
+    ids = [app_id for app_id in ids if app_id not in failed]
+
+    with _queued_lock:
+        ids = [app_id for app_id in ids if app_id not in _queued]
+        _queued.update(ids)
+
+    schedule_upgrade(ids)
+    return len(ids)
@@ -1,6 +1,6 @@
 from django.urls import path
 from django.shortcuts import render
-from applications.views.public import apply_job
+from applications.views.public import apply_job, apply_multiple
 
 from applications.views.recruiter import (
     recruiter_application_list, recruiter_application_detail,
@@ -13,6 +13,7 @@ from applications.views.admin import (
 urlpatterns = [
     # Public
     path("applications/apply/<slug:slug>/", apply_job, name="apply_job"),
+    path("applications/apply-multiple/", apply_multiple, name="apply_multiple"),
     path("applications/success/", lambda r: render(r, "applications/success.html"), name="application_success"),
 
     # Recruiter
@@ -1,28 +1,21 @@
-import re
-# =====================================================================
-# NORMALIZER (SAFE + CONSISTENT)
-# =====================================================================
-
-def normalize(text):
-    if not text:
-        return []
-
-    if isinstance(text, list):
-        return [" ".join(t.lower().split()) for t in text if t.strip()]
-
-    if isinstance(text, str):
-        parts = re.split(r"[,\n]", text)
-        return [" ".join(p.lower().split()) for p in parts if p.strip()]
-
-    return []
+from applications.document import resume_document
+from applications.keyword_stats import KEYWORD_STATS
+from applications.normalization import normalize
+from applications.profiles import job_profile
+from applications.similarity import similarity_score_for
+from applications.timing import start_timer
 
 # =====================================================================
 # SKILL SCORE
 # =====================================================================
 
 def compute_skill_score(parsed_skills, job_required_skills):
+    return skill_score_for(parsed_skills, set(normalize(job_required_skills)))
+
+
+def skill_score_for(parsed_skills, required):
+    # ``required``: the normalized set, e.g. JobProfile.required_skills
     parsed = set(normalize(parsed_skills))
-    required = set(normalize(job_required_skills))
 
     if not required:
         return 100, list(parsed), []
@@ -59,54 +52,100 @@ def compute_experience_score(parsed_exp, job_min, job_max):
 # =====================================================================
 
 def compute_keyword_score(parsed_keywords, jd_keywords):
+    return keyword_score_for(parsed_keywords, set(normalize(jd_keywords)))
+
+
+def keyword_score_for(parsed_keywords, jd):
+    # ``jd``: the normalized set, e.g. JobProfile.jd_keywords
     p = set(normalize(parsed_keywords))
-    j = set(normalize(jd_keywords))
 
-    if not j:
+    if not jd:
         return 100
 
-    matched = len(p.intersection(j))
-    return (matched / len(j)) * 100
+    matched = len(p.intersection(jd))
+    return (matched / len(jd)) * 100
+
+
+def weighted_keyword_score_for(parsed_keywords, weights):
+    # ``weights``: JobProfile.keyword_weights(), for keyword_scorer "tfidf"
+    return weights.score(set(normalize(parsed_keywords)))
+
 
 # =====================================================================
 # FINAL MATCH SCORE
 # =====================================================================
 
-def compute_match_score(parsed_data, job):
+def compute_match_score(parsed_data, job, corpus_stats=None):
+    # corpus_stats: a KEYWORD_STATS.current() snapshot for the TF-IDF
+    # scorer, loaded here when not given
+    timer = start_timer()
+    # the job's normalized sets and bounds, built once per job version
+    profile = job_profile(job)
 
-    skill_score, matched_skills, missing_skills = compute_skill_score(
+    skill_score, matched_skills, missing_skills = timer.run(
+        "skill_score",
+        skill_score_for,
         parsed_data.get("skills", []),
-        job.required_skills
+        profile.required_skills
     )
 
-    experience_score = compute_experience_score(
+    experience_score = timer.run(
+        "experience_score",
+        compute_experience_score,
         parsed_data.get("experience_years", 0),
-        job.min_experience,
-        job.max_experience
+        profile.min_experience,
+        profile.max_experience
     )
 
-    keyword_score = compute_keyword_score(
-        parsed_data.get("keywords", []),
-        job.jd_keywords
+    if profile.keyword_scorer == "tfidf":
+        keyword_score = timer.run(
+            "keyword_score",
+            weighted_keyword_score_for,
+            parsed_data.get("keywords", []),
+            profile.keyword_weights(corpus_stats or KEYWORD_STATS.current())
+        )
+    else:
+        keyword_score = timer.run(
+            "keyword_score",
+            keyword_score_for,
+            parsed_data.get("keywords", []),
+            profile.jd_keywords
+        )
+
+    # the raw text's document is shared with keyword extraction (resume_document)
+    raw_text = parsed_data.get("raw_text")
+    similarity_score = timer.run(
+        "similarity_score",
+        similarity_score_for,
+        resume_document(raw_text) if raw_text else None,
+        profile
     )
 
+    skill_weight, experience_weight, keyword_weight, similarity_weight = profile.score_weights
     final_score = (
-        (skill_score * 0.50) +
-        (experience_score * 0.30) +
-        (keyword_score * 0.20)
+        (skill_score * skill_weight) +
+        (experience_score * experience_weight) +
+        (keyword_score * keyword_weight) +
+        (similarity_score * similarity_weight)
     )
 
     final_score = max(0, min(100, final_score))
 
-    return {
+    result = {
         "final_score": round(final_score, 2),
         "matched_skills": matched_skills,
         "missing_skills": missing_skills,
         "skill_score": round(skill_score, 2),
         "experience_score": round(experience_score, 2),
         "keyword_score": round(keyword_score, 2),
+        "similarity_score": similarity_score,
     }
 
+    timings = timer.finish("compute_match_score")
+    if timings is not None:
+        result["timings"] = timings
+    return result
+
 # =====================================================================
 # SUMMARY (ROLE-NEUTRAL, SAFE)
 # =====================================================================
@@ -1,7 +1,8 @@
 from django.shortcuts import render, redirect, get_object_or_404
-from applications.forms import ApplicationForm
+from applications.forms import ApplicationForm, MultiApplicationForm
+from applications.multi_apply import already_applied, create_applications
 from jobs.models import Job
-from applications.models import Application
+from applications.models import Application, ApplicationText
 from applications.parsing import parse_resume
 from applications.utils import (
     compute_match_score,
@@ -10,6 +11,7 @@ from applications.utils import (
     fit_category,
 )
 from applications.supabase_client import upload_resume
+from applications.ingest import ResumeBuffer
 import logging
 
 logger = logging.getLogger(__name__)
@@ -37,58 +39,69 @@ def apply_job(request, slug):
                 form.add_error("resume", "Resume is required.")
                 return render(request, "applications/apply.html", {"form": form, "job": job})
 
-            # PARSING RESUME 
-            try:
-                resume_file.seek(0)
-                parsed = parse_resume(resume_file, job)
-
-            except ValueError as e:
-                form.add_error("resume", str(e))
-                return render(request, "applications/apply.html", {"form": form, "job": job})
+            # one read of the upload, shared by parser, hasher and uploader
+            with ResumeBuffer(resume_file) as resume_buffer:
+                # PARSING RESUME 
+                try:
+                    parsed = parse_resume(resume_buffer, job)
+
+                except ValueError as e:
+                    form.add_error("resume", str(e))
+                    return render(request, "applications/apply.html", {"form": form, "job": job})
+
+                except Exception as e:
+                    logger.exception("Unexpected parsing error")
+                    form.add_error("resume", "Resume processing failed. Please try again.")
+                    return render(request, "applications/apply.html", {"form": form, "job": job})
+
+                # SCORING
+                scoring = compute_match_score(parsed, job)
+
+                application.match_score = scoring["final_score"]
+                application.skill_score = scoring["skill_score"]
+                application.experience_score = scoring["experience_score"]
+                application.keyword_score = scoring["keyword_score"]
+                application.similarity_score = scoring["similarity_score"]
+                application.matched_skills = scoring["matched_skills"]
+                application.missing_skills = scoring["missing_skills"]
+
+                application.summary = generate_summary(parsed, scoring["final_score"])
+                application.evaluation = evaluate_candidate(scoring["final_score"])
+                application.fit_category = fit_category(scoring["final_score"])
+
+                application.parsed_name = parsed.get("name")
+                application.parsed_email = parsed.get("email")
+                application.parsed_phone = parsed.get("phone")
+                application.parsed_experience = parsed.get("experience_years")
+                application.parsed_skills = parsed.get("skills")
+                application.parsed_projects = parsed.get("projects")
+                application.parsed_education = parsed.get("education")
+                application.parsed_certifications = parsed.get("certifications")
+
+                application.parser_version = parsed.get("parser_version", 0)
+                application.taxonomy_version = parsed.get("taxonomy_version", 0)
+
+                # SUPABASE UPLOAD (same buffer the parser read)
+                try:
+                    application.resume_url = upload_resume(resume_buffer, job.slug)
+                except Exception as e:
+                    logger.exception(e)
+                    form.add_error("resume", f"Upload failed: {str(e)}")
+                    return render(request, "applications/apply.html", {"form": form, "job": job})
 
-            except Exception as e:
-                logger.exception("Unexpected parsing error")
-                form.add_error("resume", "Resume processing failed. Please try again.")
-                return render(request, "applications/apply.html", {"form": form, "job": job})
-
-            # SCORING
-            scoring = compute_match_score(parsed, job)
-
-            application.match_score = scoring["final_score"]
-            application.skill_score = scoring["skill_score"]
-            application.experience_score = scoring["experience_score"]
-            application.keyword_score = scoring["keyword_score"]
-            application.matched_skills = scoring["matched_skills"]
-            application.missing_skills = scoring["missing_skills"]
-
-            application.summary = generate_summary(parsed, scoring["final_score"])
-            application.evaluation = evaluate_candidate(scoring["final_score"])
-            application.fit_category = fit_category(scoring["final_score"])
-
-            application.parsed_name = parsed.get("name")
-            application.parsed_email = parsed.get("email")
-            application.parsed_phone = parsed.get("phone")
-            application.parsed_experience = parsed.get("experience_years")
-            application.parsed_skills = parsed.get("skills")
-            application.parsed_projects = parsed.get("projects")
-            application.parsed_education = parsed.get("education")
-            application.parsed_certifications = parsed.get("certifications")
-
-            # SUPABASE UPLOAD (seek(0) is handled inside upload_resume too)
+            # FINAL SAVE
             try:
-                application.resume_url = upload_resume(resume_file, job.slug)
+                application.save()
             except Exception as e:
                 logger.exception(e)
-                form.add_error("resume", f"Upload failed: {str(e)}")
+                form.add_error(None, f"Persistence error: {str(e)}")
                 return render(request, "applications/apply.html", {"form": form, "job": job})
 
-            # FINAL SAVE
+            # kept for later rescoring; losing it only costs a re-download
             try:
-                application.save()
+                ApplicationText.store(application, parsed.get("raw_text"))
             except Exception as e:
                 logger.exception(e)
-                form.add_error(None, f"Persistence error: {str(e)}")
-                return render(request, "applications/apply.html", {"form": form, "job": job})
 
             return redirect("application_success")
 
@@ -96,3 +109,59 @@ def apply_job(request, slug):
         form = ApplicationForm()
 
     return render(request, "applications/apply.html", {"form": form, "job": job})
+
+
+# =================================================================
+#                    APPLY TO SEVERAL JOBS
+# =================================================================
+def apply_multiple(request):
+    if request.method == "POST":
+        form = MultiApplicationForm(request.POST, request.FILES)
+
+        if form.is_valid():
+            jobs = list(form.cleaned_data["jobs"])
+            email = form.cleaned_data["email"]
+
+            # nothing left to apply to: do not parse or upload
+            if len(already_applied(jobs, email)) == len(jobs):
+                form.add_error("email", "You have already applied for these jobs.")
+                return render(request, "applications/apply_multiple.html", {"form": form})
+
+            # one parse and one upload for every selected job
+            with ResumeBuffer(form.cleaned_data["resume"]) as resume_buffer:
+                try:
+                    parsed = parse_resume(resume_buffer)
+
+                except ValueError as e:
+                    form.add_error("resume", str(e))
+                    return render(request, "applications/apply_multiple.html", {"form": form})
+
+                except Exception as e:
+                    logger.exception("Unexpected parsing error")
+                    form.add_error("resume", "Resume processing failed. Please try again.")
+                    return render(request, "applications/apply_multiple.html", {"form": form})
+
+                try:
+                    resume_url = upload_resume(resume_buffer, jobs[0].slug)
+                except Exception as e:
+                    logger.exception(e)
+                    form.add_error("resume", f"Upload failed: {str(e)}")
+                    return render(request, "applications/apply_multiple.html", {"form": form})
+
+            try:
+                created, duplicates = create_applications(jobs, form.cleaned_data, parsed, resume_url)
+            except Exception as e:
+                logger.exception(e)
+                form.add_error(None, f"Persistence error: {str(e)}")
+                return render(request, "applications/apply_multiple.html", {"form": form})
+
+            return render(request, "applications/apply_multiple_result.html", {
+                "applied_jobs": [app.job for app in created],
+                "duplicate_jobs": duplicates,
+            })
+
+    else:
+        # ?jobs=<slug>&jobs=<slug> preselects openings
+        form = MultiApplicationForm(initial={"jobs": request.GET.getlist("jobs")})
+
+    return render(request, "applications/apply_multiple.html", {"form": form})
@@ -2,7 +2,17 @@ from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import PermissionDenied
 from django.core.paginator import Paginator
+from django.http import HttpResponseBadRequest
 from applications.models import Application
+from applications.upgrades import (
+    count_pending,
+    is_pending,
+    pending_filter,
+    pending_versions,
+    queue_stale_applications,
+    upgrade_applications,
+)
+from applications.ranking import InvalidCursor, parse_limit, ranked_applications
 from django.db.models import Q
 
 import logging
@@ -21,6 +31,23 @@ def application_queryset_for(user):
     return Application.objects.filter(job__created_by=user, job__is_deleted=False)
 
 
+def upgraded_page(paginator, number, user):
+    # the rows shown with a stored text are brought to the current parser /
+    # taxonomy version before rendering; the recruiter's other stale rows,
+    # those that need a PDF download included, follow in the background.
+    # Rows still pending are flagged and the page shown as provisional.
+    page = paginator.get_page(number)
+    page.object_list = list(page.object_list)
+    upgrade_applications(page.object_list, download=False)
+    queue_stale_applications(application_queryset_for(user))
+
+    versions = pending_versions()
+    for application in page.object_list:
+        application.pending_upgrade = is_pending(application, versions)
+    page.provisional = any(application.pending_upgrade for application in page.object_list)
+    return page
+
+
 # =================================================================
 #                    RECRUITER APPLICATION LIST
 # =================================================================
@@ -51,7 +78,7 @@ def recruiter_application_list(request):
     }
 
     paginator = Paginator(qs, 10)
-    page = paginator.get_page(request.GET.get("page"))
+    page = upgraded_page(paginator, request.GET.get("page"), request.user)
 
     return render(request, "recruiter/applications/list.html", {
         "applications_page": page,
@@ -81,6 +108,8 @@ def recruiter_application_detail(request, pk):
 
         return redirect("recruiter_application_detail", pk=application.pk)
 
+    upgrade_applications([application])
+
     return render(request, "recruiter/applications/detail.html", {
         "application": application,
     })
@@ -134,7 +163,7 @@ def recruiter_job_applications(request, job_id):
     }
 
     paginator = Paginator(qs, 10)
-    page = paginator.get_page(request.GET.get("page"))
+    page = upgraded_page(paginator, request.GET.get("page"), request.user)
 
     return render(request, "recruiter/applications/list.html", {
         "job": job,
@@ -142,3 +171,38 @@ def recruiter_job_applications(request, job_id):
         "page_obj": page,
         "counts": counts,
     })
+
+
+# =================================================================
+#              JOB-SPECIFIC RANKED CANDIDATES
+# =================================================================
+@login_required
+def recruiter_job_ranked(request, job_id):
+
+    if request.user.role not in ["RECRUITER", "ADMIN"]:
+        logger.warning(f"Unauthorized ranked-candidates access by {request.user.email}")
+        raise PermissionDenied()
+
+    job = get_object_or_404(job_queryset_for(request.user), id=job_id)
+    limit = parse_limit(request.GET.get("limit"))
+
+    try:
+        candidates, next_cursor = ranked_applications(
+            application_queryset_for(request.user), job,
+            limit=limit, after=request.GET.get("cursor"), exclude=pending_filter(),
+        )
+    except InvalidCursor:
+        return HttpResponseBadRequest("Invalid cursor")
+
+    # stale rows are upgraded in the background and ranked once they are current
+    job_applications = application_queryset_for(request.user).filter(job=job)
+    queue_stale_applications(job_applications)
+
+    return render(request, "recruiter/applications/ranked.html", {
+        "job": job,
+        "candidates": candidates,
+        "pending_count": count_pending(job_applications),
+        "next_cursor": next_cursor,
+        "limit": limit,
+        "is_first_page": not request.GET.get("cursor"),
+    })
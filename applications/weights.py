@@ -0,0 +1,134 @@
+import numpy as np
+from django.conf import settings
+
+from applications.bulk_scoring import final_scores, mark_scored, summary_with_score
+from applications.matchers import MatcherCache
+from applications.models import Application
+from applications.profiles import job_profile
+from applications.utils import evaluate_candidate, fit_category
+
+# =====================================================================
+# WHAT-IF SCORING WEIGHTS
+# =====================================================================
+# match_score = skill * w1 + experience * w2 + keyword * w3 +
+# similarity * w4, with the job's weights (Job.WEIGHT_FIELDS, 50/30/20/0
+# by default). Every application stores its component scores, so trying
+# other weights needs no rescoring: the job's components are read once
+# into an (applicants x 4) array and the ranking is recomputed in memory.
+# Nothing is written.
+#
+# The arrays are kept per process (JOB_COMPONENTS) while the job's scoring
+# and scored versions stay, so a recruiter trying weight after weight
+# reads the applicants once. New applicants in this process drop the
+# entry; entries also expire after WHAT_IF_CACHE_SECONDS (60), which
+# bounds how long other processes' new applicants or upgrades are missed.
+#
+# Saving the weights on the job sends scoring_fields_changed like any
+# requirements edit; for a change of weights alone the queued task is
+# reweight_job, which writes the new match_score (and the evaluation, fit
+# category and summary that follow from it) with one bulk_update. It reads
+# the same stored components as the preview, so the saved ranking is the
+# one the recruiter saw.
+
+COMPONENT_FIELDS = ("skill_score", "experience_score", "keyword_score", "similarity_score")
+REWEIGHT_FIELDS = ["match_score", "summary", "evaluation", "fit_category"]
+
+
+def as_fractions(job, weights):
+    # {"skill_weight": 70, ...} in percent -> (0.7, ...) in WEIGHT_FIELDS order
+    return tuple(weights[name] / 100 for name in job.WEIGHT_FIELDS)
+
+
+class JobComponents:
+    """A job's applicants as arrays: ids, stored match scores, component scores."""
+
+    def __init__(self, job):
+        rows = list(
+            Application.objects.filter(job=job)
+            .order_by("id")
+            .values_list("id", "match_score", *COMPONENT_FIELDS)
+        )
+        self.ids = np.array([row[0] for row in rows], dtype=np.int64)
+        self.match_score = np.array([row[1] for row in rows], dtype=np.float64)
+        self.components = np.array([row[2:] for row in rows], dtype=np.float64).reshape(
+            len(rows), len(COMPONENT_FIELDS)
+        )
+
+    def __len__(self):
+        return len(self.ids)
+
+    def scores(self, weights):
+        """match_score of every applicant under ``weights`` (fractions)."""
+        return final_scores(*self.components.T, weights)
+
+    def order(self, scores):
+        # best first, ties by id, as the ranked candidates list
+        return np.lexsort((self.ids, -np.asarray(scores, dtype=np.float64)))
+
+
+def scoring_versions(job):
+    return job.scoring_version, job.scored_version
+
+
+JOB_COMPONENTS = MatcherCache(
+    JobComponents,
+    max_size=getattr(settings, "WHAT_IF_CACHE_SIZE", 64),
+    version=scoring_versions,
+    max_age=getattr(settings, "WHAT_IF_CACHE_SECONDS", 60),
+)
+
+
+def rerank(job, weights, limit=20):
+    """``job``'s top ``limit`` applicants if it used ``weights`` (percent per field).
+
+    Each entry holds the Application, its match_score under ``weights``
+    and its rank there, next to the stored score and rank.
+    """
+    data = JOB_COMPONENTS.get(job)
+    if not len(data):
+        return []
+
+    scores = data.scores(as_fractions(job, weights))
+    current_rank = np.empty(len(data), dtype=np.int64)
+    current_rank[data.order(data.match_score)] = np.arange(1, len(data) + 1)
+
+    top = data.order(scores)[:limit].tolist()
+    applications = Application.objects.only("id", "full_name", "email", "status").in_bulk(
+        data.ids[top].tolist()
+    )
+    return [
+        {
+            "application": applications[int(data.ids[i])],
+            "match_score": scores[i],
+            "rank": rank,
+            "current_score": float(data.match_score[i]),
+            "current_rank": int(current_rank[i]),
+            "fit_category": fit_category(scores[i]),
+        }
+        for rank, i in enumerate(top, start=1)
+    ]
+
+
+def reweight_job(job, batch_size=1000):
+    """Recompute match_score of ``job``'s applicants from their stored components.
+
+    Marks the job's current weights as scored and returns the number of
+    applications written.
+    """
+    data = JobComponents(job)
+    scores = data.scores(job_profile(job).score_weights)
+    summaries = dict(Application.objects.filter(job=job).values_list("id", "summary"))
+
+    updates = [
+        Application(
+            id=app_id,
+            match_score=score,
+            summary=summary_with_score(summaries.get(app_id), score),
+            evaluation=evaluate_candidate(score),
+            fit_category=fit_category(score),
+        )
+        for app_id, score in zip(data.ids.tolist(), scores)
+    ]
+    Application.objects.bulk_update(updates, REWEIGHT_FIELDS, batch_size=batch_size)
+    mark_scored(job)
+    return len(updates)
@@ -115,10 +115,72 @@ DATABASES = {
 CACHES = {
     "default": {
         "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
-    }
+    },
+    # parsed resumes by file hash, shared by all gunicorn workers
+    # (table created with `python manage.py createcachetable`)
+    "resume_parse": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "resume_parse_cache",
+        "TIMEOUT": int(os.getenv("RESUME_PARSE_CACHE_TIMEOUT", str(60 * 60 * 24 * 7))),
+        "OPTIONS": {
+            "MAX_ENTRIES": int(os.getenv("RESUME_PARSE_CACHE_MAX_ENTRIES", "5000")),
+            "CULL_FREQUENCY": 4,
+        },
+    },
 }
 
 
+# -------------------------------------------------------------------
+# RESUME PARSING
+# -------------------------------------------------------------------
+# text backend: pypdf2 (default), pypdf, pymupdf or pdfminer -- compare
+# them with `python manage.py bench_pdf_backends`
+PDF_TEXT_BACKEND = os.getenv("PDF_TEXT_BACKEND", "pypdf2")
+
+# "inline" extracts in the request thread, "pool" in worker processes
+PDF_EXTRACTION_MODE = os.getenv("PDF_EXTRACTION_MODE", "inline")
+PDF_EXTRACTION_WORKERS = int(os.getenv("PDF_EXTRACTION_WORKERS", "2"))
+PDF_EXTRACTION_TIMEOUT = float(os.getenv("PDF_EXTRACTION_TIMEOUT", "15"))
+PDF_EXTRACTION_MAX_MEMORY_MB = int(os.getenv("PDF_EXTRACTION_MAX_MEMORY_MB", "512"))
+PDF_EXTRACTION_MAX_TASKS_PER_CHILD = int(os.getenv("PDF_EXTRACTION_MAX_TASKS_PER_CHILD", "50"))
+
+# pages are read lazily until a budget is spent
+PDF_MAX_PAGES = int(os.getenv("PDF_MAX_PAGES", "5"))
+PDF_TEXT_CHAR_BUDGET = int(os.getenv("PDF_TEXT_CHAR_BUDGET", "20000"))
+PDF_TEXT_TIME_BUDGET = float(os.getenv("PDF_TEXT_TIME_BUDGET", "5"))
+# stop reading pages once these sections are complete (off by default: a
+# section after them that runs onto the next page is cut), e.g.
+# "skills,experience,education,projects,certifications"
+PDF_REQUIRED_SECTIONS = [
+    s.strip() for s in os.getenv("PDF_REQUIRED_SECTIONS", "").split(",") if s.strip()
+]
+
+# per-stage timings for parse_resume / compute_match_score (off by default);
+# sinks are dotted paths to callables sink(event, timings)
+PARSER_TIMING_ENABLED = os.getenv("PARSER_TIMING", "false").lower() in ("1", "true", "yes")
+PARSER_TIMING_SINKS = [
+    s.strip() for s in os.getenv("PARSER_TIMING_SINKS", "applications.timing.log_sink").split(",") if s.strip()
+]
+
+# work queued after a request runs on one thread per process; "eager"
+# runs it inline instead
+BACKGROUND_TASK_MODE = os.getenv("BACKGROUND_TASK_MODE", "thread")
+
+# applications parsed by an older PARSER_VERSION / skill taxonomy are
+# upgraded on read and in the background: "background" or "off"
+APPLICATION_UPGRADE_MODE = os.getenv("APPLICATION_UPGRADE_MODE", "background")
+APPLICATION_UPGRADE_BATCH_SIZE = int(os.getenv("APPLICATION_UPGRADE_BATCH_SIZE", "20"))
+APPLICATION_UPGRADE_QUEUE_LIMIT = int(os.getenv("APPLICATION_UPGRADE_QUEUE_LIMIT", "200"))
+
+# the TF-IDF keyword scorer reloads its corpus statistics once the number
+# of stored resumes moved by more than this share
+KEYWORD_STATS_REFRESH_RATIO = float(os.getenv("KEYWORD_STATS_REFRESH_RATIO", "0.01"))
+
+# columns of the hashed n-gram vectors behind the text similarity score
+# (rounded down to a power of two)
+SIMILARITY_DIMENSIONS = int(os.getenv("SIMILARITY_DIMENSIONS", "8192"))
+
+
 # -------------------------------------------------------------------
 # AUTH
 # -------------------------------------------------------------------
@@ -194,4 +256,6 @@ if "test" in sys.argv:
     DATABASES["default"] = {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "test_db.sqlite3",
-    }
\ No newline at end of file
+    }
+    # no background threads against the test database
+    BACKGROUND_TASK_MODE = "eager"
\ No newline at end of file
@@ -22,6 +22,10 @@ class JobForm(forms.ModelForm):
 
     def clean_jd_keywords(self):
         return [x.strip().lower() for x in self.cleaned_data.get("jd_keywords", "").split(",") if x.strip()]
+
+    def clean_keyword_scorer(self):
+        # optional in the form: unchanged unless chosen
+        return self.cleaned_data.get("keyword_scorer") or self.instance.keyword_scorer
     
     class Meta:
         model = Job
@@ -32,6 +36,11 @@ class JobForm(forms.ModelForm):
             "created_at",
             "required_skills",
             "jd_keywords",
+            # set through the weights API
+            "skill_weight",
+            "experience_weight",
+            "keyword_weight",
+            "similarity_weight",
         ]
         widgets = {
                 "deadline": forms.DateInput(attrs={"type": "date"}),
@@ -45,6 +54,7 @@ class JobForm(forms.ModelForm):
         # ----------------------------
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self.fields["keyword_scorer"].required = False
 
         if self.instance.pk:
             self.initial["required_skills"] = ", ".join(self.instance.required_skills or [])
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-17 01:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0007_job_required_education'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='content_version',
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-10-17 02:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0008_job_content_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='scored_version',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='scoring_version',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
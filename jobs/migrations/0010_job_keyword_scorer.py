@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-17 02:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0009_job_scoring_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='keyword_scorer',
+            field=models.CharField(choices=[('fraction', 'Share of keywords found'), ('tfidf', 'Weighted by keyword rarity (TF-IDF)')], default='fraction', help_text='TF-IDF counts a rare keyword for more than one most resumes mention', max_length=20),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.8 on 2026-10-17 02:47
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0010_job_keyword_scorer'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='experience_weight',
+            field=models.PositiveSmallIntegerField(default=30, validators=[django.core.validators.MaxValueValidator(100)]),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='keyword_weight',
+            field=models.PositiveSmallIntegerField(default=20, validators=[django.core.validators.MaxValueValidator(100)]),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='skill_weight',
+            field=models.PositiveSmallIntegerField(default=50, validators=[django.core.validators.MaxValueValidator(100)]),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.8 on 2026-10-17 02:51
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0011_job_scoring_weights'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='similarity_weight',
+            field=models.PositiveSmallIntegerField(default=0, validators=[django.core.validators.MaxValueValidator(100)]),
+        ),
+    ]
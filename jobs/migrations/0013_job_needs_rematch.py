@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-17 03:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0012_job_similarity_weight'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='needs_rematch',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+    ]
@@ -1,9 +1,13 @@
-from django.db import models
+from django.db import models, transaction
+from django.core.validators import MaxValueValidator
 from core import settings
 from django.utils.text import slugify
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 from decimal import Decimal
+import copy
+
+from jobs.signals import scoring_fields_changed
 
 
 class Job(models.Model):
@@ -58,6 +62,85 @@ class Job(models.Model):
     required_skills = models.JSONField(default=list)
     jd_keywords = models.JSONField(default=list, blank=True)
 
+    KEYWORD_SCORERS = [
+        ("fraction", "Share of keywords found"),
+        ("tfidf", "Weighted by keyword rarity (TF-IDF)"),
+    ]
+    keyword_scorer = models.CharField(
+        max_length=20, choices=KEYWORD_SCORERS, default="fraction",
+        help_text="TF-IDF counts a rare keyword for more than one most resumes mention",
+    )
+
+    # share of the match score per component, in percent; they add up to 100
+    skill_weight = models.PositiveSmallIntegerField(default=50, validators=[MaxValueValidator(100)])
+    experience_weight = models.PositiveSmallIntegerField(default=30, validators=[MaxValueValidator(100)])
+    keyword_weight = models.PositiveSmallIntegerField(default=20, validators=[MaxValueValidator(100)])
+    # resume text vs description (applications.similarity); off by default
+    similarity_weight = models.PositiveSmallIntegerField(default=0, validators=[MaxValueValidator(100)])
+
+    WEIGHT_FIELDS = ("skill_weight", "experience_weight", "keyword_weight", "similarity_weight")
+
+    # bumped by every save of an existing job; per-process caches key
+    # compiled job data (applications.profiles) on it
+    content_version = models.PositiveIntegerField(default=1, editable=False)
+
+    # bumped when a field in SCORING_FIELDS changes; scored_version catches
+    # up once the applicants have been rescored against it
+    scoring_version = models.PositiveIntegerField(default=0, editable=False)
+    scored_version = models.PositiveIntegerField(default=0, editable=False)
+    # set with the scoring_version bump when a REMATCH_FIELDS field changed:
+    # the stored keyword and similarity scores must be computed again from
+    # the resume texts; cleared once the latest version is scored
+    needs_rematch = models.BooleanField(default=False, editable=False)
+    VERSION_FIELDS = ("content_version", "scoring_version", "scored_version", "needs_rematch")
+
+    # the fields compute_match_score reads
+    SCORING_FIELDS = (
+        "required_skills", "jd_keywords", "min_experience", "max_experience", "keyword_scorer", "description",
+        *WEIGHT_FIELDS,
+    )
+    REMATCH_FIELDS = ("jd_keywords", "keyword_scorer", "description")
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        job = super().from_db(db, field_names, values)
+        job._remember_scoring_fields()
+        return job
+
+    def _remember_scoring_fields(self):
+        # deferred fields are left out rather than loaded
+        self._saved_scoring = {
+            name: copy.deepcopy(self.__dict__[name]) for name in self.SCORING_FIELDS if name in self.__dict__
+        }
+
+    def changed_scoring_fields(self):
+        # a field with no remembered value (instance not loaded from the
+        # database, or deferred and then assigned) counts as changed
+        saved = getattr(self, "_saved_scoring", {})
+        return [
+            name for name in self.SCORING_FIELDS
+            if name in self.__dict__ and (name not in saved or self.__dict__[name] != saved[name])
+        ]
+
+    @property
+    def scoring_status(self):
+        # "rescoring" while applicants still carry scores from older requirements
+        return "rescoring" if self.scored_version < self.scoring_version else "current"
+
+    def bump_versions(self, changed):
+        # One UPDATE increments the versions in the database, so concurrent
+        # edits each get their own version number; it also locks the row
+        # until the save commits. The instance then takes the stored values,
+        # and the save cannot write back a scored_version that a rescore
+        # moved past since this instance was loaded.
+        bumps = {"content_version": models.F("content_version") + 1}
+        if changed:
+            bumps["scoring_version"] = models.F("scoring_version") + 1
+            if set(changed) & set(self.REMATCH_FIELDS):
+                bumps["needs_rematch"] = True
+        Job.objects.filter(pk=self.pk).update(**bumps)
+        self.refresh_from_db(fields=self.VERSION_FIELDS)
+
     def save(self, *args, **kwargs):
         if not self.slug:
             base_slug = slugify(self.title)
@@ -68,7 +151,16 @@ class Job(models.Model):
                 counter += 1
             self.slug = slug
 
-        super().save(*args, **kwargs)
+        changed = []
+        with transaction.atomic():
+            if self.pk and not self._state.adding:
+                changed = self.changed_scoring_fields()
+                self.bump_versions(changed)
+            super().save(*args, **kwargs)
+        self._remember_scoring_fields()
+
+        if changed:
+            scoring_fields_changed.send(sender=Job, job=self, fields=changed)
 
 
     def clean(self):
@@ -80,6 +172,9 @@ class Job(models.Model):
             if self.min_salary > self.max_salary:
                 raise ValidationError("Minimum salary cannot be greater than maximum salary.")
 
+        if sum(getattr(self, name) or 0 for name in self.WEIGHT_FIELDS) != 100:
+            raise ValidationError("Scoring weights must add up to 100.")
+
 
     # DISPLAY
     def get_salary_display(self):
@@ -0,0 +1,7 @@
+from django.dispatch import Signal
+
+# sent by Job.save() after one of Job.SCORING_FIELDS (required_skills,
+# jd_keywords, the experience bounds, keyword_scorer, description, the
+# scoring weights) changed on an existing job; kwargs: job, fields (names
+# changed)
+scoring_fields_changed = Signal()
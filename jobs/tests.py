@@ -5,6 +5,7 @@ from django.test import TestCase
 from django.urls import reverse
 from django.utils import timezone
 
+from applications.profiles import JOB_PROFILES
 from jobs.models import Job
 from users.models import User
 
@@ -68,6 +69,50 @@ class JobWorkflowTests(TestCase):
 
         self.assertEqual(response.status_code, 404)
 
+    def test_edit_bumps_content_version_and_drops_cached_matcher(self):
+        JOB_PROFILES.get(self.existing_job)
+        self.client.force_login(self.recruiter_one)
+
+        response = self.client.post(
+            reverse("recruiter_job_edit", args=[self.existing_job.id]),
+            {
+                "title": "Backend Engineer",
+                "description": "Django backend role",
+                "required_skills": "python",
+                "jd_keywords": "graphql",
+                "salary_type": "negotiable",
+                "location": "Pune",
+                "work_mode": "onsite",
+                "employment_type": "full_time",
+                "vacancies": "1",
+            },
+        )
+        self.existing_job.refresh_from_db()
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(self.existing_job.content_version, 2)
+        self.assertEqual(self.existing_job.jd_keywords, ["graphql"])
+        self.assertNotIn(self.existing_job.pk, JOB_PROFILES._entries)
+
+    def test_concurrent_edits_get_their_own_versions(self):
+        from unittest.mock import patch
+
+        first = Job.objects.get(pk=self.existing_job.pk)
+        second = Job.objects.get(pk=self.existing_job.pk)
+        with patch("applications.background.submit"):
+            first.required_skills = ["python"]
+            first.save()
+            Job.objects.filter(pk=first.pk).update(scored_version=first.scoring_version)
+            second.min_experience = 3
+            second.save()
+
+        self.assertEqual((first.content_version, first.scoring_version), (2, 1))
+        self.assertEqual((second.content_version, second.scoring_version), (3, 2))
+        # the stale instance did not write back the older scored_version
+        self.assertEqual(second.scored_version, 1)
+        self.existing_job.refresh_from_db()
+        self.assertEqual((self.existing_job.scored_version, self.existing_job.scoring_version), (1, 2))
+
     def test_soft_delete_hides_job_from_recruiter_list(self):
         self.client.force_login(self.recruiter_one)
         delete_response = self.client.post(
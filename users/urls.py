@@ -10,7 +10,7 @@ from users.views.admin import (
     invite_page
 )
 from users.views.recruiter import recruiter_dashboard
-from applications.views.recruiter import recruiter_job_applications
+from applications.views.recruiter import recruiter_job_applications, recruiter_job_ranked
 
 urlpatterns = [
 
@@ -38,5 +38,6 @@ urlpatterns = [
 
     # RECRUITER job-specific applications list
     path('recruiter/jobs/<int:job_id>/applications/', recruiter_job_applications, name='recruiter_job_applications'),
+    path('recruiter/jobs/<int:job_id>/ranked/', recruiter_job_ranked, name='recruiter_job_ranked'),
 
 ]